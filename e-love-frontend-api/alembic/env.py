@@ -13,9 +13,11 @@ from core.db.models.intermediate_models.user_categories import user_categories_t
 from core.db.models.intermediate_models.user_genders import user_genders_table
 from core.db.models.intermediate_models.user_roles import user_roles_table
 from core.db.models.posts.user_post import UserPost
+from core.db.models.users.mutual_match import MutualMatch
 from core.db.models.users.user_gender import UserGender
 from core.db.models.users.user_images import UserImages
 from core.db.models.users.user_interaction import UserInteraction
+from core.db.models.users.user_interaction_archive import user_interaction_archive_table
 from core.db.models.users.user_role import UserRole
 from core.db.models.users.user_status import UserStatus
 from core.db.models.users.users import User
@@ -0,0 +1,29 @@
+"""convert-uuid-keys-to-binary
+
+Revision ID: 3c1f7a9d2e45
+Revises: 6f93c00e90e6
+Create Date: 2026-10-19 12:40:03.118204
+
+"""
+from typing import Sequence, Union
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1f7a9d2e45'
+down_revision: Union[str, None] = '6f93c00e90e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Конвертация VARCHAR(36) <-> BINARY(16) вынесена в scripts/db_scripts/convert_uuid_storage.py:
+# формат ключей не должен зависеть от переменной окружения в момент миграции, а смена формата -
+# требовать отката цепочки ревизий. Ревизия оставлена пустой, чтобы не ломать историю
+# уже мигрированных БД.
+
+
+def upgrade() -> None:
+    pass
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,41 @@
+"""add-user-interaction-archive
+
+Revision ID: 5d8a1f3b7e62
+Revises: e91b3d6c0f27
+Create Date: 2026-10-19 17:02:44.918264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d8a1f3b7e62'
+down_revision: Union[str, None] = 'e91b3d6c0f27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _uuid_key_type() -> sa.types.TypeEngine:
+    for column in sa.inspect(op.get_bind()).get_columns('user'):
+        if column['name'] == 'id' and isinstance(column['type'], (sa.BINARY, sa.VARBINARY)):
+            return sa.BINARY(16)
+    return sa.String(length=36)
+
+
+def upgrade() -> None:
+    key_type = _uuid_key_type()
+    op.create_table(
+        'user_interaction_archive',
+        sa.Column('user_id', key_type, nullable=False),
+        sa.Column('target_user_id', key_type, nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'target_user_id'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('user_interaction_archive')
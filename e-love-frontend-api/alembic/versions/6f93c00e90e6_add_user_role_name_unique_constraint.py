@@ -0,0 +1,29 @@
+"""add-user-role-name-unique-constraint
+
+Revision ID: 6f93c00e90e6
+Revises: b2d3f56acb1c
+Create Date: 2026-10-19 10:12:41.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6f93c00e90e6'
+down_revision: Union[str, None] = 'b2d3f56acb1c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Уникальность названий справочников теперь обеспечивается только ограничениями БД
+    # (без SELECT-проверки перед вставкой). user.email, categories.category_name,
+    # user_gender.gender_name и user_status.status_name уже уникальны - не хватало только роли.
+    op.create_unique_constraint('uq_user_role_role_name', 'user_role', ['role_name'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_user_role_role_name', 'user_role', type_='unique')
@@ -0,0 +1,60 @@
+"""add-hot-query-indexes
+
+Revision ID: a7d4e2b91c3f
+Revises: 3c1f7a9d2e45
+Create Date: 2026-10-19 14:05:27.530912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d4e2b91c3f'
+down_revision: Union[str, None] = '3c1f7a9d2e45'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = (
+    # Курсор Paginator: ORDER BY created_at, id и (created_at, id) > курсора
+    ('ix_user_created_at_id', 'user', ['created_at', 'id']),
+    ('ix_user_post_created_at_id', 'user_post', ['created_at', 'id']),
+    ('ix_user_images_created_at_id', 'user_images', ['created_at', 'id']),
+    ('ix_user_interaction_created_at_id', 'user_interaction', ['created_at', 'id']),
+    # Список просмотренных пользователей (покрывающий)
+    ('ix_user_interaction_user_id_target_user_id', 'user_interaction', ['user_id', 'target_user_id']),
+    # Матчинг: category_id IN (...) GROUP BY user_id
+    ('ix_user_categories_category_id_user_id', 'user_categories', ['category_id', 'user_id']),
+    # Посты/фото пользователя
+    ('ix_user_post_user_id', 'user_post', ['user_id']),
+    ('ix_user_images_user_id_created_at_id', 'user_images', ['user_id', 'created_at', 'id']),
+)
+
+# MySQL удаляет автоматический индекс внешнего ключа, если появился другой подходящий индекс.
+# Перед удалением наших индексов FK-колонкам возвращаются одиночные индексы, иначе DROP INDEX
+# упадёт с "needed in a foreign key constraint".
+FOREIGN_KEY_INDEXES = (
+    ('ix_user_interaction_user_id', 'user_interaction', ['user_id']),
+    ('ix_user_categories_category_id', 'user_categories', ['category_id']),
+    ('ix_user_images_user_id', 'user_images', ['user_id']),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'mysql':
+        for name, table, columns in FOREIGN_KEY_INDEXES:
+            op.create_index(name, table, columns)
+
+    for name, table, _ in reversed(INDEXES):
+        if name == 'ix_user_post_user_id' and op.get_bind().dialect.name == 'mysql':
+            # Сам по себе и есть индекс внешнего ключа user_post.user_id - оставляем
+            continue
+        op.drop_index(name, table_name=table)
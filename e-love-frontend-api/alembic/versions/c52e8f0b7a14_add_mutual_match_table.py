@@ -0,0 +1,73 @@
+"""add-mutual-match-table
+
+Revision ID: c52e8f0b7a14
+Revises: a7d4e2b91c3f
+Create Date: 2026-10-19 15:31:48.672093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c52e8f0b7a14'
+down_revision: Union[str, None] = 'a7d4e2b91c3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _uuid_key_is_binary() -> bool:
+    # Тип ключей должен совпадать с user.id (VARCHAR(36) или BINARY(16), см. 3c1f7a9d2e45)
+    for column in sa.inspect(op.get_bind()).get_columns('user'):
+        if column['name'] == 'id':
+            return isinstance(column['type'], (sa.BINARY, sa.VARBINARY))
+    return False
+
+
+def upgrade() -> None:
+    binary = _uuid_key_is_binary()
+    key_type = sa.BINARY(16) if binary else sa.String(length=36)
+
+    op.create_table(
+        'mutual_match',
+        sa.Column('id', key_type, nullable=False),
+        sa.Column('user_id', key_type, nullable=False),
+        sa.Column('matched_user_id', key_type, nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['matched_user_id'], ['user.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('id'),
+        sa.UniqueConstraint('user_id', 'matched_user_id', name='uq_mutual_match_user_id_matched'),
+    )
+    op.create_index(
+        'ix_mutual_match_user_id_created_at_id', 'mutual_match', ['user_id', 'created_at', 'id']
+    )
+
+    if op.get_bind().dialect.name != 'mysql':
+        return
+
+    # Разовое заполнение из уже существующих встречных MATCH (self-join только здесь).
+    # Обе стороны пары попадают сами: (A, B) и (B, A) - это две строки join-а
+    new_id = "UNHEX(REPLACE(UUID(), '-', ''))" if binary else 'UUID()'
+    op.execute(
+        f"""
+        INSERT IGNORE INTO mutual_match (id, user_id, matched_user_id, created_at)
+        SELECT {new_id}, a.user_id, a.target_user_id, MAX(GREATEST(a.created_at, b.created_at))
+        FROM user_interaction a
+        JOIN user_interaction b
+            ON b.user_id = a.target_user_id AND b.target_user_id = a.user_id
+        WHERE a.interaction_type = 'MATCH'
+          AND b.interaction_type = 'MATCH'
+          AND a.user_id <> a.target_user_id
+        GROUP BY a.user_id, a.target_user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_mutual_match_user_id_created_at_id', table_name='mutual_match')
+    op.drop_table('mutual_match')
@@ -0,0 +1,85 @@
+"""unique-user-interaction-pair
+
+Revision ID: e91b3d6c0f27
+Revises: c52e8f0b7a14
+Create Date: 2026-10-19 16:12:05.184377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e91b3d6c0f27'
+down_revision: Union[str, None] = 'c52e8f0b7a14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Из дублей пары (user_id, target_user_id) остаётся последний свайп (created_at, id)
+    if op.get_bind().dialect.name == 'mysql':
+        op.execute(
+            """
+            DELETE older
+            FROM user_interaction older
+            JOIN user_interaction newer
+                ON newer.user_id = older.user_id
+               AND newer.target_user_id = older.target_user_id
+               AND (newer.created_at > older.created_at
+                    OR (newer.created_at = older.created_at AND newer.id > older.id))
+            """
+        )
+        # Последним свайпом дубля мог оказаться REJECT - такие пары больше не взаимные
+        op.execute(
+            """
+            DELETE m
+            FROM mutual_match m
+            LEFT JOIN user_interaction sent
+                ON sent.user_id = m.user_id
+               AND sent.target_user_id = m.matched_user_id
+               AND sent.interaction_type = 'MATCH'
+            LEFT JOIN user_interaction received
+                ON received.user_id = m.matched_user_id
+               AND received.target_user_id = m.user_id
+               AND received.interaction_type = 'MATCH'
+            WHERE sent.id IS NULL OR received.id IS NULL
+            """
+        )
+    else:
+        op.execute(
+            """
+            DELETE FROM user_interaction
+            WHERE EXISTS (
+                SELECT 1 FROM user_interaction newer
+                WHERE newer.user_id = user_interaction.user_id
+                  AND newer.target_user_id = user_interaction.target_user_id
+                  AND (newer.created_at > user_interaction.created_at
+                       OR (newer.created_at = user_interaction.created_at
+                           AND newer.id > user_interaction.id))
+            )
+            """
+        )
+
+    # Уникальный индекс создаётся раньше, чем удаляется старый: на MySQL он же
+    # становится индексом внешнего ключа user_id
+    op.create_unique_constraint(
+        'uq_user_interaction_user_id_target_user_id',
+        'user_interaction',
+        ['user_id', 'target_user_id'],
+    )
+    op.drop_index('ix_user_interaction_user_id_target_user_id', table_name='user_interaction')
+
+
+def downgrade() -> None:
+    # Удалённые дубли не восстанавливаются
+    op.create_index(
+        'ix_user_interaction_user_id_target_user_id',
+        'user_interaction',
+        ['user_id', 'target_user_id'],
+    )
+    op.drop_constraint(
+        'uq_user_interaction_user_id_target_user_id', 'user_interaction', type_='unique'
+    )
@@ -3,6 +3,8 @@ from uuid import UUID
 
 import aiohttp
 
+from utils.chat.conversation_cache import ConversationCache, conversation_cache
+
 
 # TODO: provide try-catch blocks here
 class ChatMicroserviceClient:
@@ -10,15 +12,22 @@ class ChatMicroserviceClient:
     A client to interact with the Chat Microservice via REST endpoints.
     """
 
-    def __init__(self, base_url: str, session: Optional[aiohttp.ClientSession] = None):
+    def __init__(
+        self,
+        base_url: str,
+        session: Optional[aiohttp.ClientSession] = None,
+        cache: Optional[ConversationCache] = None,
+    ):
         """
         Initialize ChatMicroserviceClient with a base URL.
 
         :param base_url: The root URL of ChatMicroservice (e.g. "http://chat-service-api:8081/v1")
         :param session: Optionally pass an existing aiohttp.ClientSession.
+        :param cache: Optionally pass a ConversationCache (the shared one is used by default).
         """
         self.base_url = base_url.rstrip("/")
         self._session = session
+        self._cache = cache if cache is not None else conversation_cache
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """
@@ -47,15 +56,22 @@ class ChatMicroserviceClient:
 
     async def get_conversation(self, conversation_id: UUID) -> Dict[str, Any]:
         """
-        Fetch a conversation by its ID.
+        Fetch a conversation by its ID (read-through cached).
         """
+        cached = self._cache.get_conversation(conversation_id)
+        if cached is not None:
+            return cached
+
         url = f"{self.base_url}/conversations/{conversation_id}"
         session = await self._get_session()
         async with session.get(url) as resp:
             if resp.status != 200:
                 text = await resp.text()
                 raise Exception(f"Failed to get conversation: {resp.status} {text}")
-            return await resp.json()
+            conversation = await resp.json()
+
+        self._cache.set_conversation(conversation_id, conversation)
+        return conversation
 
     async def delete_conversation(self, conversation_id: UUID) -> Dict[str, Any]:
         """
@@ -67,6 +83,7 @@ class ChatMicroserviceClient:
             if resp.status not in [200, 204]:
                 text = await resp.text()
                 raise Exception(f"Failed to delete conversation: {resp.status} {text}")
+            self._cache.invalidate_conversation(conversation_id)
             if resp.status == 200:
                 return await resp.json()
             return {}
@@ -89,6 +106,7 @@ class ChatMicroserviceClient:
             if resp.status not in (200, 201):
                 text = await resp.text()
                 raise Exception(f"Failed to create message: {resp.status} {text}")
+            self._cache.invalidate_messages(conversation_id)
             return await resp.json()
 
     async def update_message(self, message_id: UUID, status: str) -> Dict[str, Any]:
@@ -102,6 +120,7 @@ class ChatMicroserviceClient:
             if resp.status != 200:
                 text = await resp.text()
                 raise Exception(f"Failed to update message: {resp.status} {text}")
+            self._cache.invalidate_message(message_id)
             return await resp.json()
 
     async def delete_message(self, message_id: UUID) -> None:
@@ -114,16 +133,25 @@ class ChatMicroserviceClient:
             if resp.status not in (200, 204):
                 text = await resp.text()
                 raise Exception(f"Failed to delete message: {resp.status} {text}")
+            self._cache.invalidate_message(message_id)
 
     async def get_conversation_messages(self, conversation_id: UUID) -> List[Dict[str, Any]]:
         """
         Retrieve the list of messages for the specified conversation.
         Returns a list of message objects as dictionaries.
+        The latest page is read-through cached until a new message/delete is relayed.
         """
+        cached = self._cache.get_messages(conversation_id)
+        if cached is not None:
+            return cached
+
         url = f"{self.base_url}/messages/{conversation_id}"
         session = await self._get_session()
         async with session.get(url) as resp:
             if resp.status != 200:
                 text = await resp.text()
                 raise Exception(f"Failed to get messages: {resp.status} {text}")
-            return await resp.json()
+            messages = await resp.json()
+
+        self._cache.set_messages(conversation_id, messages)
+        return messages
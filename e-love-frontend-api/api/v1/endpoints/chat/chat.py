@@ -10,6 +10,7 @@ from auth.security import authenticator
 from configuration.database import get_db_session
 from core.schemas.chat.conversation.conversation_schema import ConversationBase
 from utils.chat.connect_to_chat_service import connect_to_chat_service
+from utils.chat.conversation_cache import conversation_cache
 from utils.chat.listen_chat_service import listen_chat_service
 
 router = APIRouter()
@@ -63,12 +64,16 @@ async def websocket_chat_endpoint(
 
     chat_service_ws = await connect_to_chat_service(str(conversation_id))
 
-    asyncio.create_task(listen_chat_service(chat_service_ws, websocket))
+    asyncio.create_task(
+        listen_chat_service(chat_service_ws, websocket, conversation_id=str(conversation_id))
+    )
 
     try:
         while True:
             client_msg = await websocket.receive_json()
             await chat_service_ws.send_json(client_msg)
+            # Любое сообщение (новое/удаление) меняет последнюю страницу сообщений
+            conversation_cache.invalidate_messages(conversation_id)
     except WebSocketDisconnect:
         pass
     except Exception as e:
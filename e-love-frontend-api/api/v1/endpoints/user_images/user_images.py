@@ -6,8 +6,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from auth.security import Authenticator, authenticator
 from configuration.database import get_db_session
+from core.schemas.bulk.bulk_schema import BulkDeleteRequest, BulkDeleteResponse
 from core.schemas.errors.httperror import HTTPError
 from core.schemas.user_images.user_images_schema import (
+    UserImagesBulkCreate,
+    UserImagesBulkUpdate,
     UserImagesCreate,
     UserImagesListResponse,
     UserImagesOutput,
@@ -55,6 +58,111 @@ async def create_image(
     return await user_image_service.create_image(data_dict)
 
 
+@router.post(
+    "/bulk",
+    response_model=List[UserImagesOutput],
+    responses={
+        200: {
+            "description": "Create several user images in one request.",
+            "model": List[UserImagesOutput],
+        },
+        500: {
+            "description": "Server error.",
+            "model": HTTPError,
+        },
+    },
+    tags=["User image", "Create user images", "Bulk"],
+    dependencies=[
+        Depends(get_db_session),
+        Depends(authenticator.authenticate),
+    ],
+)
+async def create_images_bulk(
+    images_data: UserImagesBulkCreate,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Create several user images with a single INSERT.
+
+    - **items**: user images to create (up to 1000)
+    """
+    user_image_service = UserImageService(db)
+    return await user_image_service.create_images(images_data.items)
+
+
+@router.put(
+    "/bulk",
+    response_model=List[UserImagesOutput],
+    responses={
+        200: {
+            "description": "Update several user images in one request.",
+            "model": List[UserImagesOutput],
+        },
+        404: {
+            "description": "Some of the user images were not found.",
+            "model": HTTPError,
+        },
+        500: {
+            "description": "Server error.",
+            "model": HTTPError,
+        },
+    },
+    tags=["User image", "Update user images", "Bulk"],
+    dependencies=[
+        Depends(get_db_session),
+        Depends(authenticator.authenticate),
+    ],
+)
+async def update_images_bulk(
+    images_data: UserImagesBulkUpdate,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Update several user images with a single UPDATE.
+
+    - **items**: updates, each with the **id** of the image
+    """
+    user_image_service = UserImageService(db)
+    return await user_image_service.update_images(images_data.items)
+
+
+@router.delete(
+    "/bulk",
+    response_model=BulkDeleteResponse,
+    responses={
+        200: {
+            "description": "Delete several user images in one request.",
+            "model": BulkDeleteResponse,
+        },
+        404: {
+            "description": "Some of the user images were not found.",
+            "model": HTTPError,
+        },
+        500: {
+            "description": "Server error.",
+            "model": HTTPError,
+        },
+    },
+    tags=["User image", "Delete user images", "Bulk"],
+    dependencies=[
+        Depends(get_db_session),
+        Depends(authenticator.authenticate),
+    ],
+)
+async def delete_images_bulk(
+    delete_request: BulkDeleteRequest,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Delete several user images with a single DELETE.
+
+    - **ids**: UUIDs of the user images
+    """
+    user_image_service = UserImageService(db)
+    deleted = await user_image_service.delete_images(delete_request.ids)
+    return BulkDeleteResponse(deleted=deleted)
+
+
 @router.get(
     "/{image_id}",
     response_model=UserImagesOutput,
@@ -111,11 +219,14 @@ async def get_image_by_id(
 async def get_images_list(
     limit: int = 10,
     next_token: Optional[str] = None,
+    prev_token: Optional[str] = None,
     db: AsyncSession = Depends(get_db_session),
 ):
 
     user_image_service = UserImageService(db)
-    return await user_image_service.get_images_list(limit=limit, next_token=next_token)
+    return await user_image_service.get_images_list(
+        limit=limit, next_token=next_token, prev_token=prev_token
+    )
 
 
 @router.get(
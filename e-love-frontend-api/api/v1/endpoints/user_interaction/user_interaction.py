@@ -1,6 +1,6 @@
 # api/v1/endpoints/user_interaction/user_interaction.py
 
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends
@@ -8,13 +8,20 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from auth.security import authenticator
 from configuration.database import get_db_session
+from core.schemas.bulk.bulk_schema import BulkDeleteRequest, BulkDeleteResponse
 from core.schemas.errors.httperror import HTTPError
+from core.schemas.mutual_match.mutual_match_schema import MutualMatchesListResponse
 from core.schemas.user_interaction.user_interaction_schema import (
+    SwipesBulkCreate,
+    SwipesBulkResponse,
     UserInteractionCreate,
     UserInteractionOutput,
+    UserInteractionsBulkCreate,
+    UserInteractionsBulkUpdate,
     UserInteractionsListResponse,
     UserInteractionUpdate,
 )
+from core.services.mutual_match.mutual_match import MutualMatchService
 from core.services.user_interaction.user_interaction import UserInteractionService
 from dependencies.validate_query_params import validate_query_params
 
@@ -54,6 +61,184 @@ async def create_user_interaction(
     return await user_interaction_service.create_user_interaction(user_interaction)
 
 
+@router.post(
+    "/bulk",
+    response_model=List[UserInteractionOutput],
+    responses={
+        200: {
+            "description": "Create several user interactions in one request.",
+            "model": List[UserInteractionOutput],
+        },
+        500: {
+            "description": "Server error.",
+            "model": HTTPError,
+        },
+    },
+    tags=["Users", "User Interaction", "Create user interactions", "Bulk"],
+    dependencies=[
+        Depends(authenticator.authenticate),
+    ],
+)
+async def create_user_interactions_bulk(
+    user_interactions_data: UserInteractionsBulkCreate,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Create several user interactions with a single INSERT.
+
+    - **items**: user interactions to create (up to 1000)
+    """
+    user_interaction_service = UserInteractionService(db)
+    return await user_interaction_service.create_user_interactions(user_interactions_data.items)
+
+
+@router.put(
+    "/bulk",
+    response_model=List[UserInteractionOutput],
+    responses={
+        200: {
+            "description": "Update several user interactions in one request.",
+            "model": List[UserInteractionOutput],
+        },
+        404: {
+            "description": "Some of the user interactions were not found.",
+            "model": HTTPError,
+        },
+        500: {
+            "description": "Server error.",
+            "model": HTTPError,
+        },
+    },
+    tags=["Users", "User Interaction", "Update user interactions", "Bulk"],
+    dependencies=[
+        Depends(authenticator.authenticate),
+    ],
+)
+async def update_user_interactions_bulk(
+    user_interactions_data: UserInteractionsBulkUpdate,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Update several user interactions with a single UPDATE.
+
+    - **items**: updates, each with the **id** of the interaction
+    """
+    user_interaction_service = UserInteractionService(db)
+    return await user_interaction_service.update_user_interactions(user_interactions_data.items)
+
+
+@router.delete(
+    "/bulk",
+    response_model=BulkDeleteResponse,
+    responses={
+        200: {
+            "description": "Delete several user interactions in one request.",
+            "model": BulkDeleteResponse,
+        },
+        404: {
+            "description": "Some of the user interactions were not found.",
+            "model": HTTPError,
+        },
+        500: {
+            "description": "Server error.",
+            "model": HTTPError,
+        },
+    },
+    tags=["Users", "User Interaction", "Delete user interactions", "Bulk"],
+    dependencies=[
+        Depends(authenticator.authenticate),
+    ],
+)
+async def delete_user_interactions_bulk(
+    delete_request: BulkDeleteRequest,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Delete several user interactions with a single DELETE.
+
+    - **ids**: UUIDs of the user interactions
+    """
+    user_interaction_service = UserInteractionService(db)
+    deleted = await user_interaction_service.delete_user_interactions(delete_request.ids)
+    return BulkDeleteResponse(deleted=deleted)
+
+
+@router.post(
+    "/swipes",
+    response_model=SwipesBulkResponse,
+    responses={
+        200: {
+            "description": "Submit a batch of swipes of the current user. Returns per-swipe results.",
+            "model": SwipesBulkResponse,
+        },
+        404: {
+            "description": "Current user not found.",
+            "model": HTTPError,
+        },
+        500: {
+            "description": "Server error.",
+            "model": HTTPError,
+        },
+    },
+    tags=["Users", "User Interaction", "Swipes", "Bulk"],
+    dependencies=[
+        Depends(authenticator.authenticate),
+    ],
+)
+async def submit_swipes(
+    swipes_data: SwipesBulkCreate,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Submit several swipes of the current user at once (e.g. made offline).
+
+    Already swiped, repeated, self and unknown targets are reported per item instead of failing the batch.
+
+    - **user_id**: UUID of the current user
+    - **items**: swipes (**target_user_id**, **interaction_type**), up to 1000
+    """
+    user_interaction_service = UserInteractionService(db)
+    return await user_interaction_service.submit_swipes(swipes_data.user_id, swipes_data.items)
+
+
+@router.get(
+    "/matches",
+    response_model=MutualMatchesListResponse,
+    responses={
+        200: {
+            "description": "Get mutual matches of the user. Support pagination",
+            "model": MutualMatchesListResponse,
+        },
+        500: {
+            "description": "Server error.",
+            "model": HTTPError,
+        },
+    },
+    tags=["Users", "Interactions", "Mutual matches", "List"],
+    dependencies=[
+        Depends(authenticator.authenticate),
+        validate_query_params(expected_params={"user_id", "limit", "next_token"}),
+    ],
+)
+async def get_user_matches(
+    user_id: UUID,
+    limit: int = 10,
+    next_token: Optional[str] = None,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Get users that mutually matched with the user, newest matches first.
+
+    - **user_id**: UUID of the current user
+    - **limit**: Number of matches per page
+    - **next_token**: Token to the next page
+    """
+    mutual_match_service = MutualMatchService(db)
+    return await mutual_match_service.get_user_matches(
+        user_id=user_id, limit=limit, next_token=next_token
+    )
+
+
 @router.get(
     "/{interaction_id}",
     response_model=UserInteractionOutput,
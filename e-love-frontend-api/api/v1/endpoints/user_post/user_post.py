@@ -6,18 +6,20 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from auth.security import Authenticator, authenticator
 from configuration.database import get_db_session
+from core.schemas.bulk.bulk_schema import BulkDeleteRequest, BulkDeleteResponse
 from core.schemas.errors.httperror import HTTPError
 from core.schemas.posts.user_post_schema import (
     PostCreate,
     PostOutput,
+    PostsBulkCreate,
+    PostsBulkUpdate,
     PostsListResponse,
     PostUpdate,
 )
 from core.services.user_post.user_post import UserPostService
+from utils.routing.fast_json_route import FastJSONRoute
 
-router = APIRouter(
-    prefix="/user-post",
-)
+router = APIRouter(prefix="/user-post", route_class=FastJSONRoute)
 
 
 @router.post(
@@ -53,6 +55,111 @@ async def create_post(
     return await user_post_service.create_post(user_post_data.dict())
 
 
+@router.post(
+    "/bulk",
+    response_model=List[PostOutput],
+    responses={
+        200: {
+            "description": "Create several user posts in one request.",
+            "model": List[PostOutput],
+        },
+        500: {
+            "description": "Server error.",
+            "model": HTTPError,
+        },
+    },
+    tags=["User post", "Create user posts", "Bulk"],
+    dependencies=[
+        Depends(get_db_session),
+        Depends(authenticator.authenticate),
+    ],
+)
+async def create_posts_bulk(
+    posts_data: PostsBulkCreate,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Create several user posts with a single INSERT.
+
+    - **items**: user posts to create (up to 1000)
+    """
+    user_post_service = UserPostService(db)
+    return await user_post_service.create_posts(posts_data.items)
+
+
+@router.put(
+    "/bulk",
+    response_model=List[PostOutput],
+    responses={
+        200: {
+            "description": "Update several user posts in one request.",
+            "model": List[PostOutput],
+        },
+        404: {
+            "description": "Some of the user posts were not found.",
+            "model": HTTPError,
+        },
+        500: {
+            "description": "Server error.",
+            "model": HTTPError,
+        },
+    },
+    tags=["User post", "Update user posts", "Bulk"],
+    dependencies=[
+        Depends(get_db_session),
+        Depends(authenticator.authenticate),
+    ],
+)
+async def update_posts_bulk(
+    posts_data: PostsBulkUpdate,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Update several user posts with a single UPDATE.
+
+    - **items**: updates, each with the **id** of the post
+    """
+    user_post_service = UserPostService(db)
+    return await user_post_service.update_posts(posts_data.items)
+
+
+@router.delete(
+    "/bulk",
+    response_model=BulkDeleteResponse,
+    responses={
+        200: {
+            "description": "Delete several user posts in one request.",
+            "model": BulkDeleteResponse,
+        },
+        404: {
+            "description": "Some of the user posts were not found.",
+            "model": HTTPError,
+        },
+        500: {
+            "description": "Server error.",
+            "model": HTTPError,
+        },
+    },
+    tags=["User post", "Delete user posts", "Bulk"],
+    dependencies=[
+        Depends(get_db_session),
+        Depends(authenticator.authenticate),
+    ],
+)
+async def delete_posts_bulk(
+    delete_request: BulkDeleteRequest,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Delete several user posts with a single DELETE.
+
+    - **ids**: UUIDs of the user posts
+    """
+    user_post_service = UserPostService(db)
+    deleted = await user_post_service.delete_posts(delete_request.ids)
+    return BulkDeleteResponse(deleted=deleted)
+
+
 @router.get(
     "/{post_id}",
     response_model=PostOutput,
@@ -104,10 +211,13 @@ async def get_post_by_id(
 async def get_post_list(
     limit: int = 10,
     next_token: Optional[str] = None,
+    prev_token: Optional[str] = None,
     db: AsyncSession = Depends(get_db_session),
 ):
     user_post_service = UserPostService(db)
-    return await user_post_service.get_post_list(limit=limit, next_token=next_token)
+    return await user_post_service.get_post_list(
+        limit=limit, next_token=next_token, prev_token=prev_token
+    )
 
 
 @router.put(
@@ -1,21 +1,32 @@
 # api/v1/endpoints/users/users.py
 
-from typing import Optional
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from auth.security import authenticator
-from configuration.database import get_db_session
+from configuration.database import get_db_session, session_router, session_scope
+from core.schemas.bulk.bulk_schema import BulkDeleteRequest, BulkDeleteResponse
 from core.schemas.errors.httperror import HTTPError
-from core.schemas.users.user_schema import UserCreate, UserOutput, UsersListResponse, UserUpdate
+from core.schemas.users.user_schema import (
+    UserCreate,
+    UserOutput,
+    UsersBulkCreate,
+    UsersBulkUpdate,
+    UsersListResponse,
+    UserUpdate,
+)
 from core.services.users.users import UserService
 from dependencies.validate_query_params import validate_query_params
+from utils.routing.fast_json_route import FastJSONRoute
 
-router = APIRouter(
-    prefix="/users",
-)
+router = APIRouter(prefix="/users", route_class=FastJSONRoute)
+
+user_output_adapter = TypeAdapter(UserOutput)
 
 
 @router.post(
@@ -53,6 +64,157 @@ async def create_user(
     return await user_service.create_user(user)
 
 
+# Bulk-маршруты объявлены до "/{id}", иначе "/bulk" совпадёт с параметром пути
+@router.post(
+    "/bulk",
+    response_model=List[UserOutput],
+    responses={
+        200: {
+            "description": "Create several users in one request.",
+            "model": List[UserOutput],
+        },
+        500: {
+            "description": "Server error.",
+            "model": HTTPError,
+        },
+    },
+    tags=["Users", "Create users", "Bulk"],
+    dependencies=[
+        Depends(authenticator.authenticate),
+        Depends(authenticator.require_role("Admin")),
+    ],
+)
+async def create_users_bulk(
+    users_data: UsersBulkCreate,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Create several users with a single INSERT.
+
+    - **items**: users to create (up to 1000)
+    """
+    user_service = UserService(db)
+    return await user_service.create_users(users_data.items)
+
+
+@router.put(
+    "/bulk",
+    response_model=List[UserOutput],
+    responses={
+        200: {
+            "description": "Update several users in one request.",
+            "model": List[UserOutput],
+        },
+        404: {
+            "description": "Some of the users were not found.",
+            "model": HTTPError,
+        },
+        500: {
+            "description": "Server error.",
+            "model": HTTPError,
+        },
+    },
+    tags=["Users", "Update users", "Bulk"],
+    dependencies=[
+        Depends(authenticator.authenticate),
+        Depends(authenticator.require_role("Admin")),
+    ],
+)
+async def update_users_bulk(
+    users_data: UsersBulkUpdate,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Update several users with a single UPDATE.
+
+    - **items**: updates, each with the **id** of the user
+    """
+    user_service = UserService(db)
+    return await user_service.update_users(users_data.items)
+
+
+@router.delete(
+    "/bulk",
+    response_model=BulkDeleteResponse,
+    responses={
+        200: {
+            "description": "Delete several users in one request.",
+            "model": BulkDeleteResponse,
+        },
+        404: {
+            "description": "Some of the users were not found.",
+            "model": HTTPError,
+        },
+        500: {
+            "description": "Server error.",
+            "model": HTTPError,
+        },
+    },
+    tags=["Users", "Delete users", "Bulk"],
+    dependencies=[
+        Depends(authenticator.authenticate),
+        Depends(authenticator.require_role("Admin")),
+    ],
+)
+async def delete_users_bulk(
+    delete_request: BulkDeleteRequest,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Delete several users with a single DELETE.
+
+    - **ids**: UUIDs of the users
+    """
+    user_service = UserService(db)
+    deleted = await user_service.delete_users(delete_request.ids)
+    return BulkDeleteResponse(deleted=deleted)
+
+
+async def _users_ndjson(batch_size: int) -> AsyncIterator[bytes]:
+    # Своя сессия: сессия из Depends(get_db_session) закрывается до того, как ответ дочитан
+    session_factory = session_router.get_session_factory(read_only=True)
+    async with session_scope(session_factory) as session:
+        async for batch in UserService(session).stream_users(batch_size=batch_size):
+            yield b"".join(
+                user_output_adapter.dump_json(user_output_adapter.validate_python(user)) + b"\n"
+                for user in batch
+            )
+
+
+# Объявлен до "/{user_id}", иначе "/harbor" совпадёт с параметром пути
+@router.get(
+    "/harbor",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "All users as NDJSON: one UserOutput per line "
+            "(line-delimited form of UsersHarborListResponse).",
+            "content": {"application/x-ndjson": {}},
+        },
+        500: {
+            "description": "Server error.",
+            "model": HTTPError,
+        },
+    },
+    tags=["Users", "Get user list", "List"],
+    dependencies=[
+        Depends(authenticator.authenticate),
+        Depends(authenticator.require_role("Admin")),
+        validate_query_params(expected_params={"batch_size"}),
+    ],
+)
+async def stream_users_harbor(batch_size: int = Query(500, ge=1, le=5_000)):
+    """
+    Stream all users for export to other microservices (NDJSON).
+
+    Users are read with a server-side cursor in batches, so memory use does not grow
+    with the number of users.
+
+    - **batch_size**: Number of users fetched from the database per batch
+    """
+    return StreamingResponse(_users_ndjson(batch_size), media_type="application/x-ndjson")
+
+
 @router.get(
     "/{user_id}",
     response_model=UserOutput,
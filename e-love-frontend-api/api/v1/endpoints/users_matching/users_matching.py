@@ -21,8 +21,9 @@ from core.services.users_matching.users_matching_service import UsersMatchingSer
 from dependencies.validate_query_params import validate_query_params
 from utils.custom_pagination import Paginator
 from utils.enums.matching_type import MatchingType
+from utils.routing.fast_json_route import FastJSONRoute
 
-router = APIRouter(prefix="/users-matching")
+router = APIRouter(prefix="/users-matching", route_class=FastJSONRoute)
 
 
 @router.get(
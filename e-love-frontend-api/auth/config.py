@@ -1,5 +1,6 @@
 # auth.py
 import os
+from typing import Optional
 
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings
@@ -16,6 +17,18 @@ class AuthSettings(BaseSettings):
     auth0_client_secret: str
     auth0_domain: str
 
+    # JWKS: по умолчанию https://<auth0_domain>/.well-known/jwks.json,
+    # auth0_jwks_path - локальный jwks.json (тесты / локальная разработка)
+    auth0_jwks_url: Optional[str] = None
+    auth0_jwks_path: Optional[str] = None
+    jwks_cache_ttl: float = 3600.0
+    jwks_min_refresh_interval: float = 60.0
+
+    # Кэш уже проверенных токенов (sha256(token) -> claims до exp)
+    verified_token_cache_size: int = 4096
+    verified_token_cache_max_ttl: float = 300.0
+    jwt_verify_in_thread: bool = False
+
     class Config:
         env_file = os.getenv("APP_AUTH_ENV_PATH")
         extra = "ignore"
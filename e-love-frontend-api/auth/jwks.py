@@ -0,0 +1,170 @@
+# app/auth/jwks.py
+
+import asyncio
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import aiohttp
+from jose import jwk
+from jose.backends.base import Key
+
+logger = logging.getLogger(__name__)
+
+
+class JWKSProvider:
+    """
+    Асинхронный провайдер JWKS (набора публичных ключей auth0-tenant).
+
+    - Ключи хранятся в in-memory индексе kid -> уже сконструированный объект ключа
+      (jwk.construct выполняется один раз при обновлении, а не на каждый запрос);
+    - Индекс обновляется в фоне каждые `ttl` секунд;
+    - При неизвестном kid набор ключей перезапрашивается по требованию,
+      но не чаще, чем раз в `min_refresh_interval` секунд (защита от флуда невалидными токенами);
+      интервал отсчитывается от любой попытки, в том числе неудачной, поэтому ни холодный старт,
+      ни недоступность auth0 не превращаются в поток запросов к JWKS;
+    - Источник ключей - URL (auth0) или локальный JSON-файл (для тестов / локальной разработки).
+
+    Старт приложения не блокируется сетью: первичная загрузка выполняется в фоновой задаче,
+    а первый запрос с токеном просто дождётся её завершения.
+    """
+
+    def __init__(
+        self,
+        jwks_url: Optional[str] = None,
+        jwks_path: Optional[str] = None,
+        ttl: float = 3600.0,
+        min_refresh_interval: float = 60.0,
+        request_timeout: float = 5.0,
+    ):
+        """
+        :param jwks_url: Ссылка на jwks.json (например, https://<domain>/.well-known/jwks.json).
+        :param jwks_path: Путь к локальному jwks.json. Имеет приоритет над jwks_url.
+        :param ttl: Период фонового обновления ключей в секундах.
+        :param min_refresh_interval: Минимальный интервал между обновлениями по требованию (неизвестный kid).
+        :param request_timeout: Таймаут HTTP-запроса к jwks_url в секундах.
+        """
+        if not jwks_url and not jwks_path:
+            raise ValueError("Either jwks_url or jwks_path must be provided for JWKSProvider.")
+
+        self.jwks_url = jwks_url
+        self.jwks_path = jwks_path
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+        self.request_timeout = request_timeout
+
+        self._keys: Dict[str, Key] = {}
+        # Время последней попытки загрузки (успешной или нет), None - попыток ещё не было
+        self._last_attempt: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def keys(self) -> Dict[str, Key]:
+        """Текущий индекс kid -> ключ."""
+        return self._keys
+
+    async def _fetch_jwks(self) -> Dict[str, Any]:
+        """
+        Загружает JWKS из локального файла или по сети.
+        """
+        if self.jwks_path:
+            raw = await asyncio.to_thread(Path(self.jwks_path).read_text, encoding="utf-8")
+            return json.loads(raw)
+
+        timeout = aiohttp.ClientTimeout(total=self.request_timeout)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with session.get(self.jwks_url) as response:
+                response.raise_for_status()
+                return await response.json(content_type=None)
+
+    def _build_index(self, jwks: Dict[str, Any]) -> Dict[str, Key]:
+        """
+        Строит индекс kid -> сконструированный ключ из ответа JWKS.
+        Ключи, которые не удалось сконструировать, пропускаются.
+        """
+        index: Dict[str, Key] = {}
+        for key_data in jwks.get("keys", []):
+            kid = key_data.get("kid")
+            if kid is None:
+                continue
+            try:
+                index[kid] = jwk.construct(key_data, algorithm=key_data.get("alg", "RS256"))
+            except Exception as e:
+                logger.error(f"Skipping JWK with kid={kid}: {e}")
+        return index
+
+    async def refresh(self, force: bool = False) -> bool:
+        """
+        Обновляет индекс ключей.
+
+        :param force: Если False - обновление пропускается, если с прошлой попытки прошло
+            меньше min_refresh_interval. Проверка выполняется под блокировкой, поэтому запросы,
+            дождавшиеся чужой загрузки, повторно JWKS не запрашивают.
+        :return: True, если индекс был обновлён.
+        """
+        async with self._lock:
+            if (
+                not force
+                and self._last_attempt is not None
+                and time.monotonic() - self._last_attempt < self.min_refresh_interval
+            ):
+                return False
+
+            # Попытка фиксируется до загрузки: неудачная тоже ограничивает частоту
+            self._last_attempt = time.monotonic()
+            jwks = await self._fetch_jwks()
+            self._keys = self._build_index(jwks)
+            logger.info(f"JWKS refreshed, {len(self._keys)} key(s) loaded.")
+            return True
+
+    async def get_key(self, kid: str) -> Optional[Key]:
+        """
+        Возвращает ключ по kid. При промахе делает (ограниченное по частоте) обновление JWKS.
+
+        :param kid: Идентификатор ключа из заголовка JWT.
+        :return: Ключ или None, если ключ так и не найден.
+        """
+        key = self._keys.get(kid)
+        if key is not None:
+            return key
+
+        try:
+            # До первой попытки загрузки ограничения нет, дальше - не чаще min_refresh_interval
+            await self.refresh()
+        except Exception as e:
+            logger.error(f"Failed to refresh JWKS: {e}")
+
+        return self._keys.get(kid)
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                await self.refresh(force=True)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Background JWKS refresh failed: {e}")
+            # Пока ключей нет (auth0 недоступен на старте), повторяем чаще, чем раз в ttl
+            await asyncio.sleep(self.ttl if self._keys else self.min_refresh_interval)
+
+    def start(self) -> None:
+        """
+        Запускает фоновое обновление ключей (неблокирующе). Вызывать в startup-событии приложения.
+        """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        """
+        Останавливает фоновое обновление ключей. Вызывать в shutdown-событии приложения.
+        """
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
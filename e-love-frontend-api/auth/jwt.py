@@ -1,18 +1,19 @@
 # app/auth/jwt.py
 # WARN: ChatGPT-generated code!
 
-import json
-from typing import Any, Dict
-from urllib.request import urlopen
+import asyncio
+from typing import Any, Dict, Optional
 
 from jose import jwt
+from jose.backends.base import Key
 
 from auth.config import auth_settings
+from auth.jwks import JWKSProvider
 
 
 class JWTService:
 
-    def __init__(self):
+    def __init__(self, jwks_provider: Optional[JWKSProvider] = None):
         """
         Конструктор сервиса JWTService, который возвращает Access Bearer token JWT-формата,
         который нужно использовать для доступа к нашим эндпоинтам.
@@ -20,47 +21,49 @@ class JWTService:
         - **auth0_domain** - Домен нашего auth0-tenant;
         - **audience** - Полная ссылка на наш auth0-API;
         - **jwks_url** - ссылка для получения Access Token от Auth0.
+        - **jwks_provider** - асинхронный провайдер публичных ключей (JWKS). Сеть при создании не трогается.
+        - **verify_in_thread** - выполнять ли RSA-проверку подписи в пуле потоков.
         """
         self.auth0_domain = auth_settings.auth0_domain
         self.audience = auth_settings.auth0_api_audience
-        self.jwks_url = f"https://{self.auth0_domain}/.well-known/jwks.json"
-        self.jwks = self._get_jwks()
+        self.jwks_url = auth_settings.auth0_jwks_url or (
+            f"https://{self.auth0_domain}/.well-known/jwks.json"
+        )
+        self.jwks_provider = jwks_provider or JWKSProvider(
+            jwks_url=self.jwks_url,
+            jwks_path=auth_settings.auth0_jwks_path,
+            ttl=auth_settings.jwks_cache_ttl,
+            min_refresh_interval=auth_settings.jwks_min_refresh_interval,
+        )
+        self.issuer = f"https://{self.auth0_domain}/"
+        self.verify_in_thread = auth_settings.jwt_verify_in_thread
 
-    def _get_jwks(self) -> Dict[str, Any]:
+    def _decode(self, token: str, rsa_key: Key) -> Dict[str, Any]:
         """
-        Метод, который получает access-token из нашего auth0-tenant;
+        Синхронная проверка подписи и claims токена уже сконструированным ключом.
         """
-        with urlopen(self.jwks_url) as response:
-            return json.loads(response.read())
+        return jwt.decode(
+            token,
+            rsa_key,
+            algorithms=["RS256"],
+            audience=self.audience,
+            issuer=self.issuer,
+        )
 
-    def verify_token(self, token: str) -> Dict[str, Any]:
+    async def verify_token(self, token: str) -> Dict[str, Any]:
         """
         Метод, который проверяет подлинность нашего access-token.
-        Я пока сам не понимаю, как он работает.
+        Ключ ищется по kid в индексе JWKSProvider (с обновлением по требованию при неизвестном kid).
         """
         unverified_header = jwt.get_unverified_header(token)
-        rsa_key = {}
-        for key in self.jwks["keys"]:
-            if key["kid"] == unverified_header["kid"]:
-                rsa_key = {
-                    "kty": key["kty"],
-                    "kid": key["kid"],
-                    "use": key["use"],
-                    "n": key["n"],
-                    "e": key["e"],
-                }
-                break
+        rsa_key = await self.jwks_provider.get_key(unverified_header.get("kid"))
 
-        if rsa_key:
+        if rsa_key is not None:
             try:
-                payload = jwt.decode(
-                    token,
-                    rsa_key,
-                    algorithms=["RS256"],
-                    audience=self.audience,
-                    issuer=f"https://{self.auth0_domain}/",
-                )
-                return payload
+                if self.verify_in_thread:
+                    # RSA-проверка подписи - CPU-bound, выносим из event loop
+                    return await asyncio.to_thread(self._decode, token, rsa_key)
+                return self._decode(token, rsa_key)
             except jwt.ExpiredSignatureError:
                 raise Exception("Token has expired")
             except jwt.JWTClaimsError:
@@ -1,11 +1,15 @@
 # app/auth/security.py
 # WARN: ChatGPT generated code!
 
+import hashlib
+import time
 from typing import Callable, List, Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from utils.cache.ttl_cache import TTLCache
+
 from .config import auth_settings
 from .jwt import JWTService
 
@@ -15,10 +19,35 @@ security = HTTPBearer()
 
 # TODO: improve with refreshToken.
 class Authenticator:
-    def __init__(self, jwt_service: JWTService):
+    def __init__(self, jwt_service: JWTService, token_cache: Optional[TTLCache] = None):
+        """
+        :param jwt_service: Сервис проверки JWT.
+        :param token_cache: LRU-кэш проверенных токенов: sha256(token) -> claims (живёт не дольше exp).
+        """
         self.jwt_service = jwt_service
+        self.token_cache = (
+            token_cache
+            if token_cache is not None
+            else TTLCache(
+                maxsize=auth_settings.verified_token_cache_size,
+                ttl=auth_settings.verified_token_cache_max_ttl,
+            )
+        )
 
-    def authenticate(self, credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+    def _cache_payload(self, token_hash: str, payload: dict) -> None:
+        """
+        Кладёт claims в кэш на время до истечения токена (но не дольше verified_token_cache_max_ttl).
+        """
+        exp = payload.get("exp")
+        if exp is None:
+            return
+        ttl = min(float(exp) - time.time(), self.token_cache.ttl)
+        if ttl > 0:
+            self.token_cache.set(token_hash, payload, ttl=ttl)
+
+    async def authenticate(
+        self, credentials: HTTPAuthorizationCredentials = Depends(security)
+    ) -> dict:
         """
         Аутентифицирует пользователя по токену.
 
@@ -27,8 +56,15 @@ class Authenticator:
         :raises HTTPException: Если токен недействителен
         """
         token = credentials.credentials
+        token_hash = hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+        cached_payload = self.token_cache.get(token_hash)
+        if cached_payload is not None:
+            return cached_payload
+
         try:
-            payload = self.jwt_service.verify_token(token)
+            payload = await self.jwt_service.verify_token(token)
+            self._cache_payload(token_hash, payload)
             return payload
         except Exception as e:
             raise HTTPException(
@@ -1,7 +1,9 @@
 # config.py
 import os
+from typing import List, Optional
 
 from dotenv import load_dotenv
+from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
 
 # Loading .env file
@@ -11,6 +13,28 @@ print(f"Loaded .env path: {os.getenv('APP_ENV_PATH')}")
 # TODO: refactor
 
 
+class DatabaseEngineSettings(BaseModel):
+    """
+    Настройки пула соединений и движка SQLAlchemy.
+
+    Задаются через переменные окружения вида DB_ENGINE__POOL_SIZE=20.
+    Помните, что пул создаётся на каждый uvicorn-воркер: итоговое количество соединений
+    к БД = workers * (pool_size + max_overflow).
+    """
+
+    pool_size: int = Field(10, ge=1, description="Постоянное количество соединений в пуле")
+    max_overflow: int = Field(20, ge=0, description="Дополнительные соединения сверх pool_size")
+    pool_timeout: float = Field(30.0, gt=0, description="Ожидание свободного соединения, сек")
+    pool_recycle: int = Field(
+        1800, description="Пересоздавать соединения старше N сек (-1 - никогда)"
+    )
+    pool_pre_ping: bool = Field(True, description="Проверять соединение перед выдачей из пула")
+    statement_cache_size: int = Field(
+        500, ge=0, description="Размер кэша скомпилированных запросов"
+    )
+    echo: bool = Field(False, description="Логировать SQL-запросы")
+
+
 class Settings(BaseSettings):
     app_name: str
     app_version: str
@@ -18,8 +42,62 @@ class Settings(BaseSettings):
     greeting_message: str
     database_url: str
 
+    db_engine: DatabaseEngineSettings = DatabaseEngineSettings()
+
+    # Реплики для чтения (JSON-список URL, например '["mysql+asyncmy://...replica1/db"]').
+    # Пусто - все запросы идут в primary.
+    database_replica_urls: List[str] = []
+    # Сколько секунд после собственной записи пользователь читает из primary (защита от лага реплики).
+    # 0 - отключено.
+    database_replica_read_your_writes_window: float = 5.0
+
+    # Кэш данных Chat-Microservice (секунды / количество записей)
+    chat_conversation_cache_ttl: float = 300.0
+    chat_messages_cache_ttl: float = 30.0
+    chat_cache_maxsize: int = 10_000
+
+    # Время жизни снимка справочников (категории, гендеры, роли, статусы) в секундах
+    reference_data_cache_ttl: float = 300.0
+
+    # Write-behind буфер свайпов: подтверждение сразу, запись в БД пачками (multi-row INSERT)
+    interaction_buffer_enabled: bool = False
+    interaction_buffer_flush_interval_ms: int = 50
+    interaction_buffer_max_batch_size: int = 500
+    interaction_buffer_max_pending: int = 50_000
+    # Append-only файл для ещё не записанных свайпов (переживает падение процесса). Пусто - только память.
+    # Каждый процесс пишет в свой файл <путь>.<pid>
+    interaction_buffer_spill_path: Optional[str] = None
+    interaction_buffer_spill_fsync: bool = False
+
+    # Архивация REJECT-свайпов старше N дней в user_interaction_archive (flows/interaction_archival_flow)
+    interaction_archive_after_days: int = 90
+    interaction_archive_batch_size: int = 5_000
+
+    # Хранить первичные/внешние ключи-UUID как BINARY(16) вместо VARCHAR(36).
+    # Должно совпадать с форматом колонок в БД (меняется скриптом scripts/db_scripts/convert_uuid_storage.py)
+    uuid_binary_storage: bool = False
+
+    # Курсоры пагинации: HMAC-подпись компактных токенов (пусто - без подписи) и приём
+    # старых base64-JSON токенов на время перехода
+    pagination_token_secret: Optional[str] = None
+    pagination_accept_legacy_tokens: bool = True
+    # Фоновая загрузка следующей страницы лент (посты, фото) в память процесса
+    pagination_prefetch_enabled: bool = False
+    pagination_prefetch_ttl: float = 15.0
+    pagination_prefetch_maxsize: int = 2_000
+
+    # Быстрая сериализация ответов (TypeAdapter.dump_json) для роутеров с route_class=FastJSONRoute
+    fast_json_responses: bool = True
+
+    # Хеширование паролей (bcrypt) в пуле потоков/процессов
+    password_hash_rounds: int = 12
+    password_hash_max_workers: int = 4
+    password_hash_max_concurrency: int = 16
+    password_hash_use_processes: bool = False
+
     class Config:
         env_file = os.getenv("APP_ENV_PATH")
+        env_nested_delimiter = "__"
         extra = "ignore"
 
 
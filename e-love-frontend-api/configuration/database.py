@@ -1,15 +1,29 @@
 # database.py
 
 import contextlib
+import hashlib
+import itertools
 import logging
-from typing import AsyncGenerator
+import os
+import time
+import traceback
+from typing import Any, AsyncGenerator, Dict, List, Optional
 
 import colorlog
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.ext.declarative import declarative_base
+from fastapi import Request
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
 
-from configuration.config import settings
+from configuration.config import DatabaseEngineSettings, settings
+from utils.cache.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -37,61 +51,222 @@ if not DATABASE_URL:
     logger.error("DATABASE_URL is not set in environment variables.")
     raise ValueError("DATABASE_URL must be set in environment variables.")
 
+
+class PoolMetrics:
+    """
+    Метрики ожидания соединения из пула (SQLAlchemy сам их не собирает).
+    """
+
+    def __init__(self):
+        self.wait_count = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.timeouts = 0
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        self.wait_count += 1
+        self.wait_total += seconds
+        self.wait_max = max(self.wait_max, seconds)
+        if timed_out:
+            self.timeouts += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "checkouts": self.wait_count,
+            "wait_avg_ms": (self.wait_total / self.wait_count * 1000) if self.wait_count else 0.0,
+            "wait_max_ms": self.wait_max * 1000,
+            "timeouts": self.timeouts,
+        }
+
+
+def pool_snapshot(pool: Pool) -> Dict[str, Any]:
+    """
+    Возвращает текущее состояние пула и накопленные метрики ожидания.
+
+    :param pool: Пул соединений движка (engine.pool).
+    :return: Словарь с метриками пула.
+    """
+    snapshot: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    # Эти методы есть только у QueuePool-подобных пулов
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        method = getattr(pool, name, None)
+        if callable(method):
+            snapshot[name] = method()
+    metrics = getattr(pool, "metrics", None)
+    if isinstance(metrics, PoolMetrics):
+        snapshot.update(metrics.as_dict())
+    return snapshot
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool, который замеряет время ожидания свободного соединения.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            self.metrics.record_wait(time.perf_counter() - started, timed_out=timed_out)
+
+
+def build_engine_kwargs(
+    database_url: str, engine_settings: DatabaseEngineSettings
+) -> Dict[str, Any]:
+    """
+    Собирает аргументы create_async_engine из типизированных настроек.
+
+    Для in-memory SQLite (тесты) параметры очереди пула не применяются - там используется StaticPool.
+
+    :param database_url: URL базы данных.
+    :param engine_settings: Настройки движка и пула.
+    :return: Словарь аргументов для create_async_engine.
+    """
+    kwargs: Dict[str, Any] = {
+        "echo": engine_settings.echo,
+        "pool_pre_ping": engine_settings.pool_pre_ping,
+        "query_cache_size": engine_settings.statement_cache_size,
+    }
+
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return kwargs
+
+    kwargs.update(
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=engine_settings.pool_size,
+        max_overflow=engine_settings.max_overflow,
+        pool_timeout=engine_settings.pool_timeout,
+        pool_recycle=engine_settings.pool_recycle,
+    )
+    return kwargs
+
+
+def create_engine_from_settings(database_url: str = DATABASE_URL) -> AsyncEngine:
+    """
+    Создаёт асинхронный движок SQLAlchemy с настройками пула из Settings.db_engine.
+    """
+    return create_async_engine(
+        database_url, **build_engine_kwargs(database_url, settings.db_engine)
+    )
+
+
+def create_session_factory(bind: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        bind=bind,
+        autoflush=False,
+        autocommit=False,
+        expire_on_commit=False,
+        class_=AsyncSession,
+    )
+
+
 try:
-    engine = create_async_engine(DATABASE_URL)
-    # AsyncSessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
-    logger.info("Async SQLAlchemy engine created successfully.")
+    engine = create_engine_from_settings()
+    replica_engines: List[AsyncEngine] = [
+        create_engine_from_settings(replica_url) for replica_url in settings.database_replica_urls
+    ]
+    logger.info(
+        f"Async SQLAlchemy engine created successfully ({len(replica_engines)} read replica(s))."
+    )
 except Exception as e:
     logger.error(f"Failed to create async SQLAlchemy engine: {e}")
     raise
 
+AsyncSessionLocal = create_session_factory(engine)
+
 Base = declarative_base()
-logger.info("Starting database connection check...")
 
 
-AsyncSessionLocal = async_sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine,
-    expire_on_commit=False,
-    class_=AsyncSession,
-)
+class SessionRouter:
+    """
+    Маршрутизатор сессий между primary и репликами для чтения.
 
+    - Запись (и всё, что явно помечено как primary) всегда идёт в primary;
+    - Чтение распределяется по репликам round-robin;
+    - Read-your-writes: после собственной записи клиент ещё `read_your_writes_window` секунд
+      читает из primary, чтобы не увидеть устаревшие данные из-за лага репликации.
 
-# @asynccontextmanager
-# async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-#     async with AsyncSessionLocal() as session:
-#         try:
-#             yield session
-#         except Exception as e:
-#             await session.rollback()
-#             logger.error(f"Database session error: {e}")
-#             raise
+    Для локальной проверки достаточно двух файлов SQLite, например:
+        DATABASE_URL=sqlite+aiosqlite:///./primary.db
+        DATABASE_REPLICA_URLS='["sqlite+aiosqlite:///./replica.db"]'
+    """
 
-import contextlib
-import logging
-import traceback
-from typing import AsyncGenerator
+    def __init__(
+        self,
+        primary: async_sessionmaker[AsyncSession],
+        replicas: List[async_sessionmaker[AsyncSession]],
+        read_your_writes_window: float = 0.0,
+    ):
+        self.primary = primary
+        self.replicas = replicas
+        self.read_your_writes_window = read_your_writes_window
+        self._replica_cycle = itertools.cycle(replicas) if replicas else None
+        self._recent_writers: TTLCache[str, bool] = TTLCache(
+            maxsize=100_000, ttl=read_your_writes_window
+        )
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import declarative_base
+    def record_write(self, client_key: Optional[str]) -> None:
+        """Запоминает, что клиент только что писал в primary."""
+        if client_key and self.read_your_writes_window > 0:
+            self._recent_writers.set(client_key, True)
 
-from configuration.config import settings
+    def get_session_factory(
+        self, read_only: bool, client_key: Optional[str] = None
+    ) -> async_sessionmaker[AsyncSession]:
+        """
+        Выбирает фабрику сессий для запроса.
 
-logger = logging.getLogger(__name__)
+        :param read_only: Запрос только читает данные.
+        :param client_key: Идентификатор клиента (для read-your-writes).
+        :return: Фабрика сессий primary или одной из реплик.
+        """
+        if not read_only or self._replica_cycle is None:
+            return self.primary
+        if client_key and client_key in self._recent_writers:
+            return self.primary
+        return next(self._replica_cycle)
 
-DATABASE_URL = settings.database_url
-engine = create_async_engine(DATABASE_URL, echo=False)
-
-AsyncSessionLocal = async_sessionmaker(
-    bind=engine,
-    autoflush=False,
-    autocommit=False,
-    expire_on_commit=False,
-    class_=AsyncSession,
+
+session_router = SessionRouter(
+    primary=AsyncSessionLocal,
+    replicas=[create_session_factory(replica) for replica in replica_engines],
+    read_your_writes_window=settings.database_replica_read_your_writes_window,
 )
 
-Base = declarative_base()
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def get_client_key(request: Request) -> Optional[str]:
+    """
+    Ключ клиента для read-your-writes: хеш заголовка Authorization, иначе адрес клиента.
+    """
+    authorization = request.headers.get("authorization")
+    if authorization:
+        return hashlib.sha256(authorization.encode("utf-8")).hexdigest()
+    if request.client is not None:
+        return request.client.host
+    return None
+
+
+def get_pool_metrics() -> Dict[str, Any]:
+    """
+    Метрики пулов основного движка и реплик (для подбора pool_size под количество uvicorn-воркеров).
+    """
+    return {
+        "pid": os.getpid(),
+        "primary": pool_snapshot(engine.pool),
+        "replicas": [pool_snapshot(replica.pool) for replica in replica_engines],
+    }
 
 
 async def handle_session_exception(session: AsyncSession, exc: BaseException):
@@ -104,9 +279,11 @@ async def handle_session_exception(session: AsyncSession, exc: BaseException):
     await session.rollback()
 
 
-async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    """ """
-    session = AsyncSessionLocal()
+@contextlib.asynccontextmanager
+async def session_scope(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> AsyncGenerator[AsyncSession, None]:
+    session = session_factory()
     try:
         yield session
     except Exception as e:
@@ -115,3 +292,29 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         raise
     finally:
         await session.close()
+
+
+async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Сессия БД для эндпоинта. Маршрут решается по запросу:
+    GET/HEAD/OPTIONS читают из реплики (если они настроены и клиент недавно не писал),
+    остальные методы работают с primary и отмечают клиента как недавно писавшего.
+    """
+    read_only = request.method in READ_ONLY_METHODS
+    client_key = get_client_key(request)
+    session_factory = session_router.get_session_factory(read_only, client_key)
+
+    try:
+        async with session_scope(session_factory) as session:
+            yield session
+    finally:
+        if not read_only:
+            session_router.record_write(client_key)
+
+
+async def get_primary_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Сессия primary независимо от метода запроса - для GET-эндпоинтов, которым нужны свежие данные.
+    """
+    async with session_scope(AsyncSessionLocal) as session:
+        yield session
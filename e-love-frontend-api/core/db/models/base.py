@@ -2,17 +2,20 @@
 
 import uuid
 
-from sqlalchemy import Column, DateTime, String, func
+from sqlalchemy import Column, DateTime, func
 from sqlalchemy.orm import declared_attr
 
 from configuration.database import Base
+from core.db.types.uuid_key import UUIDKey
 
 
 class BaseModel(Base):
     __abstract__ = True
 
+    # VARCHAR(36) или BINARY(16) - см. UUIDKey и настройку UUID_BINARY_STORAGE.
+    # Внешние ключи (Column(ForeignKey(...)) без типа) наследуют тип отсюда.
     id = Column(
-        String(36),
+        UUIDKey(),
         primary_key=True,
         default=uuid.uuid4,
         unique=True,
@@ -22,6 +25,10 @@ class BaseModel(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    # Серверные created_at/updated_at подгружаются сразу при flush (RETURNING, где он есть),
+    # чтобы после коммита не нужен был отдельный refresh объекта
+    __mapper_args__ = {"eager_defaults": True}
+
     @declared_attr
     def __tablename__(cls):
         return cls.__name__.lower()
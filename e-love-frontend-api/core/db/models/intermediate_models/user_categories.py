@@ -1,5 +1,5 @@
 # models/intermediate_models/user_categories.py
-from sqlalchemy import Column, ForeignKey, Table
+from sqlalchemy import Column, ForeignKey, Index, Table
 
 from ..base import Base
 
@@ -8,4 +8,6 @@ user_categories_table = Table(
     Base.metadata,
     Column("user_id", ForeignKey("user.id"), primary_key=True),
     Column("category_id", ForeignKey("categories.id"), primary_key=True),
+    # Матчинг: WHERE category_id IN (...) GROUP BY user_id (первичный ключ начинается с user_id)
+    Index("ix_user_categories_category_id_user_id", "category_id", "user_id"),
 )
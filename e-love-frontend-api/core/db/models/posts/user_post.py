@@ -1,5 +1,5 @@
 # type: ignore
-from sqlalchemy import Column, ForeignKey, String
+from sqlalchemy import Column, ForeignKey, Index, String
 from sqlalchemy.orm import relationship
 
 from core.db.models.intermediate_models.posts_categories import posts_categories_table
@@ -10,6 +10,11 @@ from ..base import BaseModel
 # TODO: add docstring & types
 class UserPost(BaseModel):
     __tablename__ = "user_post"
+    __table_args__ = (
+        Index("ix_user_post_created_at_id", "created_at", "id"),
+        # selectinload(User.posts): WHERE user_id IN (...)
+        Index("ix_user_post_user_id", "user_id"),
+    )
 
     post_title = Column(String(250), nullable=False)
     post_descr = Column(String(1000), nullable=False)
@@ -0,0 +1,31 @@
+from uuid import UUID
+
+from sqlalchemy import Column, ForeignKey, Index, UniqueConstraint
+
+from ..base import BaseModel
+
+
+class MutualMatch(BaseModel):
+    """
+    Взаимный лайк двух пользователей (оба поставили друг другу MATCH).
+
+    Пара хранится двумя строками - по одной на каждого участника, поэтому список мэтчей
+    пользователя - это диапазон индекса (user_id, created_at, id) без self-join
+    по user_interaction.
+
+    Атрибуты:
+       user_id (UUID): id пользователя, которому принадлежит строка.
+       matched_user_id (UUID): id пользователя, с которым случился взаимный мэтч.
+    """
+
+    __tablename__ = "mutual_match"
+    __table_args__ = (
+        UniqueConstraint("user_id", "matched_user_id", name="uq_mutual_match_user_id_matched"),
+        Index("ix_mutual_match_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
+
+    user_id: Column[UUID] = Column(ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
+
+    matched_user_id: Column[UUID] = Column(
+        ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+    )
@@ -1,7 +1,7 @@
 from typing import List
 from uuid import UUID
 
-from sqlalchemy import Column, ForeignKey, String
+from sqlalchemy import Column, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, relationship
 
 from ..base import BaseModel
@@ -18,6 +18,11 @@ class UserImages(BaseModel):
     """
 
     __tablename__ = "user_images"
+    __table_args__ = (
+        Index("ix_user_images_created_at_id", "created_at", "id"),
+        # Фото пользователя постранично: WHERE user_id = ? ORDER BY created_at, id
+        Index("ix_user_images_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
 
     img_url: Column[str] = Column(String(240), nullable=False)
     user_id: Column[UUID] = Column(ForeignKey("user.id"), nullable=False)
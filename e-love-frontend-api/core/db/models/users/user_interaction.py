@@ -1,7 +1,7 @@
 from typing import List
 from uuid import UUID
 
-from sqlalchemy import Column, ForeignKey, String
+from sqlalchemy import Column, ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, relationship
 
 from ..base import BaseModel
@@ -19,6 +19,14 @@ class UserInteraction(BaseModel):
     """
 
     __tablename__ = "user_interaction"
+    __table_args__ = (
+        Index("ix_user_interaction_created_at_id", "created_at", "id"),
+        # Одна запись на пару (повторный свайп обновляет interaction_type, см. upsert);
+        # он же покрывающий индекс списка просмотренных: SELECT target_user_id WHERE user_id = ?
+        UniqueConstraint(
+            "user_id", "target_user_id", name="uq_user_interaction_user_id_target_user_id"
+        ),
+    )
 
     user_id: Column[UUID] = Column(ForeignKey("user.id"), nullable=False)
 
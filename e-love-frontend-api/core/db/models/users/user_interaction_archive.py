@@ -0,0 +1,19 @@
+# models/users/user_interaction_archive.py
+from sqlalchemy import Column, DateTime, ForeignKey, Table
+
+from core.db.types.uuid_key import UUIDKey
+
+from ..base import Base
+
+# Архив старых REJECT-свайпов (переносит flows/interaction_archival_flow).
+# Компактнее user_interaction: ни суррогатного id, ни типа, ни updated_at - первичный ключ
+# (user_id, target_user_id) и есть вся "сводка просмотренных", а свайпы одного пользователя
+# лежат в нём одним диапазоном. На target_user_id нет внешнего ключа, чтобы не держать
+# второй индекс: id удалённого пользователя в списке исключений матчинга ничему не мешает.
+user_interaction_archive_table = Table(
+    "user_interaction_archive",
+    Base.metadata,
+    Column("user_id", ForeignKey("user.id", ondelete="CASCADE"), primary_key=True),
+    Column("target_user_id", UUIDKey(), primary_key=True),
+    Column("created_at", DateTime(timezone=True)),
+)
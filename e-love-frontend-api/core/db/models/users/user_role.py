@@ -20,7 +20,7 @@ class UserRole(BaseModel):
 
     __tablename__ = "user_role"
 
-    role_name: Column[str] = Column(String(50), nullable=False)
+    role_name: Column[str] = Column(String(50), unique=True, nullable=False)
 
     users: Mapped[List["User"]] = relationship(
         "User", secondary=user_roles_table, back_populates="roles"
@@ -2,7 +2,7 @@ from typing import List
 from uuid import UUID
 
 from passlib.hash import bcrypt
-from sqlalchemy import Column, ForeignKey, String
+from sqlalchemy import Column, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, relationship
 
 from core.db.models.audit_logs.audit_logs import AuditLogs
@@ -40,6 +40,8 @@ class User(BaseModel):
     """
 
     __tablename__ = "user"
+    # Курсор Paginator: ORDER BY created_at, id + условие (created_at, id) > курсора
+    __table_args__ = (Index("ix_user_created_at_id", "created_at", "id"),)
 
     first_name: Column[str] = Column(String(50), nullable=False)
     last_name: Column[str] = Column(String(50), nullable=False)
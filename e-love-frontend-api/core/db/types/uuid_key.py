@@ -0,0 +1,56 @@
+# core/db/types/uuid_key.py
+
+import uuid
+from typing import Any, Optional, Union
+
+from sqlalchemy import BINARY, String
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator, TypeEngine
+
+from configuration.config import settings
+
+
+class UUIDKey(TypeDecorator):
+    """
+    Тип колонки для первичных и внешних ключей-UUID.
+
+    Хранение выбирается настройкой UUID_BINARY_STORAGE:
+    - False (по умолчанию) - VARCHAR(36), как и раньше;
+    - True - BINARY(16): ключи и индексы по ним в 2+ раза компактнее, сравнение - побайтовое.
+
+    В Python значение всегда строка вида "xxxxxxxx-xxxx-...", поэтому сервисы, схемы и кэши
+    не зависят от способа хранения. На вход принимаются как str, так и uuid.UUID.
+    Байты uuid.UUID.bytes сортируются так же, как его строковое hex-представление,
+    поэтому порядок (created_at, id) и курсоры пагинации в обоих режимах совпадают.
+    """
+
+    impl = String(36)
+    cache_ok = True
+
+    def __init__(self, binary: Optional[bool] = None):
+        """
+        :param binary: Хранить как BINARY(16). None - взять значение из настроек.
+        """
+        super().__init__()
+        self.binary = settings.uuid_binary_storage if binary is None else binary
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if self.binary:
+            return dialect.type_descriptor(BINARY(16))
+        return dialect.type_descriptor(String(36))
+
+    def process_bind_param(
+        self, value: Optional[Union[uuid.UUID, str]], dialect: Dialect
+    ) -> Optional[Union[bytes, str]]:
+        if value is None:
+            return None
+        if not self.binary:
+            return str(value)
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(str(value))
+        return value.bytes
+
+    def process_result_value(self, value: Optional[Any], dialect: Dialect) -> Optional[str]:
+        if value is None or not self.binary:
+            return value
+        return str(uuid.UUID(bytes=bytes(value)))
@@ -0,0 +1,37 @@
+from typing import List
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+"""Общие Pydantic схемы для bulk-эндпоинтов."""
+
+# Максимальный размер одной пачки - чтобы один запрос не превращался в многомегабайтный INSERT
+BULK_MAX_ITEMS = 1000
+
+
+class BulkDeleteRequest(BaseModel):
+    """
+    Схема запроса на удаление нескольких объектов.
+
+    Атрибуты:
+        ids (List[UUID]): Идентификаторы удаляемых объектов.
+    """
+
+    ids: List[UUID] = Field(
+        ..., min_length=1, max_length=BULK_MAX_ITEMS, description="IDs of the objects to delete"
+    )
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class BulkDeleteResponse(BaseModel):
+    """
+    Схема ответа на удаление нескольких объектов.
+
+    Атрибуты:
+        deleted (int): Количество удалённых объектов.
+    """
+
+    deleted: int = Field(..., description="Number of deleted objects")
+
+    model_config = ConfigDict(extra="forbid")
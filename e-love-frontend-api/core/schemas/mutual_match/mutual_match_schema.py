@@ -0,0 +1,43 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+"""Pydantic схемы для взаимных мэтчей."""
+
+
+class MutualMatchOutput(BaseModel):
+    """
+    Схема для отображения взаимного мэтча.
+
+    Атрибуты:
+        id (UUID): ID записи мэтча.
+        user_id (UUID): ID пользователя, которому принадлежит список мэтчей.
+        matched_user_id (UUID): ID пользователя, с которым случился взаимный мэтч.
+        created_at (datetime): Когда мэтч стал взаимным.
+    """
+
+    id: UUID = Field(..., description="ID of the mutual match entity in UUID format")
+    user_id: UUID = Field(..., description="ID of the user the match belongs to")
+    matched_user_id: UUID = Field(..., description="ID of the mutually matched user")
+    created_at: Optional[datetime] = Field(None, description="When the match became mutual")
+
+    model_config = ConfigDict(from_attributes=True, extra="forbid")
+
+
+class MutualMatchesListResponse(BaseModel):
+    """
+    Схема для списка взаимных мэтчей с информацией о пагинации.
+
+    Атрибуты:
+        matches (List[MutualMatchOutput]): Список мэтчей.
+        has_next (bool): Индикатор наличия следующей страницы.
+        next_token (Optional[str]): Токен для следующей страницы результатов.
+    """
+
+    matches: List[MutualMatchOutput] = Field(..., description="List of mutual matches")
+    has_next: bool = Field(..., description="Indicates if there is a next page")
+    next_token: Optional[str] = Field(None, description="Token for the next page of results")
+
+    model_config = ConfigDict(extra="forbid")
@@ -4,6 +4,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from core.schemas.bulk.bulk_schema import BULK_MAX_ITEMS
+
 """Pydantic схемы для постов пользователя."""
 
 
@@ -91,10 +93,55 @@ class PostsListResponse(BaseModel):
         items (List[PostOutput]): Список постов.
         has_next (bool): Индикатор наличия следующей страницы.
         next_token (Optional[str]): Токен для следующей страницы результатов.
+        has_prev (bool): Индикатор наличия предыдущей страницы.
+        prev_token (Optional[str]): Токен для предыдущей страницы результатов.
     """
 
     items: List[PostOutput] = Field(..., description="List of posts")
     has_next: bool = Field(..., description="Indicates if there is a next page")
     next_token: Optional[str] = Field(None, description="Token for the next page of results")
+    has_prev: bool = Field(False, description="Indicates if there is a previous page")
+    prev_token: Optional[str] = Field(None, description="Token for the previous page of results")
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class PostsBulkCreate(BaseModel):
+    """
+    Схема для создания нескольких постов одним запросом.
+
+    Атрибуты:
+        items (List[PostCreate]): Создаваемые посты.
+    """
+
+    items: List[PostCreate] = Field(
+        ..., min_length=1, max_length=BULK_MAX_ITEMS, description="Posts to create"
+    )
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class PostBulkUpdateItem(PostUpdate):
+    """
+    Схема обновления одного поста внутри bulk-запроса.
+
+    Атрибуты:
+        id (UUID): ID обновляемого поста.
+    """
+
+    id: UUID = Field(..., description="ID of the post in UUID format")
+
+
+class PostsBulkUpdate(BaseModel):
+    """
+    Схема для обновления нескольких постов одним запросом.
+
+    Атрибуты:
+        items (List[PostBulkUpdateItem]): Обновления постов.
+    """
+
+    items: List[PostBulkUpdateItem] = Field(
+        ..., min_length=1, max_length=BULK_MAX_ITEMS, description="Post updates"
+    )
 
     model_config = ConfigDict(extra="forbid")
@@ -3,6 +3,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field, HttpUrl
 
+from core.schemas.bulk.bulk_schema import BULK_MAX_ITEMS
+
 
 class UserImagesBase(BaseModel):
     """
@@ -65,11 +67,48 @@ class UserImagesListResponse(BaseModel):
         items: List of user images.
         has_next: Boolean indicating if there are more images to fetch.
         next_token: Token for fetching the next page of images.
+        has_prev: Boolean indicating if there are images before this page.
+        prev_token: Token for fetching the previous page of images.
     """
 
     items: List[UserImagesOutput]
     has_next: bool
     next_token: Optional[str] = None
+    has_prev: bool = False
+    prev_token: Optional[str] = None
 
     class Config:
         from_attributes = True
+
+
+class UserImagesBulkCreate(BaseModel):
+    """
+    Pydantic schema for creating several user images in one request.
+
+    Attributes:
+        items: User images to create.
+    """
+
+    items: List[UserImagesCreate] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class UserImagesBulkUpdateItem(UserImagesUpdate):
+    """
+    Pydantic schema for a single user image update inside a bulk request.
+
+    Attributes:
+        id: ID of the user image to update (required).
+    """
+
+    id: UUID = Field(..., description="An ID of the user image in UUID format")
+
+
+class UserImagesBulkUpdate(BaseModel):
+    """
+    Pydantic schema for updating several user images in one request.
+
+    Attributes:
+        items: User image updates.
+    """
+
+    items: List[UserImagesBulkUpdateItem] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
@@ -4,6 +4,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from core.schemas.bulk.bulk_schema import BULK_MAX_ITEMS
+
 """Pydantic схемы для взаимодействий пользователей."""
 
 
@@ -88,3 +90,123 @@ class UserInteractionsListResponse(BaseModel):
     next_token: Optional[str] = Field(None, description="Token for the next page of results")
 
     model_config = ConfigDict(extra="forbid")
+
+
+class UserInteractionsBulkCreate(BaseModel):
+    """
+    Схема для создания нескольких взаимодействий пользователей одним запросом.
+
+    Атрибуты:
+        items (List[UserInteractionCreate]): Создаваемые взаимодействия.
+    """
+
+    items: List[UserInteractionCreate] = Field(
+        ..., min_length=1, max_length=BULK_MAX_ITEMS, description="User interactions to create"
+    )
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class UserInteractionBulkUpdateItem(UserInteractionUpdate):
+    """
+    Схема обновления одного взаимодействия внутри bulk-запроса.
+
+    Атрибуты:
+        id (UUID): ID обновляемого взаимодействия.
+    """
+
+    id: UUID = Field(..., description="ID of the user-interaction entity in UUID format")
+
+
+class UserInteractionsBulkUpdate(BaseModel):
+    """
+    Схема для обновления нескольких взаимодействий пользователей одним запросом.
+
+    Атрибуты:
+        items (List[UserInteractionBulkUpdateItem]): Обновления взаимодействий.
+    """
+
+    items: List[UserInteractionBulkUpdateItem] = Field(
+        ..., min_length=1, max_length=BULK_MAX_ITEMS, description="User interaction updates"
+    )
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class SwipeItem(BaseModel):
+    """
+    Один свайп внутри пакетной отправки.
+
+    Атрибуты:
+        target_user_id (UUID): ID пользователя, на которого свайпнули.
+        interaction_type (InteractionType): Тип взаимодействия (MATCH или REJECT).
+    """
+
+    target_user_id: UUID = Field(..., description="ID of the swiped user")
+    interaction_type: InteractionType = Field(
+        ..., description="Type of interaction (MATCH or REJECT)"
+    )
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class SwipesBulkCreate(BaseModel):
+    """
+    Схема пакетной отправки свайпов текущего пользователя (например, накопленных офлайн).
+
+    Атрибуты:
+        user_id (UUID): ID текущего пользователя.
+        items (List[SwipeItem]): Свайпы в порядке их совершения.
+    """
+
+    user_id: UUID = Field(..., description="ID of the current user that made the swipes")
+    items: List[SwipeItem] = Field(
+        ..., min_length=1, max_length=BULK_MAX_ITEMS, description="Swipes to submit"
+    )
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class SwipeStatus(str, Enum):
+    """
+    Результат обработки одного свайпа.
+
+    CREATED - создано новое взаимодействие; ALREADY_EXISTS - взаимодействие пары уже было,
+    его interaction_type заменён типом этого свайпа; DUPLICATE - повтор пары внутри пакета,
+    его тип тоже применяется (итог определяет последний свайп); SELF_SWIPE и TARGET_NOT_FOUND -
+    свайп отклонён.
+    """
+
+    CREATED = "created"
+    ALREADY_EXISTS = "already_exists"
+    DUPLICATE = "duplicate"
+    SELF_SWIPE = "self_swipe"
+    TARGET_NOT_FOUND = "target_not_found"
+
+
+class SwipeResult(BaseModel):
+    """
+    Результат по одному свайпу пакета.
+
+    Атрибуты:
+        target_user_id (UUID): ID пользователя, на которого свайпнули.
+        status (SwipeStatus): Что произошло со свайпом.
+        id (Optional[UUID]): ID созданного или уже существующего взаимодействия.
+    """
+
+    target_user_id: UUID = Field(..., description="ID of the swiped user")
+    status: SwipeStatus = Field(..., description="Outcome of the swipe")
+    id: Optional[UUID] = Field(None, description="ID of the created or existing interaction")
+
+
+class SwipesBulkResponse(BaseModel):
+    """
+    Ответ на пакетную отправку свайпов.
+
+    Атрибуты:
+        created (int): Количество созданных взаимодействий.
+        results (List[SwipeResult]): Результаты в порядке входных свайпов.
+    """
+
+    created: int = Field(..., description="Number of created interactions")
+    results: List[SwipeResult] = Field(..., description="Per-swipe results, in input order")
@@ -1,9 +1,9 @@
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field, validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
-from core.db.models.posts.user_post import UserPost
+from core.schemas.bulk.bulk_schema import BULK_MAX_ITEMS
 from core.schemas.posts.user_post_schema import PostOutput
 from core.schemas.user_gender.user_gender_schema import UserGenderOutput
 from core.schemas.users_categories.users_categories_schema import CategoryOutput
@@ -85,24 +85,6 @@ class UserOutput(UserBase):
 
     model_config = ConfigDict(from_attributes=True, extra="forbid")
 
-    # WHY? Проблема: Без явного преобразования Pydantic не знает, как преобразовать каждый UserPost в PostOutput (тут получаем список), и мы получаем ошибку валидации.
-    # Однако, я не понимаю почему, но на categories это не распространяеться... Возможно проблема кроется просто в наличии from_attrs. Но я на всякий случай так же добавил и валидатор.
-    # v - элемент pydantic. Если обнаружился объект типа UserPost - модели (alembic) - идет его преобразование (сериализация) в Pydantic-модель через from_orm стандартный метод.
-    @validator("posts", pre=True, each_item=True)
-    def convert_posts(cls, v):
-        """
-        Конвертирует ORM-объекты UserPost в Pydantic-модели PostOutput.
-
-        Args:
-            v: Значение элемента списка posts.
-
-        Returns:
-            PostOutput: Pydantic-модель поста.
-        """
-        if isinstance(v, UserPost):
-            return PostOutput.from_orm(v)
-        return v
-
 
 class UsersHarborListResponse(BaseModel):
     """
@@ -149,3 +131,44 @@ class UsersMatchingListResponse(BaseModel):
     next_token: Optional[str] = Field(None, description="Token for the next page of results")
 
     model_config = ConfigDict(extra="forbid")
+
+
+class UsersBulkCreate(BaseModel):
+    """
+    Схема для создания нескольких пользователей одним запросом.
+
+    Атрибуты:
+        items (List[UserCreate]): Создаваемые пользователи.
+    """
+
+    items: List[UserCreate] = Field(
+        ..., min_length=1, max_length=BULK_MAX_ITEMS, description="Users to create"
+    )
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class UserBulkUpdateItem(UserUpdate):
+    """
+    Схема обновления одного пользователя внутри bulk-запроса.
+
+    Атрибуты:
+        id (UUID): ID обновляемого пользователя.
+    """
+
+    id: UUID = Field(..., description="ID of the user in UUID format")
+
+
+class UsersBulkUpdate(BaseModel):
+    """
+    Схема для обновления нескольких пользователей одним запросом.
+
+    Атрибуты:
+        items (List[UserBulkUpdateItem]): Обновления пользователей.
+    """
+
+    items: List[UserBulkUpdateItem] = Field(
+        ..., min_length=1, max_length=BULK_MAX_ITEMS, description="User updates"
+    )
+
+    model_config = ConfigDict(extra="forbid")
@@ -1,12 +1,20 @@
 import asyncio
 import logging
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union
+import uuid
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Type, TypeVar, Union
 from uuid import UUID
 
 from fastapi import HTTPException
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import case, delete, func, insert
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy import literal, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.interfaces import ORMOption
 
 from exceptions.exception_handler import ExceptionHandler
 
@@ -15,6 +23,31 @@ ModelType = TypeVar("ModelType")
 logger = logging.getLogger(__name__)
 
 
+def unique_ids(object_ids: Iterable[Union[UUID, str]]) -> List[str]:
+    """
+    Приводит идентификаторы к строкам и убирает дубли, сохраняя исходный порядок.
+    """
+    return list(dict.fromkeys(str(object_id) for object_id in object_ids))
+
+
+def ensure_all_found(model: Type[ModelType], object_ids: List[str], objects: List[Any]) -> None:
+    """
+    Проверяет, что по всем идентификаторам нашлись объекты.
+
+    :param model: Класс модели базы данных.
+    :param object_ids: Запрошенные идентификаторы (строки).
+    :param objects: Найденные объекты.
+    :raises HTTPException: 404 со списком всех ненайденных идентификаторов.
+    """
+    found_ids = {str(obj.id) for obj in objects}
+    missing_ids = [object_id for object_id in object_ids if object_id not in found_ids]
+    if missing_ids:
+        raise HTTPException(
+            status_code=404,
+            detail=f"{model.__name__} not found: {', '.join(missing_ids)}",
+        )
+
+
 class BaseService:
     """
     Базовый сервисный класс, предоставляющий имплементацию общих CRUD-методов для работы с моделями базы данных.
@@ -28,17 +61,26 @@ class BaseService:
         """
         self.db_session = db_session
 
-    async def get_object_by_id(self, model: Type[ModelType], object_id: UUID) -> ModelType:
+    async def get_object_by_id(
+        self,
+        model: Type[ModelType],
+        object_id: UUID,
+        options: Optional[Sequence[ORMOption]] = None,
+    ) -> ModelType:
         """
         Получает объект модели по его идентификатору.
 
         :param model: Класс модели базы данных.
         :param object_id: Идентификатор объекта.
+        :param options: Loader options (какие связи загружать), по умолчанию - как в модели.
         :return: Экземпляр объекта модели.
         :raises HTTPException: Если объект не найден или произошла ошибка базы данных.
         """
         try:
-            result = await self.db_session.execute(select(model).where(model.id == str(object_id)))
+            query = select(model).where(model.id == str(object_id))
+            if options:
+                query = query.options(*options)
+            result = await self.db_session.execute(query)
             obj = result.scalar_one_or_none()
             if not obj:
                 raise HTTPException(status_code=404, detail=f"{model.__name__} not found")
@@ -48,35 +90,99 @@ class BaseService:
             logger.error(f"Error in get_object_by_id: {e}")
             ExceptionHandler(e)
 
+    async def ensure_object_exists(self, model: Type[ModelType], object_id: UUID) -> None:
+        """
+        Проверяет существование объекта лёгким запросом (только id, без загрузки связей).
+
+        :param model: Класс модели базы данных.
+        :param object_id: Идентификатор объекта.
+        :raises HTTPException: Если объект не найден или произошла ошибка базы данных.
+        """
+        try:
+            result = await self.db_session.execute(
+                select(model.id).where(model.id == str(object_id))
+            )
+            if result.scalar_one_or_none() is None:
+                raise HTTPException(status_code=404, detail=f"{model.__name__} not found")
+        except Exception as e:
+            await self.db_session.rollback()
+            logger.error(f"Error in ensure_object_exists: {e}")
+            ExceptionHandler(e)
+
+    async def get_objects_by_ids(
+        self,
+        model: Type[ModelType],
+        object_ids: Iterable[Union[UUID, str]],
+        options: Optional[Sequence[ORMOption]] = None,
+    ) -> List[ModelType]:
+        """
+        Получает объекты модели по списку идентификаторов одним запросом (WHERE id IN (...)).
+
+        :param model: Класс модели базы данных.
+        :param object_ids: Идентификаторы объектов (дубли игнорируются).
+        :param options: Loader options (какие связи загружать), по умолчанию - как в модели.
+        :return: Список объектов в порядке переданных идентификаторов.
+        :raises HTTPException: Если часть объектов не найдена (404 со списком всех отсутствующих id)
+            или произошла ошибка базы данных.
+        """
+        try:
+            ids = unique_ids(object_ids)
+            if not ids:
+                return []
+
+            query = select(model).where(model.id.in_(ids))
+            if options:
+                query = query.options(*options)
+            result = await self.db_session.execute(query)
+            objects_by_id = {str(obj.id): obj for obj in result.scalars().all()}
+            objects = [objects_by_id[object_id] for object_id in ids if object_id in objects_by_id]
+
+            ensure_all_found(model, ids, objects)
+            return objects
+        except Exception as e:
+            await self.db_session.rollback()
+            logger.error(f"Error in get_objects_by_ids: {e}")
+            ExceptionHandler(e)
+
+    def _init_new_object_collections(self, obj: Any) -> None:
+        """
+        Проставляет пустые коллекции-связи только что созданному объекту.
+
+        На новую строку ещё никто не ссылается, поэтому пустой список - точное значение,
+        а обращение к незагруженной связи после коммита выполнило бы лишний запрос
+        (в асинхронной сессии - вообще ошибку ленивой загрузки).
+        """
+        state = sa_inspect(obj)
+        for relationship in state.mapper.relationships:
+            if relationship.uselist and relationship.key not in state.dict:
+                set_committed_value(obj, relationship.key, [])
+
     async def create_object(
         self,
         model: Type[ModelType],
         data: Dict[str, Any],
-        unique_fields: Optional[List[str]] = None,
         preprocess_func: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        refresh_attributes: Optional[List[str]] = None,
     ) -> ModelType:
         """
         Создает новый объект модели в базе данных.
 
+        После коммита объект не перечитывается целиком: колонки берутся из переданных данных,
+        серверные значения по умолчанию (created_at) подгружаются при flush (eager_defaults,
+        через RETURNING, если диалект его поддерживает), коллекции-связи нового объекта пустые.
+
         :param model: Класс модели базы данных.
         :param data: Данные для создания объекта.
-        :param unique_fields: Список полей, которые должны быть уникальными.
         :param preprocess_func: Функция для предобработки данных перед созданием объекта.
+        :param refresh_attributes: Атрибуты, которые нужно дочитать из БД после коммита
+            (например, many-to-one связи, нужные схеме ответа).
         :return: Созданный экземпляр объекта модели.
-        :raises HTTPException: Если объект с уникальными полями уже существует или произошла ошибка базы данных.
+        :raises HTTPException: Если нарушено ограничение уникальности (400, через IntegrityError
+            и ExceptionMap) или произошла ошибка базы данных.
         """
         try:
-            # Проверка на уникальность
-            if unique_fields:
-                filters = [getattr(model, field) == data[field] for field in unique_fields]
-                query = select(model).where(*filters)
-                result = await self.db_session.execute(query)
-                exists = result.scalar_one_or_none()
-                if exists:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"{model.__name__} with these unique fields already exists.",
-                    )
+            # Уникальность обеспечивается ограничениями БД: отдельный SELECT перед вставкой
+            # стоил лишнего запроса и не защищал от гонки параллельных вставок
 
             # Создание нового объекта
             new_object = model(**data)
@@ -90,32 +196,165 @@ class BaseService:
 
             self.db_session.add(new_object)
             await self.db_session.commit()
-            await self.db_session.refresh(new_object)
+
+            self._init_new_object_collections(new_object)
+            if refresh_attributes:
+                await self.db_session.refresh(new_object, attribute_names=refresh_attributes)
             return new_object
         except Exception as e:
             await self.db_session.rollback()
             logger.error(f"Error in create_object method: {e}")
             ExceptionHandler(e)
 
+    async def upsert_object(
+        self,
+        model: Type[ModelType],
+        data: Union[Dict[str, Any], BaseModel],
+        conflict_columns: List[str],
+        update_columns: List[str],
+    ) -> ModelType:
+        """
+        Создает объект или, если строка с теми же значениями уникального ключа уже есть,
+        обновляет в ней update_columns - одним INSERT ... ON DUPLICATE KEY UPDATE
+        (MySQL) или INSERT ... ON CONFLICT DO UPDATE (SQLite, PostgreSQL). На остальных
+        диалектах - SELECT ... FOR UPDATE по уникальному ключу и затем UPDATE или INSERT
+        в той же транзакции.
+
+        Итоговая строка (новая или существующая, со своим id) дочитывается по уникальному ключу.
+
+        :param model: Класс модели базы данных.
+        :param data: Данные объекта.
+        :param conflict_columns: Колонки уникального ключа, по которому ищется существующая строка.
+        :param update_columns: Колонки, перезаписываемые у существующей строки.
+        :return: Созданный или обновлённый экземпляр объекта модели.
+        :raises HTTPException: Если произошла ошибка базы данных.
+        """
+        try:
+            row = self._normalize_row(data)
+            row.setdefault("id", str(uuid.uuid4()))
+
+            await self.upsert_rows(model, [row], conflict_columns, update_columns)
+            result = await self.db_session.execute(
+                select(model)
+                .where(*(getattr(model, column) == row[column] for column in conflict_columns))
+                .execution_options(populate_existing=True)
+            )
+            obj = result.scalars().one()
+            await self.db_session.commit()
+            return obj
+        except Exception as e:
+            await self.db_session.rollback()
+            logger.error(f"Error in upsert_object method: {e}")
+            ExceptionHandler(e)
+
+    async def upsert_rows(
+        self,
+        model: Type[ModelType],
+        rows: List[Dict[str, Any]],
+        conflict_columns: List[str],
+        update_columns: List[str],
+    ) -> None:
+        """
+        Вставляет строки, а для уже существующих (по уникальному ключу conflict_columns) обновляет
+        update_columns и updated_at - одним multi-row INSERT ... ON DUPLICATE KEY UPDATE (MySQL)
+        или INSERT ... ON CONFLICT DO UPDATE (SQLite, PostgreSQL), на остальных диалектах -
+        построчно через SELECT ... FOR UPDATE (см. _select_then_write).
+
+        Не коммитит: выполняется в транзакции вызывающего метода. Строки с одинаковым ключом
+        в одном вызове недопустимы (PostgreSQL отклоняет такой INSERT) - их нужно схлопнуть заранее.
+
+        :param model: Класс модели базы данных.
+        :param rows: Строки (словари колонок, с id).
+        :param conflict_columns: Колонки уникального ключа.
+        :param update_columns: Колонки, перезаписываемые у существующих строк.
+        """
+        if not rows:
+            return
+
+        dialect_name = self.db_session.get_bind().dialect.name
+        if dialect_name == "mysql":
+            statement = mysql_insert(model).values(rows)
+            statement = statement.on_duplicate_key_update(
+                {column: statement.inserted[column] for column in update_columns},
+                updated_at=func.now(),
+            )
+        elif dialect_name in ("sqlite", "postgresql"):
+            dialect_insert = sqlite_insert if dialect_name == "sqlite" else postgresql_insert
+            statement = dialect_insert(model).values(rows)
+            statement = statement.on_conflict_do_update(
+                index_elements=conflict_columns,
+                set_={
+                    **{column: statement.excluded[column] for column in update_columns},
+                    "updated_at": func.now(),
+                },
+            )
+        else:
+            for row in rows:
+                await self.db_session.execute(
+                    await self._select_then_write(model, row, conflict_columns, update_columns)
+                )
+            return
+
+        await self.db_session.execute(statement)
+
+    async def _select_then_write(
+        self,
+        model: Type[ModelType],
+        row: Dict[str, Any],
+        conflict_columns: List[str],
+        update_columns: List[str],
+    ) -> Any:
+        """
+        Запасной вариант upsert_rows для диалектов без INSERT ... ON CONFLICT:
+        блокирует существующую строку по уникальному ключу и возвращает UPDATE для неё
+        или INSERT новой строки. Выполняется в транзакции вызывающего метода.
+        """
+        key_filter = [getattr(model, column) == row[column] for column in conflict_columns]
+        result = await self.db_session.execute(
+            select(model.id).where(*key_filter).with_for_update()
+        )
+        existing_id = result.scalar_one_or_none()
+        if existing_id is None:
+            return insert(model).values(row)
+
+        return (
+            update(model)
+            .where(model.id == existing_id)
+            .values(
+                {
+                    **{column: row[column] for column in update_columns},
+                    "updated_at": func.now(),
+                }
+            )
+            .execution_options(synchronize_session=False)
+        )
+
     async def update_object(
         self,
         model: Type[ModelType],
         object_id: UUID,
         data: Union[Dict[str, Any], BaseModel],
         preprocess_func: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        refresh_attributes: Optional[List[str]] = None,
+        options: Optional[Sequence[ORMOption]] = None,
     ) -> ModelType:
         """
         Обновляет существующий объект модели в базе данных.
 
+        Объект уже загружен (вместе с selectin-связями), а сессия не сбрасывает состояние
+        при коммите, поэтому полный refresh не нужен: updated_at подгружается при flush.
+
         :param model: Класс модели базы данных.
         :param object_id: Идентификатор объекта для обновления.
         :param data: Данные для обновления объекта.
         :param preprocess_func: Функция для предобработки данных перед обновлением объекта.
+        :param refresh_attributes: Атрибуты, которые нужно дочитать из БД после коммита.
+        :param options: Loader options для загрузки обновляемого объекта.
         :return: Обновленный экземпляр объекта модели.
         :raises HTTPException: Если объект не найден или произошла ошибка базы данных.
         """
         try:
-            obj = await self.get_object_by_id(model, object_id)
+            obj = await self.get_object_by_id(model, object_id, options=options)
 
             if isinstance(data, BaseModel):
                 data = data.dict(exclude_unset=True)
@@ -133,7 +372,9 @@ class BaseService:
 
             self.db_session.add(obj)
             await self.db_session.commit()
-            await self.db_session.refresh(obj)
+
+            if refresh_attributes:
+                await self.db_session.refresh(obj, attribute_names=refresh_attributes)
             return obj
         except Exception as e:
             await self.db_session.rollback()
@@ -158,3 +399,187 @@ class BaseService:
             await self.db_session.rollback()
             logger.error(f"Error in delete_object method: {e}")
             ExceptionHandler(e)
+
+    def _normalize_row(self, data: Union[Dict[str, Any], BaseModel]) -> Dict[str, Any]:
+        """
+        Приводит данные одной записи к словарю колонок (UUID -> str, как хранятся id в БД).
+        """
+        if isinstance(data, BaseModel):
+            data = data.model_dump(exclude_unset=True)
+        return {
+            key: str(value) if isinstance(value, UUID) else value for key, value in data.items()
+        }
+
+    async def _select_by_ids(
+        self, model: Type[ModelType], ids: List[str], populate_existing: bool = False
+    ) -> List[ModelType]:
+        """
+        Загружает объекты одним SELECT ... WHERE id IN (...) в порядке переданных идентификаторов.
+        """
+        query = select(model).where(model.id.in_(ids))
+        if populate_existing:
+            query = query.execution_options(populate_existing=True)
+        result = await self.db_session.execute(query)
+        objects_by_id = {str(obj.id): obj for obj in result.scalars().all()}
+        return [objects_by_id[object_id] for object_id in ids if object_id in objects_by_id]
+
+    async def create_objects(
+        self, model: Type[ModelType], data: List[Union[Dict[str, Any], BaseModel]]
+    ) -> List[ModelType]:
+        """
+        Создает несколько объектов модели одним multi-row INSERT и одним коммитом.
+
+        Созданные строки возвращаются через RETURNING, если диалект его поддерживает (SQLite, MariaDB,
+        PostgreSQL), иначе (MySQL) - одним SELECT по заранее сгенерированным id.
+        Ошибки целостности (дубликаты уникальных полей и т.п.) откатывают всю пачку.
+
+        :param model: Класс модели базы данных.
+        :param data: Список данных для создания объектов.
+        :return: Список созданных объектов в порядке входных данных.
+        :raises HTTPException: Если произошла ошибка базы данных.
+        """
+        try:
+            rows = [self._normalize_row(item) for item in data]
+            if not rows:
+                return []
+
+            for row in rows:
+                row.setdefault("id", str(uuid.uuid4()))
+            ids = [row["id"] for row in rows]
+
+            dialect = self.db_session.get_bind().dialect
+            if dialect.insert_executemany_returning:
+                result = await self.db_session.scalars(insert(model).returning(model), rows)
+                objects_by_id = {str(obj.id): obj for obj in result.all()}
+                objects = [objects_by_id[object_id] for object_id in ids]
+            else:
+                await self.db_session.execute(insert(model), rows)
+                objects = await self._select_by_ids(model, ids)
+
+            await self.db_session.commit()
+            return objects
+        except Exception as e:
+            await self.db_session.rollback()
+            logger.error(f"Error in create_objects method: {e}")
+            ExceptionHandler(e)
+
+    async def update_objects(
+        self, model: Type[ModelType], data: List[Union[Dict[str, Any], BaseModel]]
+    ) -> List[ModelType]:
+        """
+        Обновляет несколько объектов модели одним UPDATE ... SET col = CASE id WHEN ... END
+        WHERE id IN (...) и одним коммитом. Каждая запись должна содержать "id".
+
+        Обновлённые строки возвращаются через RETURNING, если диалект его поддерживает,
+        иначе - одним SELECT. Если часть идентификаторов не найдена, изменения откатываются.
+
+        :param model: Класс модели базы данных.
+        :param data: Список данных для обновления объектов (с полем id).
+        :return: Список обновлённых объектов в порядке входных данных.
+        :raises HTTPException: Если объекты не найдены (404 со списком id) или произошла ошибка базы данных.
+        """
+        try:
+            rows = [self._normalize_row(item) for item in data]
+            if any("id" not in row for row in rows):
+                raise HTTPException(status_code=400, detail="Every item must contain an id.")
+
+            ids = unique_ids(row["id"] for row in rows)
+            if not ids:
+                return []
+
+            # Значения каждой колонки собираются в CASE по id - один запрос на всю пачку.
+            # Ключи WHEN связываются с типом колонки id: иначе они уходят строками (String),
+            # и при хранении id в BINARY(16) ни одна ветка не совпадает - UPDATE молча ничего не меняет
+            values_by_column: Dict[str, Dict[str, Any]] = {}
+            for row in rows:
+                for key, value in row.items():
+                    if key != "id":
+                        values_by_column.setdefault(key, {})[row["id"]] = value
+
+            if not values_by_column:
+                objects = await self._select_by_ids(model, ids)
+            else:
+                statement = (
+                    update(model)
+                    .where(model.id.in_(ids))
+                    .values(
+                        {
+                            getattr(model, column): case(
+                                {
+                                    literal(object_id, type_=model.id.type): literal(
+                                        value, type_=getattr(model, column).type
+                                    )
+                                    for object_id, value in values.items()
+                                },
+                                value=model.id,
+                                else_=getattr(model, column),
+                            )
+                            for column, values in values_by_column.items()
+                        }
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+
+                dialect = self.db_session.get_bind().dialect
+                if dialect.update_returning:
+                    result = await self.db_session.scalars(
+                        statement.returning(model).execution_options(populate_existing=True)
+                    )
+                    objects_by_id = {str(obj.id): obj for obj in result.all()}
+                    objects = [objects_by_id[i] for i in ids if i in objects_by_id]
+                else:
+                    await self.db_session.execute(statement)
+                    objects = await self._select_by_ids(model, ids, populate_existing=True)
+
+            ensure_all_found(model, ids, objects)
+            await self.db_session.commit()
+            return objects
+        except Exception as e:
+            await self.db_session.rollback()
+            logger.error(f"Error in update_objects method: {e}")
+            ExceptionHandler(e)
+
+    async def delete_objects_by_ids(
+        self, model: Type[ModelType], object_ids: Iterable[Union[UUID, str]]
+    ) -> int:
+        """
+        Удаляет несколько объектов модели одним DELETE ... WHERE id IN (...) и одним коммитом.
+
+        Удаление выполняется на уровне SQL, поэтому ORM-каскады не срабатывают - связанные записи
+        должны удаляться внешними ключами (ON DELETE) в базе данных.
+        Если часть идентификаторов не найдена, удаление откатывается.
+
+        :param model: Класс модели базы данных.
+        :param object_ids: Идентификаторы объектов для удаления.
+        :return: Количество удалённых объектов.
+        :raises HTTPException: Если объекты не найдены или произошла ошибка базы данных.
+        """
+        try:
+            ids = unique_ids(object_ids)
+            if not ids:
+                return 0
+
+            statement = delete(model).where(model.id.in_(ids))
+
+            dialect = self.db_session.get_bind().dialect
+            if dialect.delete_returning:
+                result = await self.db_session.execute(statement.returning(model.id))
+                deleted = result.all()
+                ensure_all_found(model, ids, deleted)
+                deleted_count = len(deleted)
+            else:
+                result = await self.db_session.execute(statement)
+                deleted_count = result.rowcount
+                if deleted_count != len(ids):
+                    raise HTTPException(
+                        status_code=404,
+                        detail=f"{model.__name__} not found: "
+                        f"{len(ids) - deleted_count} of {len(ids)} ids do not exist",
+                    )
+
+            await self.db_session.commit()
+            return deleted_count
+        except Exception as e:
+            await self.db_session.rollback()
+            logger.error(f"Error in delete_objects_by_ids method: {e}")
+            ExceptionHandler(e)
@@ -2,11 +2,11 @@ import logging
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.db.models.categories.categories import Categories
 from core.services.base_service import BaseService
+from core.services.reference_data.reference_data import reference_data_cache
 from exceptions.exception_handler import ExceptionHandler
 from utils.custom_pagination import Paginator
 
@@ -22,12 +22,47 @@ class CategoriesService(BaseService):
         self.paginator = Paginator[Categories](db_session=db_session, model=Categories)
 
     async def create_category(self, category_data: Dict[str, Any]) -> Categories:
-        return await self.create_object(
-            model=Categories, data=category_data, unique_fields=["category_name"]
-        )
+        category = await self.create_object(model=Categories, data=category_data)
+        await reference_data_cache.refresh(Categories)
+        return category
 
     async def get_category_by_id(self, category_id: UUID) -> Categories:
-        return await self.get_object_by_id(Categories, category_id)
+        """
+        Получает категорию по ID из кэша справочников (без запроса к БД).
+
+        :param category_id: Идентификатор категории.
+        :return: Объект категории, привязанный к текущей сессии.
+        """
+        try:
+            return await reference_data_cache.get_by_id_or_404(
+                Categories, category_id, self.db_session
+            )
+        except Exception as e:
+            logger.error(f"Error getting category {category_id}: {e}")
+            ExceptionHandler(e)
+
+    async def get_categories_by_ids(self, category_ids: List[UUID]) -> List[Categories]:
+        """
+        Получает несколько категорий по ID из кэша справочников (без запросов к БД).
+
+        :param category_ids: Список идентификаторов.
+        :return: Список объектов, привязанных к текущей сессии.
+        :raises HTTPException: Если часть идентификаторов не найдена (404 со списком всех).
+        """
+        try:
+            return await reference_data_cache.get_by_ids(Categories, category_ids, self.db_session)
+        except Exception as e:
+            logger.error(f"Error getting Categories objects by ids: {e}")
+            ExceptionHandler(e)
+
+    async def get_category_by_name(self, category_name: str) -> Optional[Categories]:
+        """
+        Получает категорию по названию из кэша справочников.
+
+        :param category_name: Название категории.
+        :return: Объект категории или None.
+        """
+        return await reference_data_cache.get_by_name(Categories, category_name, self.db_session)
 
     async def get_categories_list(
         self,
@@ -42,20 +77,17 @@ class CategoriesService(BaseService):
         :return: Словарь с категориями и информацией о пагинации.
         """
         try:
-            filters = None
-            base_query = select(Categories)
+            categories = await reference_data_cache.get_list(Categories)
 
-            response = await self.paginator.paginate_query(
-                base_query=base_query,
+            response = self.paginator.paginate_items(
+                items=categories,
                 next_token=next_token,
-                filters=filters,
                 model_name="items",
                 limit=limit,
             )
 
             return response
         except Exception as e:
-            await self.db_session.rollback()
             logger.error(f"Error getting categories list: {e}")
             ExceptionHandler(e)
 
@@ -69,9 +101,11 @@ class CategoriesService(BaseService):
         :raises HTTPException: Если возникает ошибка целостности данных или внутренняя ошибка сервера.
         """
         try:
-            return await self.update_object(
+            category = await self.update_object(
                 model=Categories, object_id=category_id, data=update_data
             )
+            await reference_data_cache.refresh(Categories)
+            return category
         except Exception as e:
             await self.db_session.rollback()
             logger.error(f"Unexpected error while updating category {category_id}: {e}")
@@ -80,6 +114,7 @@ class CategoriesService(BaseService):
     async def delete_category(self, category_id: UUID) -> None:
         try:
             await self.delete_object_by_id(Categories, category_id)
+            await reference_data_cache.refresh(Categories)
         except Exception as e:
             await self.db_session.rollback()
             logger.error(f"Unexpected error while deleting category {category_id}: {e}")
@@ -0,0 +1,420 @@
+""" Interaction write-behind buffer module """
+
+import asyncio
+import glob
+import json
+import logging
+import os
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from configuration.config import settings
+from configuration.database import AsyncSessionLocal
+from core.db.models.users.user_interaction import UserInteraction
+from core.db.models.users.users import User
+from core.schemas.user_interaction.user_interaction_schema import InteractionType
+from core.services.base_service import BaseService
+from core.services.mutual_match.mutual_match import MutualMatchService
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _pairs(rows: List[Dict[str, Any]], interaction_type: InteractionType) -> List[Tuple[str, str]]:
+    return [
+        (row["user_id"], row["target_user_id"])
+        for row in rows
+        if row["interaction_type"] == interaction_type.value
+    ]
+
+
+class InteractionWriteBuffer:
+    """
+    Write-behind буфер для свайпов (UserInteraction).
+
+    Вместо INSERT + COMMIT на каждый свайп запись получает id сразу, ставится в очередь
+    процесса и подтверждается клиенту; фоновая задача сбрасывает очередь в БД одним
+    multi-row INSERT раз в `flush_interval_ms` или как только набралось `max_batch_size` записей.
+
+    Надёжность:
+    - без spill-файла записи, не успевшие попасть в БД, теряются только при падении процесса -
+      при штатной остановке (stop) очередь сбрасывается полностью;
+    - со spill-файлом каждая запись до подтверждения дописывается в append-only JSONL-файл
+      (опционально с fsync). Файл очищается, когда все записи из него оказались в БД, а при
+      старте (start) остаток файла дозаписывается. Вставка идёт upsert-ом (см. _insert_rows),
+      поэтому повторная дозапись уже сохранённых строк безопасна.
+
+    Spill-файл у каждого процесса свой: `<spill_path>.<pid>`, поэтому воркеры uvicorn не
+    затирают чужие записи. При старте процесс забирает свои файлы и файлы завершившихся
+    процессов (переименованием - один файл достаётся ровно одному воркеру). Каталог spill-файлов
+    должен быть локальным для хоста/контейнера: живость владельца проверяется по pid.
+
+    Свайп подтверждается только после проверки, что оба пользователя существуют: отброшенными
+    при сбросе могут оказаться лишь свайпы пользователей, удалённых за время интервала сброса
+    (их свайпы всё равно удалило бы каскадом).
+
+    Буфер локален для процесса: список просмотренных пользователей в матчинге может отставать
+    от свайпов на время одного интервала сброса; created_at проставляется базой при сбросе.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+        flush_interval_ms: int = 50,
+        max_batch_size: int = 500,
+        max_pending: int = 50_000,
+        spill_path: Optional[str] = None,
+        spill_fsync: bool = False,
+    ):
+        """
+        :param session_factory: Фабрика сессий для фоновой записи (primary).
+        :param flush_interval_ms: Максимальная задержка записи в БД, мс.
+        :param max_batch_size: Размер пачки, при котором сброс запускается не дожидаясь интервала.
+        :param max_pending: Максимальное количество ожидающих записей; сверх него свайпы
+            отклоняются с 503, пока БД не догонит.
+        :param spill_path: Путь к append-only файлу для записей, ещё не попавших в БД.
+        :param spill_fsync: Делать fsync после каждой записи в spill-файл.
+        """
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_batch_size = max_batch_size
+        self.max_pending = max_pending
+        self.spill_path = spill_path
+        self.spill_fsync = spill_fsync
+
+        self._pending: List[Dict[str, Any]] = []
+        self._spill_lock = asyncio.Lock()
+        self._flush_lock = asyncio.Lock()
+        self._batch_ready = asyncio.Event()
+        self._stopping = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+
+        self.submitted = 0
+        self.flushed = 0
+        self.flushes = 0
+        self.dropped = 0
+
+    @property
+    def running(self) -> bool:
+        return self._flush_task is not None and not self._flush_task.done()
+
+    def stats(self) -> Dict[str, Any]:
+        """Счётчики буфера: сколько свайпов принято, записано и сколькими INSERT-ами."""
+        return {
+            "pending": len(self._pending),
+            "submitted": self.submitted,
+            "flushed": self.flushed,
+            "flushes": self.flushes,
+            "dropped": self.dropped,
+            "rows_per_flush": self.flushed / self.flushes if self.flushes else 0.0,
+        }
+
+    def pending_for_user(self, user_id: str) -> Dict[str, str]:
+        """
+        Свайпы пользователя, ещё не записанные в БД.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Словарь target_user_id -> id взаимодействия.
+        """
+        user_id = str(user_id)
+        return {
+            row["target_user_id"]: row["id"] for row in self._pending if row["user_id"] == user_id
+        }
+
+    def _own_spill_path(self) -> str:
+        return f"{self.spill_path}.{os.getpid()}"
+
+    def _append_spill(self, lines: str) -> None:
+        with open(self._own_spill_path(), "a", encoding="utf-8") as spill_file:
+            spill_file.write(lines)
+            if self.spill_fsync:
+                spill_file.flush()
+                os.fsync(spill_file.fileno())
+
+    def _claim_spill_files(self) -> List[str]:
+        """
+        Собирает spill-файлы, которые должен дозаписать этот процесс: свои
+        (`<spill_path>.<pid>[.<suffix>]`), файлы завершившихся процессов и общий файл
+        `<spill_path>` старого формата. Чужие файлы забираются атомарным переименованием
+        в `<spill_path>.<pid>.<suffix>` - если файл уже забрал другой воркер, он пропускается.
+        """
+        pid = str(os.getpid())
+        own_path = self._own_spill_path()
+        claimed = []
+        for path in sorted(glob.glob(f"{glob.escape(self.spill_path)}*")):
+            if path == own_path:
+                continue
+            suffix = path[len(self.spill_path) :]
+            if suffix:
+                owner = suffix.lstrip(".").split(".", 1)[0]
+                if not suffix.startswith(".") or not owner.isdigit():
+                    continue
+                if owner == pid:
+                    claimed.append(path)
+                    continue
+                if _pid_alive(int(owner)):
+                    continue
+
+            target = f"{own_path}.{uuid.uuid4().hex}"
+            try:
+                os.rename(path, target)
+            except FileNotFoundError:
+                continue
+            claimed.append(target)
+        return claimed
+
+    def _recover_spill(self) -> List[Dict[str, Any]]:
+        """
+        Переносит забранные файлы в собственный spill-файл и возвращает все его записи.
+        Повторы строк безопасны: вставка идёт upsert-ом.
+        """
+        for path in self._claim_spill_files():
+            with open(path, encoding="utf-8") as claimed_file:
+                content = claimed_file.read()
+            if content and not content.endswith("\n"):
+                content += "\n"
+            if content:
+                self._append_spill(content)
+            os.remove(path)
+        return self._read_spill()
+
+    def _read_spill(self) -> List[Dict[str, Any]]:
+        if not os.path.exists(self._own_spill_path()):
+            return []
+        rows = []
+        with open(self._own_spill_path(), encoding="utf-8") as spill_file:
+            for line in spill_file:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    rows.append(json.loads(line))
+                except ValueError:
+                    # Недописанная последняя строка после падения процесса
+                    logger.error(f"Skipping corrupted interaction spill line: {line[:200]}")
+        return rows
+
+    def _truncate_spill(self) -> None:
+        # Только свой файл: записи других воркеров лежат в их файлах
+        with open(self._own_spill_path(), "w", encoding="utf-8"):
+            pass
+
+    async def submit(self, data: Dict[str, Any], db_session: AsyncSession) -> UserInteraction:
+        """
+        Принимает свайп в буфер (см. submit_many).
+
+        :param data: Данные взаимодействия (user_id, target_user_id, interaction_type).
+        :param db_session: Сессия запроса для проверки пользователей.
+        :return: Несохранённый (transient) объект UserInteraction с уже назначенным id.
+        :raises HTTPException: 503, если очередь переполнена; 404, если пользователь не найден.
+        """
+        return (await self.submit_many([data], db_session))[0]
+
+    async def submit_many(
+        self, rows: List[Dict[str, Any]], db_session: AsyncSession
+    ) -> List[UserInteraction]:
+        """
+        Принимает пачку свайпов в буфер.
+
+        До подтверждения одним лёгким запросом проверяется, что все пользователи существуют, -
+        иначе свайп был бы подтверждён клиенту и молча отброшен при сбросе (нарушение FK).
+
+        :param rows: Данные взаимодействий (user_id, target_user_id, interaction_type).
+        :param db_session: Сессия запроса для проверки пользователей.
+        :return: Несохранённые (transient) объекты UserInteraction с уже назначенными id.
+        :raises HTTPException: 503, если очередь переполнена; 404, если пользователь не найден.
+        """
+        if len(self._pending) + len(rows) > self.max_pending:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Interaction buffer is full, retry later.",
+            )
+
+        rows = [
+            {
+                key: str(value) if isinstance(value, uuid.UUID) else value
+                for key, value in data.items()
+            }
+            for data in rows
+        ]
+        for row in rows:
+            row.setdefault("id", str(uuid.uuid4()))
+
+        user_ids = {row[key] for row in rows for key in ("user_id", "target_user_id")}
+        if user_ids:
+            result = await db_session.execute(select(User.id).where(User.id.in_(user_ids)))
+            if len(set(result.scalars().all())) != len(user_ids):
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found.")
+
+        async with self._spill_lock:
+            if self.spill_path and rows:
+                await asyncio.to_thread(
+                    self._append_spill, "".join(json.dumps(row) + "\n" for row in rows)
+                )
+            self._pending.extend(rows)
+
+        self.submitted += len(rows)
+        if len(self._pending) >= self.max_batch_size:
+            self._batch_ready.set()
+
+        return [UserInteraction(**row) for row in rows]
+
+    async def _write_rows(self, session: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+        # Итог определяет последний свайп пары в пачке - как при отправке свайпов по одному
+        final_rows = list({(row["user_id"], row["target_user_id"]): row for row in rows}.values())
+        await BaseService(session).upsert_rows(
+            UserInteraction,
+            final_rows,
+            conflict_columns=["user_id", "target_user_id"],
+            update_columns=["interaction_type"],
+        )
+
+        mutual_match_service = MutualMatchService(session)
+        await mutual_match_service.record_matches(_pairs(final_rows, InteractionType.MATCH))
+        await mutual_match_service.remove_matches(_pairs(final_rows, InteractionType.REJECT))
+
+    async def _insert_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Пишет пачку одним upsert-ом по (user_id, target_user_id) (BaseService.upsert_rows), как и
+        одиночный create_user_interaction и пакетный submit_swipes: повторный свайп пары меняет
+        interaction_type, а повторная дозапись строки из spill-файла ничего не меняет.
+
+        Если пачка не проходит по ограничениям (например, пользователь удалён),
+        строки пишутся по одной, а невалидные отбрасываются с логом.
+        """
+        async with self.session_factory() as session:
+            try:
+                await self._write_rows(session, rows)
+                await session.commit()
+                return
+            except IntegrityError as e:
+                await session.rollback()
+                logger.error(f"Interaction batch rejected, retrying row by row: {e}")
+
+            for row in rows:
+                try:
+                    await self._write_rows(session, [row])
+                    await session.commit()
+                except IntegrityError as e:
+                    await session.rollback()
+                    self.dropped += 1
+                    logger.error(f"Dropping buffered interaction {row['id']}: {e}")
+
+    async def flush(self) -> int:
+        """
+        Сбрасывает в БД всё, что накопилось, пачками по max_batch_size.
+
+        При ошибке БД (кроме нарушений ограничений) или отмене задачи записи возвращаются
+        в начало очереди, и сброс повторяется на следующем тике. Пачка, которая успела
+        закоммититься перед отменой, запишется повторно - вставка идёт upsert-ом, это безопасно.
+        Spill-файл очищается только когда очередь пуста, то есть все записи из него в БД.
+
+        :return: Количество записанных строк.
+        """
+        async with self._flush_lock:
+            written = 0
+            while self._pending:
+                batch = self._pending[: self.max_batch_size]
+                del self._pending[: len(batch)]
+                try:
+                    await self._insert_rows(batch)
+                except BaseException:
+                    # CancelledError - не Exception: без этого пачка терялась бы при отмене
+                    self._pending[:0] = batch
+                    raise
+                written += len(batch)
+                self.flushed += len(batch)
+                self.flushes += 1
+
+            if self.spill_path:
+                async with self._spill_lock:
+                    # Новые записи могли прийти во время INSERT - тогда файл ещё нужен
+                    if not self._pending:
+                        await asyncio.to_thread(self._truncate_spill)
+            return written
+
+    async def _flush_loop(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._batch_ready.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._batch_ready.clear()
+
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Interaction buffer flush failed, will retry: {e}")
+
+    async def start(self) -> None:
+        """
+        Дозаписывает остаток spill-файла и запускает фоновый сброс. Вызывать в startup-событии.
+        """
+        if self.spill_path:
+            recovered = await asyncio.to_thread(self._recover_spill)
+            if recovered:
+                logger.info(f"Recovering {len(recovered)} buffered interaction(s) from spill file.")
+                self._pending[:0] = recovered
+                try:
+                    await self.flush()
+                except Exception as e:
+                    # БД недоступна - записи остаются в очереди и файле, их допишет фоновый сброс
+                    logger.error(f"Failed to flush recovered interactions: {e}")
+
+        if not self.running:
+            self._stopping.clear()
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """
+        Останавливает фоновый сброс и записывает в БД всё, что осталось. Вызывать в shutdown-событии.
+
+        Фоновая задача не отменяется посреди INSERT: она получает сигнал остановки, завершает
+        текущий сброс и выходит, после чего остаток очереди сбрасывается здесь.
+        """
+        started = time.perf_counter()
+        if self._flush_task is not None:
+            self._stopping.set()
+            self._batch_ready.set()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        try:
+            await self.flush()
+        except Exception as e:
+            kept = f" (kept in {self._own_spill_path()})" if self.spill_path else ""
+            logger.error(
+                f"Failed to flush {len(self._pending)} buffered interaction(s) on shutdown{kept}: {e}"
+            )
+        logger.info(
+            f"Interaction buffer stopped in {(time.perf_counter() - started) * 1000:.0f} ms: "
+            f"{self.stats()}"
+        )
+
+
+interaction_write_buffer = InteractionWriteBuffer(
+    flush_interval_ms=settings.interaction_buffer_flush_interval_ms,
+    max_batch_size=settings.interaction_buffer_max_batch_size,
+    max_pending=settings.interaction_buffer_max_pending,
+    spill_path=settings.interaction_buffer_spill_path,
+    spill_fsync=settings.interaction_buffer_spill_fsync,
+)
@@ -0,0 +1,161 @@
+""" Mutual match service module """
+
+import logging
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+from uuid import UUID
+
+from sqlalchemy import delete, insert, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.db.models.users.mutual_match import MutualMatch
+from core.db.models.users.user_interaction import UserInteraction
+from core.schemas.user_interaction.user_interaction_schema import InteractionType
+from core.services.base_service import BaseService
+from exceptions.exception_handler import ExceptionHandler
+from utils.custom_pagination import Paginator
+from utils.enums.sort_direction import SortDirection
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+Pair = Tuple[str, str]
+
+
+def _unique_pairs(pairs: Iterable[Tuple[Union[UUID, str], Union[UUID, str]]]) -> List[Pair]:
+    """Пары (user_id, target_user_id) строками, без повторов и без свайпов на самого себя."""
+    return list(
+        dict.fromkeys(
+            (str(user_id), str(target_id)) for user_id, target_id in pairs if user_id != target_id
+        )
+    )
+
+
+class MutualMatchService(BaseService):
+    """
+    Сервис взаимных мэтчей.
+
+    Таблица mutual_match пополняется в момент создания MATCH: встречный MATCH ищется
+    точечным запросом по индексу (user_id, target_user_id) для всей пачки новых свайпов сразу,
+    а не self-join по всей user_interaction. Методы записи не коммитят - они выполняются
+    в транзакции вызывающего сервиса.
+    """
+
+    def __init__(self, db_session: AsyncSession):
+        super().__init__(db_session)
+        # Сначала новые мэтчи: обратный проход по индексу (user_id, created_at, id)
+        self.paginator = Paginator[MutualMatch](
+            db_session=db_session,
+            model=MutualMatch,
+            sort_keys=[
+                (MutualMatch.created_at, SortDirection.DESC),
+                (MutualMatch.id, SortDirection.DESC),
+            ],
+        )
+
+    async def record_matches(
+        self, pairs: Iterable[Tuple[Union[UUID, str], Union[UUID, str]]]
+    ) -> int:
+        """
+        Регистрирует взаимные мэтчи для новых MATCH-свайпов.
+
+        :param pairs: Пары (user_id, target_user_id) только что созданных MATCH-взаимодействий.
+        :return: Количество новых взаимных мэтчей (пар пользователей).
+        """
+        pairs = _unique_pairs(pairs)
+        if not pairs:
+            return 0
+
+        result = await self.db_session.execute(
+            select(UserInteraction.user_id, UserInteraction.target_user_id).where(
+                UserInteraction.interaction_type == InteractionType.MATCH.value,
+                tuple_(UserInteraction.user_id, UserInteraction.target_user_id).in_(
+                    [(target_id, user_id) for user_id, target_id in pairs]
+                ),
+            )
+        )
+        # Встречный свайп (B -> A) делает взаимной пару (A, B); обе стороны из одной пачки
+        # дают одну и ту же пару, поэтому ключ - неупорядоченный
+        matched: Set[frozenset] = {
+            frozenset((str(user_id), str(target_id))) for user_id, target_id in result.all()
+        }
+        if not matched:
+            return 0
+
+        rows = []
+        for pair in matched:
+            first, second = sorted(pair)
+            rows.append({"id": str(uuid.uuid4()), "user_id": first, "matched_user_id": second})
+            rows.append({"id": str(uuid.uuid4()), "user_id": second, "matched_user_id": first})
+
+        await self.db_session.execute(
+            insert(MutualMatch)
+            .prefix_with("IGNORE", dialect="mysql")
+            .prefix_with("OR IGNORE", dialect="sqlite")
+            .values(rows)
+        )
+        return len(matched)
+
+    async def remove_matches(
+        self, pairs: Iterable[Tuple[Union[UUID, str], Union[UUID, str]]]
+    ) -> int:
+        """
+        Удаляет взаимные мэтчи пар (обе строки каждой пары), например после отмены MATCH.
+
+        :param pairs: Пары (user_id, target_user_id), переставшие быть MATCH.
+        :return: Количество удалённых строк mutual_match.
+        """
+        pairs = _unique_pairs(pairs)
+        if not pairs:
+            return 0
+
+        columns = tuple_(MutualMatch.user_id, MutualMatch.matched_user_id)
+        result = await self.db_session.execute(
+            delete(MutualMatch).where(
+                or_(
+                    columns.in_(pairs),
+                    columns.in_([(target_id, user_id) for user_id, target_id in pairs]),
+                )
+            )
+        )
+        return result.rowcount
+
+    async def is_mutual_match(self, user_id: UUID, other_user_id: UUID) -> bool:
+        """
+        Проверяет взаимный мэтч двух пользователей (поиск по уникальному индексу).
+
+        :param user_id: Идентификатор первого пользователя.
+        :param other_user_id: Идентификатор второго пользователя.
+        :return: True, если оба поставили друг другу MATCH.
+        """
+        result = await self.db_session.execute(
+            select(MutualMatch.id).where(
+                MutualMatch.user_id == str(user_id),
+                MutualMatch.matched_user_id == str(other_user_id),
+            )
+        )
+        return result.first() is not None
+
+    async def get_user_matches(
+        self, user_id: UUID, limit: int = 10, next_token: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Возвращает взаимные мэтчи пользователя, начиная с новых, с keyset-пагинацией по (created_at, id).
+
+        :param user_id: Идентификатор пользователя.
+        :param limit: Количество записей на странице.
+        :param next_token: Токен для продолжения пагинации.
+        :return: Словарь с мэтчами, признаком следующей страницы и next_token.
+        """
+        try:
+            return await self.paginator.paginate_query(
+                base_query=select(MutualMatch),
+                filters=MutualMatch.user_id == str(user_id),
+                next_token=next_token,
+                model_name="matches",
+                limit=limit,
+            )
+        except Exception as e:
+            await self.db_session.rollback()
+            logger.error(f"Error getting mutual matches for user {user_id}: {e}")
+            ExceptionHandler(e)
@@ -0,0 +1,103 @@
+""" Password hashing service module """
+
+import asyncio
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+from passlib.hash import bcrypt
+
+from configuration.config import settings
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+def _hash_password(password: str, rounds: int) -> str:
+    return bcrypt.using(rounds=rounds).hash(password)
+
+
+def _verify_password(password: str, password_hash: str) -> bool:
+    return bcrypt.verify(password, password_hash)
+
+
+class PasswordHashingService:
+    """
+    Асинхронный сервис хеширования паролей.
+
+    bcrypt - CPU-bound операция (~100-300 мс), поэтому она выполняется в ограниченном пуле
+    потоков (или процессов), а не в event loop. Семафор ограничивает количество одновременных
+    хеширований, чтобы всплеск регистраций не съедал все ядра и не копил бесконечную очередь.
+    """
+
+    def __init__(
+        self,
+        rounds: int = 12,
+        max_workers: int = 4,
+        max_concurrency: int = 16,
+        use_processes: bool = False,
+    ):
+        """
+        Инициализирует экземпляр PasswordHashingService.
+
+        :param rounds: Work factor bcrypt (log2 количества раундов).
+        :param max_workers: Размер пула потоков/процессов.
+        :param max_concurrency: Максимальное количество одновременных операций (включая ожидающие в пуле).
+        :param use_processes: Использовать ProcessPoolExecutor вместо ThreadPoolExecutor.
+        """
+        self.rounds = rounds
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.use_processes:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="password-hashing"
+                )
+        return self._executor
+
+    async def hash(self, password: str) -> str:
+        """
+        Хеширует пароль вне event loop.
+
+        :param password: Пароль в открытом виде.
+        :return: bcrypt-хеш пароля.
+        """
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_executor(), _hash_password, password, self.rounds
+            )
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        """
+        Проверяет соответствие пароля и хеша вне event loop.
+
+        :param password: Введенный пароль.
+        :param password_hash: Сохраненный хеш.
+        :return: True, если пароли совпадают, иначе False.
+        """
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_executor(), _verify_password, password, password_hash
+            )
+
+    def shutdown(self) -> None:
+        """Останавливает пул. Вызывать в shutdown-событии приложения."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hashing_service = PasswordHashingService(
+    rounds=settings.password_hash_rounds,
+    max_workers=settings.password_hash_max_workers,
+    max_concurrency=settings.password_hash_max_concurrency,
+    use_processes=settings.password_hash_use_processes,
+)
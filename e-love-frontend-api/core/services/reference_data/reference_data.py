@@ -0,0 +1,230 @@
+""" Reference data cache module """
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Type, TypeVar
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import lazyload
+
+from configuration.config import settings
+from configuration.database import AsyncSessionLocal
+from core.db.models.categories.categories import Categories
+from core.db.models.users.user_gender import UserGender
+from core.db.models.users.user_role import UserRole
+from core.db.models.users.user_status import UserStatus
+from core.services.base_service import BaseService, unique_ids
+
+ModelType = TypeVar("ModelType")
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+@dataclass
+class ReferenceTable:
+    """
+    Снимок одной справочной таблицы.
+
+    Атрибуты:
+        name_field (str): Поле с уникальным названием записи (category_name, role_name, ...).
+        version (int): Версия снимка, увеличивается при каждой перезагрузке.
+        loaded_at (float): Момент загрузки (time.monotonic) или 0, если таблица не загружена.
+        items (List[Any]): Записи, отсортированные по (created_at, id) - как в Paginator.
+        by_id (Dict[str, Any]): Индекс id -> запись.
+        by_name (Dict[str, Any]): Индекс название -> запись.
+    """
+
+    name_field: str
+    version: int = 0
+    loaded_at: float = 0.0
+    items: List[Any] = field(default_factory=list)
+    by_id: Dict[str, Any] = field(default_factory=dict)
+    by_name: Dict[str, Any] = field(default_factory=dict)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class ReferenceDataCache:
+    """
+    In-process кэш маленьких, почти статичных справочников: категории, гендеры, роли и статусы.
+
+    Таблицы загружаются целиком при старте приложения и перезагружаются после каждой записи
+    через соответствующие сервисы. Поиск по id и по названию - обращение к словарю, без запросов к БД;
+    только id, которых нет в снимке, дочитываются из БД одним IN-запросом (get_by_ids).
+    Кэш локален для процесса, поэтому снимок дополнительно устаревает через `ttl` секунд,
+    чтобы uvicorn-воркеры сходились к изменениям, сделанным в соседних процессах.
+
+    Таблицы читаются отдельной короткой сессией primary, поэтому кэш хранит отсоединённые
+    (detached) ORM-объекты только с колонками и не зависит от сессии запроса.
+    Для использования в конкретной сессии (например, добавить категорию пользователю)
+    объект вливается в неё через session.merge(load=False) - без запроса к БД.
+
+    Связи (Categories.users, Categories.posts, ...) в снимке именно не загружены, а не пусты:
+    после merge их нужно явно дочитать (session.refresh(obj, attribute_names=["users"])),
+    а не получить молча пустой список.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+        ttl: float = 300.0,
+    ):
+        """
+        :param session_factory: Фабрика сессий, из которой загружаются справочники (primary).
+        :param ttl: Время жизни снимка таблицы в секундах (0 - без ограничения).
+        """
+        self.session_factory = session_factory
+        self.ttl = ttl
+        self._tables: Dict[type, ReferenceTable] = {
+            Categories: ReferenceTable(name_field="category_name"),
+            UserGender: ReferenceTable(name_field="gender_name"),
+            UserRole: ReferenceTable(name_field="role_name"),
+            UserStatus: ReferenceTable(name_field="status_name"),
+        }
+
+    def _get_table(self, model: Type[ModelType]) -> ReferenceTable:
+        table = self._tables.get(model)
+        if table is None:
+            raise KeyError(f"{model.__name__} is not a cached reference table")
+        return table
+
+    def _is_fresh(self, table: ReferenceTable) -> bool:
+        if not table.loaded_at:
+            return False
+        return not self.ttl or time.monotonic() - table.loaded_at < self.ttl
+
+    def version(self, model: Type[ModelType]) -> int:
+        """Текущая версия снимка таблицы."""
+        return self._get_table(model).version
+
+    async def refresh(self, model: Type[ModelType]) -> None:
+        """
+        Перезагружает таблицу одним запросом и увеличивает её версию.
+        Вызывается сервисами после каждой записи в справочник.
+
+        :param model: Модель справочника.
+        """
+        table = self._get_table(model)
+        async with table.lock:
+            await self._load(model, table)
+
+    async def _load(self, model: Type[ModelType], table: ReferenceTable) -> None:
+        async with self.session_factory() as session:
+            # lazyload, а не noload: noload заполнил бы коллекции пустыми списками,
+            # и merge(load=False) перенёс бы их в сессию запроса как загруженные
+            result = await session.execute(
+                select(model).options(lazyload("*")).order_by(model.created_at, model.id)
+            )
+            items = list(result.scalars().all())
+            session.expunge_all()
+
+        table.items = items
+        table.by_id = {str(item.id): item for item in items}
+        table.by_name = {getattr(item, table.name_field): item for item in items}
+        table.loaded_at = time.monotonic()
+        table.version += 1
+        logger.info(f"{model.__name__} reference data loaded (v{table.version}, {len(items)} rows)")
+
+    async def _ensure_loaded(self, model: Type[ModelType]) -> ReferenceTable:
+        table = self._get_table(model)
+        if self._is_fresh(table):
+            return table
+        async with table.lock:
+            if not self._is_fresh(table):
+                await self._load(model, table)
+        return table
+
+    async def load_all(self) -> None:
+        """Загружает все справочники (вызывается при старте приложения)."""
+        for model in self._tables:
+            await self.refresh(model)
+
+    def invalidate(self, model: Optional[Type[ModelType]] = None) -> None:
+        """
+        Помечает таблицу (или все таблицы) устаревшей - следующий доступ перезагрузит её.
+        """
+        tables = [self._get_table(model)] if model is not None else self._tables.values()
+        for table in tables:
+            table.loaded_at = 0.0
+
+    async def get_list(self, model: Type[ModelType]) -> List[ModelType]:
+        """
+        Возвращает все записи справочника (отсортированы по created_at, id).
+        Объекты отсоединены от сессий и предназначены только для чтения/сериализации.
+        """
+        table = await self._ensure_loaded(model)
+        return list(table.items)
+
+    async def get_by_id(
+        self, model: Type[ModelType], object_id: UUID | str, db_session: AsyncSession
+    ) -> Optional[ModelType]:
+        """
+        Возвращает запись по id, привязанную к переданной сессии, или None.
+        """
+        table = await self._ensure_loaded(model)
+        item = table.by_id.get(str(object_id))
+        if item is None:
+            return None
+        return await db_session.merge(item, load=False)
+
+    async def get_by_id_or_404(
+        self, model: Type[ModelType], object_id: UUID | str, db_session: AsyncSession
+    ) -> ModelType:
+        """
+        То же, что get_by_id, но при отсутствии записи в снимке она ищется в БД (см. get_by_ids),
+        а если её нет и там - HTTPException 404.
+        """
+        items = await self.get_by_ids(model, [object_id], db_session)
+        return items[0]
+
+    async def get_by_ids(
+        self, model: Type[ModelType], object_ids: Iterable[UUID | str], db_session: AsyncSession
+    ) -> List[ModelType]:
+        """
+        Возвращает записи по списку id (дубли игнорируются), привязанные к переданной сессии.
+
+        Id, которых нет в снимке (запись могла появиться в соседнем воркере после загрузки),
+        дочитываются одним запросом через BaseService.get_objects_by_ids, а снимок помечается
+        устаревшим. Без промахов запросов к БД нет.
+
+        :raises HTTPException: 404 со списком всех ненайденных id.
+        """
+        table = await self._ensure_loaded(model)
+        ids = unique_ids(object_ids)
+
+        missing_ids = [object_id for object_id in ids if object_id not in table.by_id]
+        loaded: Dict[str, Any] = {}
+        if missing_ids:
+            objects = await BaseService(db_session).get_objects_by_ids(
+                model, missing_ids, options=[lazyload("*")]
+            )
+            loaded = {str(obj.id): obj for obj in objects}
+            self.invalidate(model)
+
+        return [
+            (
+                loaded[object_id]
+                if object_id in loaded
+                else await db_session.merge(table.by_id[object_id], load=False)
+            )
+            for object_id in ids
+        ]
+
+    async def get_by_name(
+        self, model: Type[ModelType], name: str, db_session: AsyncSession
+    ) -> Optional[ModelType]:
+        """
+        Возвращает запись по уникальному названию, привязанную к переданной сессии, или None.
+        """
+        table = await self._ensure_loaded(model)
+        item = table.by_name.get(name)
+        if item is None:
+            return None
+        return await db_session.merge(item, load=False)
+
+
+reference_data_cache = ReferenceDataCache(ttl=settings.reference_data_cache_ttl)
@@ -9,8 +9,10 @@ from core.db.models.categories.categories import Categories
 from core.db.models.intermediate_models.user_categories import user_categories_table
 from core.db.models.users.users import User
 from core.services.categories.categories import CategoriesService
+from core.services.users.loading_profiles import UserLoadingProfile
 from core.services.users.users import UserService
 from exceptions.exception_handler import ExceptionHandler
+from utils.functions.link_table import delete_links, insert_links, replace_links
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -37,7 +39,9 @@ class UserCategoriesAssociationService:
         :raises HTTPException: Если пользователь не найден или произошла ошибка базы данных.
         """
         try:
-            user = await self.user_service.get_user_by_id(user_id=user_id)
+            user = await self.user_service.get_user_by_id(
+                user_id, profile=UserLoadingProfile.MINIMAL, include=[User.categories]
+            )
 
             return user.categories
 
@@ -52,18 +56,25 @@ class UserCategoriesAssociationService:
 
         :param user_id: Идентификатор пользователя.
         :param category_id: Идентификатор категории.
-        :raises HTTPException: Если пользователь или катгеория не найдены, или произошла ошибка базы данных.
+        :raises HTTPException: Если пользователь или категорию не найдены, или произошла ошибка базы данных.
         """
         try:
-            user = await self.user_service.get_user_by_id(user_id)
+            await self.user_service.ensure_object_exists(User, user_id)
             category = await self.category_service.get_category_by_id(category_id)
 
-            if category in user.categories:
+            inserted = await insert_links(
+                self.db_session,
+                user_categories_table,
+                "user_id",
+                user_id,
+                "category_id",
+                [category.id],
+            )
+            if not inserted:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="This user already has this category",
                 )
-            user.categories.append(category)
             await self.db_session.commit()
         except Exception as e:
             await self.db_session.rollback()
@@ -71,21 +82,31 @@ class UserCategoriesAssociationService:
             ExceptionHandler(e)
 
     async def add_categories_to_user(self, user_id: UUID, category_ids: List[UUID]) -> None:
+        """
+        Добавляет несколько категорий пользователю одним INSERT IGNORE. (BULK)
+
+        :param user_id: Идентификатор пользователя.
+        :param category_ids: Список идентификаторов категорий.
+        :raises HTTPException: Если пользователь или категории не найдены, или произошла ошибка базы данных.
+        """
         try:
-            user = await self.user_service.get_user_by_id(user_id)
-            categories_to_add = []
-            for category_id in set(category_ids):
-                category = await self.category_service.get_category_by_id(category_id)
-                if category not in user.categories:
-                    categories_to_add.append(category)
-            if categories_to_add:
-                user.categories.extend(categories_to_add)
-                await self.db_session.commit()
-            else:
+            await self.user_service.ensure_object_exists(User, user_id)
+            categories = await self.category_service.get_categories_by_ids(category_ids)
+
+            inserted = await insert_links(
+                self.db_session,
+                user_categories_table,
+                "user_id",
+                user_id,
+                "category_id",
+                [category.id for category in categories],
+            )
+            if not inserted:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="This user already has these categories",
                 )
+            await self.db_session.commit()
         except Exception as e:
             await self.db_session.rollback()
             logger.error(f"Error adding categories to user: {e}")
@@ -93,22 +114,27 @@ class UserCategoriesAssociationService:
 
     async def update_user_categories(self, user_id: UUID, new_categories_ids: List[UUID]) -> None:
         """
-        Обновляет категории пользователя, заменяя существующие на новые. (>1)
+        Обновляет категории пользователя, заменяя существующие на новые.
+
+        Разница применяется напрямую к user_categories: DELETE ... NOT IN и INSERT IGNORE -
+        два запроса независимо от размера коллекции, без загрузки связи user.categories.
 
         :param user_id: Идентификатор пользователя.
         :param new_categories_ids: Список идентификаторов новых категорий.
         :raises HTTPException: Если пользователь или категории не найдены, или произошла ошибка базы данных.
         """
         try:
-            new_categories_ids = list(set(new_categories_ids))
-            user = await self.user_service.get_user_by_id(user_id)
-
-            categories = []
-            for category_id in new_categories_ids:
-                category = await self.category_service.get_category_by_id(category_id)
-                categories.append(category)
-
-            user.categories = categories
+            await self.user_service.ensure_object_exists(User, user_id)
+            categories = await self.category_service.get_categories_by_ids(new_categories_ids)
+
+            await replace_links(
+                self.db_session,
+                user_categories_table,
+                "user_id",
+                user_id,
+                "category_id",
+                [category.id for category in categories],
+            )
             await self.db_session.commit()
 
         except Exception as e:
@@ -122,18 +148,25 @@ class UserCategoriesAssociationService:
 
         :param user_id: Идентификатор пользователя.
         :param category_id: Идентификатор категории.
-        :raises HTTPException: Если пользователь или категория не найдены, или произошла ошибка базы данных.
+        :raises HTTPException: Если пользователь или категорию не найдены, или произошла ошибка базы данных.
         """
         try:
-            user = await self.user_service.get_user_by_id(user_id)
+            await self.user_service.ensure_object_exists(User, user_id)
             category = await self.category_service.get_category_by_id(category_id)
 
-            if category not in user.categories:
+            deleted = await delete_links(
+                self.db_session,
+                user_categories_table,
+                "user_id",
+                user_id,
+                "category_id",
+                target_ids=[category.id],
+            )
+            if not deleted:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="This user doesn't have this category",
                 )
-            user.categories.remove(category)
             await self.db_session.commit()
         except Exception as e:
             await self.db_session.rollback()
@@ -1,14 +1,14 @@
 """ User gender service module """
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.db.models.users.user_gender import UserGender
 from core.services.base_service import BaseService
+from core.services.reference_data.reference_data import reference_data_cache
 from exceptions.exception_handler import ExceptionHandler
 
 logger = logging.getLogger(__name__)
@@ -33,18 +33,47 @@ class UserGenderService(BaseService):
         :param gender_data: Словарь с данными гендера.
         :return: Созданный объект гендера пользователя.
         """
-        return await self.create_object(
-            model=UserGender, data=gender_data, unique_fields=["gender_name"]
-        )
+        gender = await self.create_object(model=UserGender, data=gender_data)
+        await reference_data_cache.refresh(UserGender)
+        return gender
 
     async def get_gender_by_id(self, gender_id: UUID) -> UserGender:
         """
-        Получает гендер пользователя по его ID.
+        Получает гендер пользователя по его ID из кэша справочников (без запроса к БД).
 
         :param gender_id: Идентификатор гендера.
-        :return: Объект гендера пользователя.
+        :return: Объект гендера пользователя, привязанный к текущей сессии.
         """
-        return await self.get_object_by_id(UserGender, gender_id)
+        try:
+            return await reference_data_cache.get_by_id_or_404(
+                UserGender, gender_id, self.db_session
+            )
+        except Exception as e:
+            logger.error(f"Error getting gender {gender_id}: {e}")
+            ExceptionHandler(e)
+
+    async def get_genders_by_ids(self, gender_ids: List[UUID]) -> List[UserGender]:
+        """
+        Получает несколько гендеров по ID из кэша справочников (без запросов к БД).
+
+        :param gender_ids: Список идентификаторов.
+        :return: Список объектов, привязанных к текущей сессии.
+        :raises HTTPException: Если часть идентификаторов не найдена (404 со списком всех).
+        """
+        try:
+            return await reference_data_cache.get_by_ids(UserGender, gender_ids, self.db_session)
+        except Exception as e:
+            logger.error(f"Error getting UserGender objects by ids: {e}")
+            ExceptionHandler(e)
+
+    async def get_gender_by_name(self, gender_name: str) -> Optional[UserGender]:
+        """
+        Получает гендер пользователя по названию из кэша справочников.
+
+        :param gender_name: Название гендера.
+        :return: Объект гендера пользователя или None.
+        """
+        return await reference_data_cache.get_by_name(UserGender, gender_name, self.db_session)
 
     async def get_genders_list(self) -> List[UserGender]:
         """
@@ -54,12 +83,8 @@ class UserGenderService(BaseService):
         :raises HTTPException: Если произошла ошибка базы данных.
         """
         try:
-            query = select(UserGender)
-            result = await self.db_session.execute(query)
-            genders = result.scalars().all()
-            return genders
+            return await reference_data_cache.get_list(UserGender)
         except Exception as e:
-            await self.db_session.rollback()
             logger.error(f"Error getting genders list: {e}")
             ExceptionHandler(e)
 
@@ -72,7 +97,11 @@ class UserGenderService(BaseService):
         :return: Обновленный объект гендера пользователя.
         """
         try:
-            return await self.update_object(model=UserGender, object_id=gender_id, data=update_data)
+            gender = await self.update_object(
+                model=UserGender, object_id=gender_id, data=update_data
+            )
+            await reference_data_cache.refresh(UserGender)
+            return gender
         except Exception as e:
             await self.db_session.rollback()
             logger.error(f"Error updating genders list: {e}")
@@ -86,6 +115,7 @@ class UserGenderService(BaseService):
         """
         try:
             await self.delete_object_by_id(UserGender, gender_id)
+            await reference_data_cache.refresh(UserGender)
         except Exception as e:
             await self.db_session.rollback()
             logger.error(f"Error deleting genders list: {e}")
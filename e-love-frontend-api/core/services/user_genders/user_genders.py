@@ -5,10 +5,13 @@ from uuid import UUID
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.db.models.intermediate_models.user_genders import user_genders_table
 from core.db.models.users.users import User
 from core.services.user_gender.user_gender import UserGenderService
+from core.services.users.loading_profiles import UserLoadingProfile
 from core.services.users.users import UserService
 from exceptions.exception_handler import ExceptionHandler
+from utils.functions.link_table import delete_links, insert_links, replace_links
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -34,16 +37,17 @@ class UserGenderAssociationService:
         :raises HTTPException: Если пользователь или гендер не найдены, или произошла ошибка базы данных.
         """
         try:
-            user = await self.user_service.get_user_by_id(user_id)
+            await self.user_service.ensure_object_exists(User, user_id)
             gender = await self.gender_service.get_gender_by_id(gender_id)
 
-            if gender in user.genders:
+            inserted = await insert_links(
+                self.db_session, user_genders_table, "user_id", user_id, "gender_id", [gender.id]
+            )
+            if not inserted:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="This user already has this gender",
                 )
-
-            user.genders.append(gender)
             await self.db_session.commit()
         except Exception as e:
             await self.db_session.rollback()
@@ -52,29 +56,30 @@ class UserGenderAssociationService:
 
     async def add_genders_to_user(self, user_id: UUID, gender_ids: List[UUID]) -> None:
         """
-        Добавляет несколько гендеров (>1) пользователю. (BULK)
+        Добавляет несколько гендеров пользователю одним INSERT IGNORE. (BULK)
 
         :param user_id: Идентификатор пользователя.
         :param gender_ids: Список идентификаторов гендеров.
         :raises HTTPException: Если пользователь или гендеры не найдены, или произошла ошибка базы данных.
         """
-
         try:
-            user = await self.user_service.get_user_by_id(user_id)
-            genders_to_add = []
-            for gender_id in set(gender_ids):
-                gender = await self.gender_service.get_gender_by_id(gender_id)
-                if gender not in user.genders:
-                    genders_to_add.append(gender)
-
-            if genders_to_add:
-                user.genders.extend(genders_to_add)
-                await self.db_session.commit()
-            else:
+            await self.user_service.ensure_object_exists(User, user_id)
+            genders = await self.gender_service.get_genders_by_ids(gender_ids)
+
+            inserted = await insert_links(
+                self.db_session,
+                user_genders_table,
+                "user_id",
+                user_id,
+                "gender_id",
+                [gender.id for gender in genders],
+            )
+            if not inserted:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="This user already has these genders",
                 )
+            await self.db_session.commit()
         except Exception as e:
             await self.db_session.rollback()
             logger.error(f"Error adding genderS to the user: {e}")
@@ -82,22 +87,27 @@ class UserGenderAssociationService:
 
     async def update_user_genders(self, user_id: UUID, new_gender_ids: List[UUID]) -> None:
         """
-        Обновляет гендеры пользователя, заменяя существующие на новые. (>1)
+        Обновляет гендеры пользователя, заменяя существующие на новые.
+
+        Разница применяется напрямую к user_genders: DELETE ... NOT IN и INSERT IGNORE -
+        два запроса независимо от размера коллекции, без загрузки связи user.genders.
 
         :param user_id: Идентификатор пользователя.
         :param new_gender_ids: Список идентификаторов новых гендеров.
         :raises HTTPException: Если пользователь или гендеры не найдены, или произошла ошибка базы данных.
         """
         try:
-            new_gender_ids = list(set(new_gender_ids))
-            user = await self.user_service.get_user_by_id(user_id)
-
-            genders = []
-            for gender_id in new_gender_ids:
-                gender = await self.gender_service.get_gender_by_id(gender_id)
-                genders.append(gender)
-
-            user.genders = genders
+            await self.user_service.ensure_object_exists(User, user_id)
+            genders = await self.gender_service.get_genders_by_ids(new_gender_ids)
+
+            await replace_links(
+                self.db_session,
+                user_genders_table,
+                "user_id",
+                user_id,
+                "gender_id",
+                [gender.id for gender in genders],
+            )
             await self.db_session.commit()
 
         except Exception as e:
@@ -114,15 +124,22 @@ class UserGenderAssociationService:
         :raises HTTPException: Если пользователь или гендер не найдены, или произошла ошибка базы данных.
         """
         try:
-            user = await self.user_service.get_user_by_id(user_id)
+            await self.user_service.ensure_object_exists(User, user_id)
             gender = await self.gender_service.get_gender_by_id(gender_id)
 
-            if gender not in user.genders:
+            deleted = await delete_links(
+                self.db_session,
+                user_genders_table,
+                "user_id",
+                user_id,
+                "gender_id",
+                target_ids=[gender.id],
+            )
+            if not deleted:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="This user doesn't have this gender",
                 )
-            user.genders.remove(gender)
             await self.db_session.commit()
         except Exception as e:
             await self.db_session.rollback()
@@ -131,30 +148,30 @@ class UserGenderAssociationService:
 
     async def remove_genders_from_user(self, user_id: UUID, gender_ids: List[UUID]) -> None:
         """
-        Удаляет несколько гендеров (>1) у пользователя. (BULK)
+        Удаляет несколько гендеров у пользователя одним DELETE ... WHERE IN. (BULK)
 
         :param user_id: Идентификатор пользователя.
         :param gender_ids: Список идентификаторов гендеров.
         :raises HTTPException: Если пользователь или гендеры не найдены, или произошла ошибка базы данных.
         """
         try:
-            user = await self.user_service.get_user_by_id(user_id)
-            genders_to_remove = []
-
-            for gender_id in set(gender_ids):
-                gender = await self.gender_service.get_gender_by_id(gender_id)
-                if gender in user.genders:
-                    genders_to_remove.append(gender)
-
-            if genders_to_remove:
-                for gender in genders_to_remove:
-                    user.genders.remove(gender)
-                await self.db_session.commit()
-            else:
+            await self.user_service.ensure_object_exists(User, user_id)
+            genders = await self.gender_service.get_genders_by_ids(gender_ids)
+
+            deleted = await delete_links(
+                self.db_session,
+                user_genders_table,
+                "user_id",
+                user_id,
+                "gender_id",
+                target_ids=[gender.id for gender in genders],
+            )
+            if not deleted:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="None of the specified genders are assigned to the user.",
                 )
+            await self.db_session.commit()
         except Exception as e:
             await self.db_session.rollback()
             logger.error(f"Error removing genders from the user: {e}")
@@ -170,6 +187,8 @@ class UserGenderAssociationService:
         """
         try:
             gender = await self.gender_service.get_gender_by_id(gender_id)
+            # Справочник берётся из кэша, коллекция пользователей не загружена - грузим явно
+            await self.db_session.refresh(gender, attribute_names=["users"])
             return gender.users
         except Exception as e:
             await self.db_session.rollback()
@@ -185,7 +204,9 @@ class UserGenderAssociationService:
         :raises HTTPException: Если пользователь не найден или произошла ошибка базы данных.
         """
         try:
-            user = await self.user_service.get_user_by_id(user_id)
+            user = await self.user_service.get_user_by_id(
+                user_id, profile=UserLoadingProfile.MINIMAL, include=[User.genders]
+            )
             return user.genders
         except Exception as e:
             await self.db_session.rollback()
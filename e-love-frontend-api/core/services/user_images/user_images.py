@@ -8,6 +8,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.db.models.users.user_images import UserImages
+from core.schemas.user_images.user_images_schema import UserImagesBulkUpdateItem, UserImagesCreate
 from core.services.base_service import BaseService
 from exceptions.exception_handler import ExceptionHandler
 from utils.custom_pagination import Paginator
@@ -25,7 +26,9 @@ class UserImageService(BaseService):
 
         :param db_session: Асинхронная сессия базы данных.
         """
-        self.paginator = Paginator[UserImages](db_session=db_session, model=UserImages)
+        self.paginator = Paginator[UserImages](
+            db_session=db_session, model=UserImages, bidirectional=True
+        )
         super().__init__(db_session)
 
     async def create_image(self, image_data: Dict[str, Any]) -> UserImages:
@@ -60,16 +63,29 @@ class UserImageService(BaseService):
             ExceptionHandler(e)
 
     async def get_images_list(
-        self, limit: int = 10, next_token: Optional[str] = None
+        self,
+        limit: int = 10,
+        next_token: Optional[str] = None,
+        prev_token: Optional[str] = None,
     ) -> List[UserImages]:
+        """
+        Получает ленту фотографий с пагинацией в обе стороны.
+
+        :param limit: Количество записей на странице.
+        :param next_token: Токен следующей страницы.
+        :param prev_token: Токен предыдущей страницы.
+        :return: Словарь с фотографиями и токенами соседних страниц.
+        """
         try:
             base_query = select(UserImages)
 
             response = await self.paginator.paginate_query(
                 base_query=base_query,
                 next_token=next_token,
+                prev_token=prev_token,
                 model_name="items",
                 limit=limit,
+                prefetch_scope="user_images",
             )
 
             return response
@@ -133,3 +149,36 @@ class UserImageService(BaseService):
             await self.db_session.rollback()
             logger.error(f"Unexpected error while deleting image: {e}")
             ExceptionHandler(e)
+
+    async def create_images(self, images_data: List[UserImagesCreate]) -> List[UserImages]:
+        """
+        Создает несколько фотографий одним INSERT (BULK).
+
+        :param images_data: Список данных фотографий.
+        :return: Список созданных фотографий.
+        """
+        return await self.create_objects(
+            model=UserImages,
+            data=[image.model_dump(mode="json", exclude_unset=True) for image in images_data],
+        )
+
+    async def update_images(self, images_data: List[UserImagesBulkUpdateItem]) -> List[UserImages]:
+        """
+        Обновляет несколько фотографий одним UPDATE (BULK).
+
+        :param images_data: Список обновлений (каждое с id фотографии).
+        :return: Список обновлённых фотографий.
+        """
+        return await self.update_objects(
+            model=UserImages,
+            data=[image.model_dump(mode="json", exclude_unset=True) for image in images_data],
+        )
+
+    async def delete_images(self, image_ids: List[UUID]) -> int:
+        """
+        Удаляет несколько фотографий одним DELETE (BULK).
+
+        :param image_ids: Идентификаторы фотографий.
+        :return: Количество удалённых фотографий.
+        """
+        return await self.delete_objects_by_ids(UserImages, image_ids)
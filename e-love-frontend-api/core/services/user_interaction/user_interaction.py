@@ -1,14 +1,28 @@
 """ User interaction service module """
 
 import logging
-from typing import Any, Dict, List, Optional
+import uuid
+from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
 
-from sqlalchemy import select
+from fastapi import HTTPException, status
+from sqlalchemy import select, union
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from configuration.config import settings
 from core.db.models.users.user_interaction import UserInteraction
-from core.services.base_service import BaseService
+from core.db.models.users.user_interaction_archive import user_interaction_archive_table
+from core.db.models.users.users import User
+from core.schemas.user_interaction.user_interaction_schema import (
+    InteractionType,
+    SwipeItem,
+    SwipeStatus,
+    UserInteractionBulkUpdateItem,
+    UserInteractionCreate,
+)
+from core.services.base_service import BaseService, unique_ids
+from core.services.interaction_buffer.interaction_buffer import interaction_write_buffer
+from core.services.mutual_match.mutual_match import MutualMatchService
 from exceptions.exception_handler import ExceptionHandler
 from utils.custom_pagination import Paginator
 
@@ -27,6 +41,7 @@ class UserInteractionService(BaseService):
         """
         self.db_session = db_session
         self.paginator = Paginator[UserInteraction](db_session=db_session, model=UserInteraction)
+        self.mutual_match_service = MutualMatchService(db_session)
 
     async def get_user_interaction_by_id(self, interaction_id: UUID) -> UserInteraction:
         return await self.get_object_by_id(UserInteraction, interaction_id)
@@ -86,6 +101,9 @@ class UserInteractionService(BaseService):
         """
         Получает список идентификаторов пользователей, с которыми текущий пользователь уже взаимодействовал.
 
+        Без пагинации (список исключений матчинга) в него входят и архивные свайпы
+        из user_interaction_archive, с пагинацией - только user_interaction.
+
         :param current_user_id: Идентификатор текущего пользователя.
         :param limit: Количество записей для пагинации.
         :param next_token: Токен для продолжения пагинации.
@@ -106,8 +124,20 @@ class UserInteractionService(BaseService):
                 )
                 viewed_users_ids = [item.target_user_id for item in response]
             else:
-                result = await self.db_session.execute(query)
+                # UNION (а не UNION ALL): пара могла попасть в архив и снова появиться после свайпа
+                archived_query = select(user_interaction_archive_table.c.target_user_id).where(
+                    user_interaction_archive_table.c.user_id == str(current_user_id)
+                )
+                result = await self.db_session.execute(union(query, archived_query))
                 viewed_users_ids = [row[0] for row in result.fetchall()]
+                if settings.interaction_buffer_enabled:
+                    # Свайпы из write-behind буфера ещё не в БД, но матчинг уже не должен их показывать
+                    known = set(viewed_users_ids)
+                    viewed_users_ids += [
+                        target_id
+                        for target_id in interaction_write_buffer.pending_for_user(current_user_id)
+                        if target_id not in known
+                    ]
 
             return viewed_users_ids
 
@@ -116,23 +146,296 @@ class UserInteractionService(BaseService):
             logger.error(f"Error getting VIEWED user interactions list: {e}")
             ExceptionHandler(e)
 
+    async def _sync_mutual_matches(
+        self, interactions: List[UserInteraction], remove_rejected: bool = False
+    ) -> None:
+        """
+        Приводит mutual_match в соответствие с только что сохранёнными взаимодействиями:
+        MATCH регистрирует взаимный мэтч (если есть встречный MATCH), а при remove_rejected
+        REJECT снимает мэтч пары (смена MATCH -> REJECT при обновлении).
+
+        :param interactions: Сохранённые взаимодействия.
+        :param remove_rejected: Удалять мэтчи пар с REJECT.
+        """
+        matches = [
+            (interaction.user_id, interaction.target_user_id)
+            for interaction in interactions
+            if interaction.interaction_type == InteractionType.MATCH
+        ]
+        rejects = [
+            (interaction.user_id, interaction.target_user_id)
+            for interaction in interactions
+            if interaction.interaction_type == InteractionType.REJECT
+        ]
+        if not matches and not (remove_rejected and rejects):
+            return
+
+        try:
+            await self.mutual_match_service.record_matches(matches)
+            if remove_rejected:
+                await self.mutual_match_service.remove_matches(rejects)
+            await self.db_session.commit()
+        except Exception as e:
+            await self.db_session.rollback()
+            logger.error(f"Error syncing mutual matches: {e}")
+            ExceptionHandler(e)
+
     # TODO: refactor - add the interaction type instead "Any"
-    async def create_user_interaction(self, interaction_data: Dict[str, Any]) -> UserInteraction:
-        return await self.create_object(model=UserInteraction, data=interaction_data)
+    async def create_user_interaction(
+        self, interaction_data: Union[UserInteractionCreate, Dict[str, Any]]
+    ) -> UserInteraction:
+        """
+        Создает взаимодействие (свайп) или меняет interaction_type уже существующего
+        взаимодействия той же пары (user_id, target_user_id) - одним upsert-запросом,
+        без дублей и без ошибки уникальности на повторный свайп.
+
+        При включённом INTERACTION_BUFFER_ENABLED запись только ставится в write-behind буфер
+        и попадает в БД пачкой в течение интервала сброса (тем же upsert-ом, поэтому для уже
+        существующей пары возвращённый id не совпадёт с id сохранённой записи).
+
+        :param interaction_data: Данные взаимодействия.
+        :return: Созданное/обновлённое (или принятое в буфер) взаимодействие.
+        """
+        if isinstance(interaction_data, UserInteractionCreate):
+            interaction_data = interaction_data.model_dump(mode="json")
+
+        if settings.interaction_buffer_enabled:
+            return await interaction_write_buffer.submit(interaction_data, self.db_session)
+        interaction = await self.upsert_object(
+            model=UserInteraction,
+            data=interaction_data,
+            conflict_columns=["user_id", "target_user_id"],
+            update_columns=["interaction_type"],
+        )
+        # Повторный свайп мог сменить MATCH на REJECT
+        await self._sync_mutual_matches([interaction], remove_rejected=True)
+        return interaction
 
     async def update_user_interaction(
         self, interaction_id: UUID, update_data: Dict[str, Any]
     ) -> UserInteraction:
-        return await self.update_object(
+        interaction = await self.update_object(
             model=UserInteraction, object_id=interaction_id, data=update_data
         )
+        await self._sync_mutual_matches([interaction], remove_rejected=True)
+        return interaction
 
     async def delete_user_interaction(self, interaction_id: UUID) -> UserInteraction:
         try:
-            return await self.delete_object_by_id(UserInteraction, interaction_id)
+            interaction = await self.get_object_by_id(UserInteraction, interaction_id)
+            pair = (interaction.user_id, interaction.target_user_id)
+            was_match = interaction.interaction_type == InteractionType.MATCH
+
+            await self.delete_object_by_id(UserInteraction, interaction_id)
+            if was_match:
+                await self.mutual_match_service.remove_matches([pair])
+                await self.db_session.commit()
 
         # foreign key reference against another tables
         except Exception as e:
             await self.db_session.rollback()
             logger.error(f"Error deleting user interaction: {e}")
             ExceptionHandler(e)
+
+    async def create_user_interactions(
+        self, interactions_data: List[UserInteractionCreate]
+    ) -> List[UserInteraction]:
+        """
+        Создает несколько взаимодействий одним INSERT (BULK).
+
+        :param interactions_data: Список данных взаимодействий.
+        :return: Список созданных взаимодействий.
+        """
+        interactions = await self.create_objects(
+            model=UserInteraction,
+            data=[interaction.model_dump(mode="json") for interaction in interactions_data],
+        )
+        await self._sync_mutual_matches(interactions)
+        return interactions
+
+    async def update_user_interactions(
+        self, interactions_data: List[UserInteractionBulkUpdateItem]
+    ) -> List[UserInteraction]:
+        """
+        Обновляет несколько взаимодействий одним UPDATE (BULK).
+
+        :param interactions_data: Список обновлений (каждое с id взаимодействия).
+        :return: Список обновлённых взаимодействий.
+        """
+        interactions = await self.update_objects(
+            model=UserInteraction,
+            data=[
+                interaction.model_dump(mode="json", exclude_unset=True)
+                for interaction in interactions_data
+            ],
+        )
+        await self._sync_mutual_matches(interactions, remove_rejected=True)
+        return interactions
+
+    async def delete_user_interactions(self, interaction_ids: List[UUID]) -> int:
+        """
+        Удаляет несколько взаимодействий одним DELETE (BULK).
+
+        :param interaction_ids: Идентификаторы взаимодействий.
+        :return: Количество удалённых взаимодействий.
+        """
+        result = await self.db_session.execute(
+            select(UserInteraction.user_id, UserInteraction.target_user_id).where(
+                UserInteraction.id.in_(unique_ids(interaction_ids)),
+                UserInteraction.interaction_type == InteractionType.MATCH.value,
+            )
+        )
+        match_pairs = result.all()
+
+        deleted = await self.delete_objects_by_ids(UserInteraction, interaction_ids)
+        if match_pairs:
+            try:
+                await self.mutual_match_service.remove_matches(match_pairs)
+                await self.db_session.commit()
+            except Exception as e:
+                await self.db_session.rollback()
+                logger.error(f"Error removing mutual matches: {e}")
+                ExceptionHandler(e)
+        return deleted
+
+    async def submit_swipes(self, user_id: UUID, swipes: List[SwipeItem]) -> Dict[str, Any]:
+        """
+        Пакетно принимает свайпы текущего пользователя.
+
+        Свайпы пишутся тем же upsert-ом по (user_id, target_user_id), что и одиночный
+        create_user_interaction (BaseService.upsert_rows), и ведут себя так же, как если бы
+        были отправлены по одному: повторный свайп пары (в БД, в write-behind буфере или внутри
+        пакета) не создаёт новую запись, а меняет её interaction_type - итог определяет
+        последний свайп. Взаимные мэтчи синхронизируются с итоговым типом.
+
+        Число запросов к БД не зависит от размера пакета - не больше шести: проверка
+        существования пользователей (текущего и целевых), один multi-row upsert, выборка id
+        записанных взаимодействий и, если в пакете есть MATCH или REJECT, record_matches
+        (до двух запросов) и remove_matches (один). При включённом буфере upsert выполняет
+        фоновый сброс, а
+        статусы определяются по уже существующим взаимодействиям (БД плюс ещё не сброшенный
+        буфер).
+
+        :param user_id: Идентификатор текущего пользователя.
+        :param swipes: Свайпы в порядке их совершения.
+        :return: Словарь с количеством созданных взаимодействий и результатами по каждому свайпу.
+        :raises HTTPException: Если текущий пользователь не найден или произошла ошибка базы данных.
+        """
+        try:
+            user_id = str(user_id)
+            target_ids = unique_ids(swipe.target_user_id for swipe in swipes)
+
+            result = await self.db_session.execute(
+                select(User.id).where(User.id.in_([user_id, *target_ids]))
+            )
+            existing_users = {str(existing_id) for existing_id in result.scalars().all()}
+            if user_id not in existing_users:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found.")
+
+            statuses: List[SwipeStatus] = []
+            final_types: Dict[str, str] = {}
+            for swipe in swipes:
+                target_id = str(swipe.target_user_id)
+
+                if target_id == user_id:
+                    statuses.append(SwipeStatus.SELF_SWIPE)
+                    continue
+                if target_id not in existing_users:
+                    statuses.append(SwipeStatus.TARGET_NOT_FOUND)
+                    continue
+
+                # Повтор внутри пакета не создаёт запись, но, как и отдельный свайп, меняет её тип
+                statuses.append(
+                    SwipeStatus.DUPLICATE if target_id in final_types else SwipeStatus.CREATED
+                )
+                final_types[target_id] = swipe.interaction_type.value
+
+            rows = [
+                {
+                    "id": str(uuid.uuid4()),
+                    "user_id": user_id,
+                    "target_user_id": target_id,
+                    "interaction_type": interaction_type,
+                }
+                for target_id, interaction_type in final_types.items()
+            ]
+
+            if settings.interaction_buffer_enabled:
+                interaction_ids = await self._existing_interaction_ids(user_id, list(final_types))
+                interaction_ids.update(
+                    (target_id, object_id)
+                    for target_id, object_id in interaction_write_buffer.pending_for_user(
+                        user_id
+                    ).items()
+                    if target_id in final_types
+                )
+                existing_targets = set(interaction_ids)
+                await interaction_write_buffer.submit_many(rows, self.db_session)
+                for row in rows:
+                    interaction_ids.setdefault(row["target_user_id"], row["id"])
+            elif rows:
+                await self.upsert_rows(
+                    UserInteraction,
+                    rows,
+                    conflict_columns=["user_id", "target_user_id"],
+                    update_columns=["interaction_type"],
+                )
+                interaction_ids = await self._existing_interaction_ids(user_id, list(final_types))
+                existing_targets = {
+                    row["target_user_id"]
+                    for row in rows
+                    if interaction_ids.get(row["target_user_id"]) != row["id"]
+                }
+                await self.mutual_match_service.record_matches(
+                    (user_id, target_id)
+                    for target_id, interaction_type in final_types.items()
+                    if interaction_type == InteractionType.MATCH.value
+                )
+                await self.mutual_match_service.remove_matches(
+                    (user_id, target_id)
+                    for target_id, interaction_type in final_types.items()
+                    if interaction_type == InteractionType.REJECT.value
+                )
+                await self.db_session.commit()
+            else:
+                interaction_ids, existing_targets = {}, set()
+
+            results: List[Dict[str, Any]] = []
+            for swipe, swipe_status in zip(swipes, statuses):
+                target_id = str(swipe.target_user_id)
+                if swipe_status == SwipeStatus.CREATED and target_id in existing_targets:
+                    swipe_status = SwipeStatus.ALREADY_EXISTS
+                results.append(
+                    {
+                        "target_user_id": target_id,
+                        "status": swipe_status,
+                        "id": interaction_ids.get(target_id),
+                    }
+                )
+
+            created = sum(1 for item in results if item["status"] == SwipeStatus.CREATED)
+            return {"created": created, "results": results}
+        except Exception as e:
+            await self.db_session.rollback()
+            logger.error(f"Error submitting swipes for user {user_id}: {e}")
+            ExceptionHandler(e)
+
+    async def _existing_interaction_ids(
+        self, user_id: str, target_ids: List[str]
+    ) -> Dict[str, str]:
+        """
+        Возвращает id взаимодействий пользователя с указанными пользователями.
+
+        :param user_id: Идентификатор пользователя.
+        :param target_ids: Идентификаторы целевых пользователей.
+        :return: Словарь target_user_id -> id взаимодействия (только для существующих).
+        """
+        if not target_ids:
+            return {}
+        result = await self.db_session.execute(
+            select(UserInteraction.target_user_id, UserInteraction.id).where(
+                UserInteraction.user_id == user_id,
+                UserInteraction.target_user_id.in_(target_ids),
+            )
+        )
+        return {str(target_id): str(object_id) for target_id, object_id in result.all()}
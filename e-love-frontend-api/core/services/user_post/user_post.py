@@ -6,7 +6,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.db.models.posts.user_post import UserPost
-from core.schemas.posts.user_post_schema import PostCreate
+from core.schemas.posts.user_post_schema import PostBulkUpdateItem, PostCreate
 from core.services.base_service import BaseService
 from exceptions.exception_handler import ExceptionHandler
 from utils.custom_pagination import Paginator
@@ -27,7 +27,9 @@ class UserPostService(BaseService):
         """
 
         super().__init__(db_session)
-        self.paginator = Paginator[UserPost](db_session=db_session, model=UserPost)
+        self.paginator = Paginator[UserPost](
+            db_session=db_session, model=UserPost, bidirectional=True
+        )
 
     async def create_post(self, post_data: Dict[str, Any]) -> UserPost:
         return await self.create_object(
@@ -42,7 +44,16 @@ class UserPostService(BaseService):
         self,
         limit: int = 10,
         next_token: Optional[str] = None,
+        prev_token: Optional[str] = None,
     ) -> List[UserPost]:
+        """
+        Получает ленту постов с пагинацией в обе стороны.
+
+        :param limit: Количество записей на странице.
+        :param next_token: Токен следующей страницы.
+        :param prev_token: Токен предыдущей страницы.
+        :return: Словарь с постами и токенами соседних страниц.
+        """
         try:
 
             filters = None
@@ -51,9 +62,11 @@ class UserPostService(BaseService):
             response = await self.paginator.paginate_query(
                 base_query=base_query,
                 next_token=next_token,
+                prev_token=prev_token,
                 filters=filters,
                 model_name="items",
                 limit=limit,
+                prefetch_scope="user_post",
             )
 
             return response
@@ -87,3 +100,35 @@ class UserPostService(BaseService):
             await self.db_session.rollback()
             logger.error(f"Unexpected error while deleting post {post_id}: {e}")
             ExceptionHandler(e)
+
+    async def create_posts(self, posts_data: List[PostCreate]) -> List[UserPost]:
+        """
+        Создает несколько постов одним INSERT (BULK).
+
+        :param posts_data: Список данных постов.
+        :return: Список созданных постов.
+        """
+        return await self.create_objects(
+            model=UserPost, data=[post.model_dump(mode="json") for post in posts_data]
+        )
+
+    async def update_posts(self, posts_data: List[PostBulkUpdateItem]) -> List[UserPost]:
+        """
+        Обновляет несколько постов одним UPDATE (BULK).
+
+        :param posts_data: Список обновлений (каждое с id поста).
+        :return: Список обновлённых постов.
+        """
+        return await self.update_objects(
+            model=UserPost,
+            data=[post.model_dump(mode="json", exclude_unset=True) for post in posts_data],
+        )
+
+    async def delete_posts(self, post_ids: List[UUID]) -> int:
+        """
+        Удаляет несколько постов одним DELETE (BULK).
+
+        :param post_ids: Идентификаторы постов.
+        :return: Количество удалённых постов.
+        """
+        return await self.delete_objects_by_ids(UserPost, post_ids)
@@ -1,14 +1,14 @@
 """ User role service module """
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.db.models.users.user_role import UserRole
 from core.services.base_service import BaseService
+from core.services.reference_data.reference_data import reference_data_cache
 from exceptions.exception_handler import ExceptionHandler
 
 logger = logging.getLogger(__name__)
@@ -33,16 +33,45 @@ class UserRoleService(BaseService):
         :param role_data: Словарь с данными роли.
         :return: Созданный объект роли пользователя.
         """
-        return await self.create_object(model=UserRole, data=role_data, unique_fields=["role_name"])
+        role = await self.create_object(model=UserRole, data=role_data)
+        await reference_data_cache.refresh(UserRole)
+        return role
 
     async def get_role_by_id(self, role_id: UUID) -> UserRole:
         """
-        Получает роль пользователя по её ID.
+        Получает роль пользователя по её ID из кэша справочников (без запроса к БД).
 
         :param role_id: Идентификатор роли.
-        :return: Объект роли пользователя.
+        :return: Объект роли пользователя, привязанный к текущей сессии.
         """
-        return await self.get_object_by_id(UserRole, role_id)
+        try:
+            return await reference_data_cache.get_by_id_or_404(UserRole, role_id, self.db_session)
+        except Exception as e:
+            logger.error(f"Error getting user role {role_id}: {e}")
+            ExceptionHandler(e)
+
+    async def get_roles_by_ids(self, role_ids: List[UUID]) -> List[UserRole]:
+        """
+        Получает несколько ролей по ID из кэша справочников (без запросов к БД).
+
+        :param role_ids: Список идентификаторов.
+        :return: Список объектов, привязанных к текущей сессии.
+        :raises HTTPException: Если часть идентификаторов не найдена (404 со списком всех).
+        """
+        try:
+            return await reference_data_cache.get_by_ids(UserRole, role_ids, self.db_session)
+        except Exception as e:
+            logger.error(f"Error getting UserRole objects by ids: {e}")
+            ExceptionHandler(e)
+
+    async def get_role_by_name(self, role_name: str) -> Optional[UserRole]:
+        """
+        Получает роль пользователя по названию из кэша справочников.
+
+        :param role_name: Название роли.
+        :return: Объект роли пользователя или None.
+        """
+        return await reference_data_cache.get_by_name(UserRole, role_name, self.db_session)
 
     async def get_user_roles_list(self) -> List[UserRole]:
         """
@@ -52,12 +81,8 @@ class UserRoleService(BaseService):
         :raises HTTPException: Если произошла ошибка базы данных.
         """
         try:
-            query = select(UserRole)
-            result = await self.db_session.execute(query)
-            roles = result.scalars().all()
-            return roles
+            return await reference_data_cache.get_list(UserRole)
         except Exception as e:
-            await self.db_session.rollback()
             logger.error(f"Error getting user roles list: {e}")
             ExceptionHandler(e)
 
@@ -69,7 +94,9 @@ class UserRoleService(BaseService):
         :param update_data: Словарь с обновленными данными роли.
         :return: Обновленный объект роли пользователя.
         """
-        return await self.update_object(model=UserRole, object_id=role_id, data=update_data)
+        role = await self.update_object(model=UserRole, object_id=role_id, data=update_data)
+        await reference_data_cache.refresh(UserRole)
+        return role
 
     async def delete_user_role(self, role_id: UUID) -> None:
         """
@@ -78,3 +105,4 @@ class UserRoleService(BaseService):
         :param role_id: Идентификатор роли.
         """
         await self.delete_object_by_id(UserRole, role_id)
+        await reference_data_cache.refresh(UserRole)
@@ -5,11 +5,14 @@ from uuid import UUID
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.db.models.intermediate_models.user_roles import user_roles_table
 from core.db.models.users.user_role import UserRole
 from core.db.models.users.users import User
 from core.services.user_role.user_role import UserRoleService
+from core.services.users.loading_profiles import UserLoadingProfile
 from core.services.users.users import UserService
 from exceptions.exception_handler import ExceptionHandler
+from utils.functions.link_table import delete_links, insert_links, replace_links
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -31,19 +34,20 @@ class UserRoleAssociationService:
 
         :param user_id: Идентификатор пользователя.
         :param role_id: Идентификатор роли.
-        :raises HTTPException: Если пользователь или роли не найдены, или произошла ошибка базы данных.
+        :raises HTTPException: Если пользователь или роль не найдены, или произошла ошибка базы данных.
         """
         try:
-            user = await self.user_service.get_user_by_id(user_id)
+            await self.user_service.ensure_object_exists(User, user_id)
             role = await self.role_service.get_role_by_id(role_id)
 
-            if role in user.roles:
+            inserted = await insert_links(
+                self.db_session, user_roles_table, "user_id", user_id, "role_id", [role.id]
+            )
+            if not inserted:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="This user already has these role",
                 )
-
-            user.roles.append(role)
             await self.db_session.commit()
         except Exception as e:
             await self.db_session.rollback()
@@ -52,29 +56,30 @@ class UserRoleAssociationService:
 
     async def add_roles_to_user(self, user_id: UUID, role_ids: List[UUID]) -> None:
         """
-        Добавляет > 1 роли пользователю. (BULK)
+        Добавляет несколько ролей пользователю одним INSERT IGNORE. (BULK)
 
         :param user_id: Идентификатор пользователя.
         :param role_ids: Список идентификаторов ролей.
         :raises HTTPException: Если пользователь или роли не найдены, или произошла ошибка базы данных.
         """
-
         try:
-            user = await self.user_service.get_user_by_id(user_id)
-            roles_to_add = []
-            for role_id in role_ids:
-                role = await self.role_service.get_role_by_id(role_id)
-                if role not in user.roles:
-                    roles_to_add.append(role)
-
-            if roles_to_add:
-                user.roles.extend(roles_to_add)
-                await self.db_session.commit()
-            else:
+            await self.user_service.ensure_object_exists(User, user_id)
+            roles = await self.role_service.get_roles_by_ids(role_ids)
+
+            inserted = await insert_links(
+                self.db_session,
+                user_roles_table,
+                "user_id",
+                user_id,
+                "role_id",
+                [role.id for role in roles],
+            )
+            if not inserted:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="This user already has these roles",
                 )
+            await self.db_session.commit()
         except Exception as e:
             await self.db_session.rollback()
             logger.error(f"Error adding roles to user: {e}")
@@ -84,22 +89,25 @@ class UserRoleAssociationService:
         """
         Обновляет роли пользователя, заменяя существующие на новые.
 
+        Разница применяется напрямую к user_roles: DELETE ... NOT IN и INSERT IGNORE -
+        два запроса независимо от размера коллекции, без загрузки связи user.roles.
+
         :param user_id: Идентификатор пользователя.
         :param new_role_ids: Список идентификаторов новых ролей.
         :raises HTTPException: Если пользователь или роли не найдены, или произошла ошибка базы данных.
         """
         try:
-            # Уникальность
-            new_role_ids = list(set(new_role_ids))
-
-            user = await self.user_service.get_user_by_id(user_id)
-
-            roles = []
-            for role_id in new_role_ids:
-                role = await self.role_service.get_role_by_id(role_id)
-                roles.append(role)
-
-            user.roles = roles
+            await self.user_service.ensure_object_exists(User, user_id)
+            roles = await self.role_service.get_roles_by_ids(new_role_ids)
+
+            await replace_links(
+                self.db_session,
+                user_roles_table,
+                "user_id",
+                user_id,
+                "role_id",
+                [role.id for role in roles],
+            )
             await self.db_session.commit()
 
         except Exception as e:
@@ -109,22 +117,29 @@ class UserRoleAssociationService:
 
     async def remove_role_from_user(self, user_id: UUID, role_id: UUID) -> None:
         """
-        Удаляет роль пользователя.
+        Удаляет роль у пользователя.
 
         :param user_id: Идентификатор пользователя.
         :param role_id: Идентификатор роли.
-        :raises HTTPException: Если пользователь или роли не найдены, или произошла ошибка базы данных.
+        :raises HTTPException: Если пользователь или роль не найдены, или произошла ошибка базы данных.
         """
         try:
-            user = await self.user_service.get_user_by_id(user_id)
+            await self.user_service.ensure_object_exists(User, user_id)
             role = await self.role_service.get_role_by_id(role_id)
 
-            if role not in user.roles:
+            deleted = await delete_links(
+                self.db_session,
+                user_roles_table,
+                "user_id",
+                user_id,
+                "role_id",
+                target_ids=[role.id],
+            )
+            if not deleted:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="This user doesn't have these role",
                 )
-            user.roles.remove(role)
             await self.db_session.commit()
         except Exception as e:
             await self.db_session.rollback()
@@ -133,30 +148,30 @@ class UserRoleAssociationService:
 
     async def remove_roles_from_user(self, user_id: UUID, role_ids: List[UUID]) -> None:
         """
-        Удаляет > 1 ролей у пользователя. (BULK)
+        Удаляет несколько ролей у пользователя одним DELETE ... WHERE IN. (BULK)
 
         :param user_id: Идентификатор пользователя.
         :param role_ids: Список идентификаторов ролей.
         :raises HTTPException: Если пользователь или роли не найдены, или произошла ошибка базы данных.
         """
         try:
-            user = await self.user_service.get_user_by_id(user_id)
-            roles_to_remove = []
-
-            for role_id in role_ids:
-                role = await self.role_service.get_role_by_id(role_id)
-                if role in user.roles:
-                    roles_to_remove.append(role)
-
-            if roles_to_remove:
-                for role in roles_to_remove:
-                    user.roles.remove(role)
-                await self.db_session.commit()
-            else:
+            await self.user_service.ensure_object_exists(User, user_id)
+            roles = await self.role_service.get_roles_by_ids(role_ids)
+
+            deleted = await delete_links(
+                self.db_session,
+                user_roles_table,
+                "user_id",
+                user_id,
+                "role_id",
+                target_ids=[role.id for role in roles],
+            )
+            if not deleted:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Ни одна из указанных ролей не назначена пользователю.",
                 )
+            await self.db_session.commit()
         except Exception as e:
             await self.db_session.rollback()
             logger.error(f"Error removing roleS from the user: {e}")
@@ -172,6 +187,8 @@ class UserRoleAssociationService:
         """
         try:
             role = await self.role_service.get_role_by_id(role_id)
+            # Справочник берётся из кэша, коллекция пользователей не загружена - грузим явно
+            await self.db_session.refresh(role, attribute_names=["users"])
             return role.users
         except Exception as e:
             await self.db_session.rollback()
@@ -188,7 +205,9 @@ class UserRoleAssociationService:
         :raises HTTPException: Если пользователь не найден или произошла ошибка базы данных.
         """
         try:
-            user = await self.user_service.get_user_by_id(user_id)
+            user = await self.user_service.get_user_by_id(
+                user_id, profile=UserLoadingProfile.MINIMAL, include=[User.roles]
+            )
             return user.roles
         except Exception as e:
             await self.db_session.rollback()
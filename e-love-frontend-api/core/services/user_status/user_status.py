@@ -1,14 +1,14 @@
 """ User status service module """
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.db.models.users.user_status import UserStatus
 from core.services.base_service import BaseService
+from core.services.reference_data.reference_data import reference_data_cache
 from exceptions.exception_handler import ExceptionHandler
 
 logger = logging.getLogger(__name__)
@@ -34,9 +34,9 @@ class UserStatusService(BaseService):
         :return: Созданный объект статуса пользователя.
         """
         try:
-            return await self.create_object(
-                model=UserStatus, data=status_data, unique_fields=["status_name"]
-            )
+            status = await self.create_object(model=UserStatus, data=status_data)
+            await reference_data_cache.refresh(UserStatus)
+            return status
         except Exception as e:
             await self.db_session.rollback()
             logger.error(f"Unexpected error while creating user status: {e}")
@@ -44,26 +44,46 @@ class UserStatusService(BaseService):
 
     async def get_status_by_id(self, status_id: UUID) -> UserStatus:
         """
-        Получает статус пользователя по его ID.
+        Получает статус пользователя по его ID из кэша справочников (без запроса к БД).
 
         :param status_id: Идентификатор статус.
-        :return: Объект статуса пользователя.
+        :return: Объект статуса пользователя, привязанный к текущей сессии.
         """
         try:
-            return await self.get_object_by_id(UserStatus, status_id)
+            return await reference_data_cache.get_by_id_or_404(
+                UserStatus, status_id, self.db_session
+            )
         except Exception as e:
-            await self.db_session.rollback()
             logger.error(f"Unexpected error while getting status: {e}")
             ExceptionHandler(e)
 
+    async def get_statuses_by_ids(self, status_ids: List[UUID]) -> List[UserStatus]:
+        """
+        Получает несколько статусов по ID из кэша справочников (без запросов к БД).
+
+        :param status_ids: Список идентификаторов.
+        :return: Список объектов, привязанных к текущей сессии.
+        :raises HTTPException: Если часть идентификаторов не найдена (404 со списком всех).
+        """
+        try:
+            return await reference_data_cache.get_by_ids(UserStatus, status_ids, self.db_session)
+        except Exception as e:
+            logger.error(f"Error getting UserStatus objects by ids: {e}")
+            ExceptionHandler(e)
+
+    async def get_status_by_name(self, status_name: str) -> Optional[UserStatus]:
+        """
+        Получает статус пользователя по названию из кэша справочников.
+
+        :param status_name: Название статуса.
+        :return: Объект статуса пользователя или None.
+        """
+        return await reference_data_cache.get_by_name(UserStatus, status_name, self.db_session)
+
     async def get_status_list(self) -> List[UserStatus]:
         try:
-            query = select(UserStatus)
-            result = await self.db_session.execute(query)
-            statuses = result.scalars().all()
-            return statuses
+            return await reference_data_cache.get_list(UserStatus)
         except Exception as e:
-            await self.db_session.rollback()
             logger.error(f"Unexpected error while getting status list: {e}")
             ExceptionHandler(e)
 
@@ -76,7 +96,11 @@ class UserStatusService(BaseService):
         :return: Обновленный объект статуса пользователя.
         """
         try:
-            return await self.update_object(model=UserStatus, object_id=status_id, data=update_data)
+            status = await self.update_object(
+                model=UserStatus, object_id=status_id, data=update_data
+            )
+            await reference_data_cache.refresh(UserStatus)
+            return status
         except Exception as e:
             await self.db_session.rollback()
             logger.error(f"Unexpected error while updating status: {e}")
@@ -90,6 +114,7 @@ class UserStatusService(BaseService):
         """
         try:
             await self.delete_object_by_id(UserStatus, status_id)
+            await reference_data_cache.refresh(UserStatus)
         except Exception as e:
             await self.db_session.rollback()
             logger.error(f"Unexpected error while deleting status: {e}")
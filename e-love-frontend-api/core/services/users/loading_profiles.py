@@ -0,0 +1,49 @@
+""" User loading profiles module """
+
+from enum import Enum
+from typing import Any, Dict, List, Sequence, Tuple
+
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
+
+from core.db.models.users.users import User
+
+
+class UserLoadingProfile(str, Enum):
+    """
+    Именованные профили загрузки связей User.
+
+    - MINIMAL: только колонки пользователя, связи не загружаются;
+    - CARD: колонки + гендеры и категории (карточка пользователя, данные для матчинга);
+    - FULL: всё, что рендерит UserOutput - гендеры, категории и посты.
+
+    Связи, не входящие в профиль, помечаются raiseload: случайное обращение к ним
+    падает сразу, а не выполняет скрытый запрос.
+    """
+
+    MINIMAL = "minimal"
+    CARD = "card"
+    FULL = "full"
+
+
+USER_PROFILE_RELATIONSHIPS: Dict[UserLoadingProfile, Tuple[Any, ...]] = {
+    UserLoadingProfile.MINIMAL: (),
+    UserLoadingProfile.CARD: (User.genders, User.categories),
+    UserLoadingProfile.FULL: (User.genders, User.categories, User.posts),
+}
+
+
+def user_loader_options(
+    profile: UserLoadingProfile = UserLoadingProfile.FULL, include: Sequence[Any] = ()
+) -> List[ORMOption]:
+    """
+    Возвращает loader options для select(User) по профилю.
+
+    :param profile: Профиль загрузки.
+    :param include: Дополнительные связи сверх профиля (например, User.roles).
+    :return: Список опций для Select.options(...).
+    """
+    relationships = dict.fromkeys((*USER_PROFILE_RELATIONSHIPS[profile], *include))
+    options: List[ORMOption] = [selectinload(relationship) for relationship in relationships]
+    options.append(raiseload("*"))
+    return options
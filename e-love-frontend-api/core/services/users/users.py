@@ -1,15 +1,18 @@
 """ User service module """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Union
 from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.db.models.users.users import User
-from core.schemas.users.user_schema import UserUpdate
+from core.schemas.users.user_schema import UserBulkUpdateItem, UserCreate, UserUpdate
 from core.services.base_service import BaseService
+from core.services.password_hashing.password_hashing import password_hashing_service
+from core.services.users.loading_profiles import UserLoadingProfile, user_loader_options
 from exceptions.exception_handler import ExceptionHandler
 from utils.custom_pagination import Paginator
 
@@ -31,22 +34,47 @@ class UserService(BaseService):
         self.db_session = db_session
         self.paginator = Paginator[User](db_session=db_session, model=User)
 
-    async def _preprocess_user(self, user: User, data: Dict[str, Any]) -> None:
+    async def _hash_password(self, data: Dict[str, Any]) -> None:
+        """
+        Заменяет открытый пароль в данных на его хеш. Хеширование выполняется в пуле,
+        чтобы bcrypt не блокировал event loop.
+        """
         password = data.pop("password", None)
         if password:
-            user.set_password(password)
+            data["password_hash"] = await password_hashing_service.hash(password)
+
+    async def _preprocess_user(self, user: User, data: Dict[str, Any]) -> None:
+        await self._hash_password(data)
 
     # TODO: можно отрефакторить, если в user_data заместо any добавить доп. тип в виде словаря (модели юзера) для лучшей типизации
-    async def create_user(self, user_data: Dict[str, Any]) -> User:
-        return await self.create_object(
-            model=User,
-            data=user_data,
-            unique_fields=["email"],
-            preprocess_func=self._preprocess_user,
-        )
+    async def create_user(self, user_data: Union[Dict[str, Any], UserCreate]) -> User:
+        if isinstance(user_data, UserCreate):
+            user_data = user_data.dict()
+        else:
+            user_data = dict(user_data)
+
+        # Пароль хешируется до создания объекта: в модели User нет поля password
+        await self._hash_password(user_data)
+
+        return await self.create_object(model=User, data=user_data)
+
+    async def get_user_by_id(
+        self,
+        user_id: UUID,
+        profile: UserLoadingProfile = UserLoadingProfile.FULL,
+        include: Sequence[Any] = (),
+    ) -> User:
+        """
+        Получает пользователя по ID.
 
-    async def get_user_by_id(self, user_id: UUID) -> User:
-        return await self.get_object_by_id(User, user_id)
+        :param user_id: Идентификатор пользователя.
+        :param profile: Профиль загрузки связей (по умолчанию - всё, что рендерит UserOutput).
+        :param include: Дополнительные связи сверх профиля (например, User.roles).
+        :return: Объект пользователя.
+        """
+        return await self.get_object_by_id(
+            User, user_id, options=user_loader_options(profile, include)
+        )
 
     async def get_users_list(
         self,
@@ -54,26 +82,35 @@ class UserService(BaseService):
         email: Optional[str] = None,
         next_token: Optional[str] = None,
         isFullListRequested: Optional[bool] = False,
+        profile: UserLoadingProfile = UserLoadingProfile.FULL,
     ) -> List[User]:
         """
         Получает список пользователей с поддержкой пагинации.
 
         :param limit: Количество записей на странице.
         :param email: Фильтр по email.
+        :param isFullListRequested: Вернуть всех пользователей одной "страницей" (читается
+            пачками через stream_users; для больших выгрузок лучше сам stream_users).
+        :param profile: Профиль загрузки связей пользователей.
         :return: Список объектов пользователей.
         :raises HTTPException: Если произошла ошибка базы данных.
         """
+        if isFullListRequested:
+            users = [
+                user
+                async for batch in self.stream_users(email=email, profile=profile)
+                for user in batch
+            ]
+            return {"users": users, "has_next": False, "next_token": None}
+
         try:
             filters = None
 
-            base_query = select(User)
+            base_query = select(User).options(*user_loader_options(profile))
 
             if email:
                 filters = User.email == email
 
-            if isFullListRequested:
-                limit = None
-
             response = await self.paginator.paginate_query(
                 base_query=base_query,
                 next_token=next_token,
@@ -89,12 +126,50 @@ class UserService(BaseService):
             logger.error(f"Error while fetching users: {e}")
             ExceptionHandler(e)
 
+    async def stream_users(
+        self,
+        batch_size: int = 500,
+        email: Optional[str] = None,
+        profile: UserLoadingProfile = UserLoadingProfile.FULL,
+    ) -> AsyncIterator[List[User]]:
+        """
+        Отдаёт всех пользователей пачками фиксированного размера в порядке (created_at, id).
+
+        Строки читаются серверным курсором (AsyncSession.stream + yield_per), связи профиля
+        догружаются selectin-запросом на каждую пачку. Identity map сессии держит объекты
+        по слабым ссылкам, поэтому уже обработанные пачки не накапливаются в памяти.
+
+        :param batch_size: Размер пачки.
+        :param email: Фильтр по email.
+        :param profile: Профиль загрузки связей пользователей.
+        :return: Асинхронный итератор пачек пользователей.
+        :raises HTTPException: Если произошла ошибка базы данных.
+        """
+        query = (
+            select(User)
+            .options(*user_loader_options(profile))
+            .order_by(User.created_at, User.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if email:
+            query = query.where(User.email == email)
+
+        try:
+            result = await self.db_session.stream(query)
+            async for batch in result.scalars().partitions():
+                yield list(batch)
+        except Exception as e:
+            await self.db_session.rollback()
+            logger.error(f"Error while streaming users: {e}")
+            ExceptionHandler(e)
+
     async def update_user(self, user_id: UUID, update_data: UserUpdate) -> User:
         return await self.update_object(
             model=User,
             object_id=user_id,
             data=update_data.dict(exclude_unset=True),
             preprocess_func=self._preprocess_user,
+            options=user_loader_options(UserLoadingProfile.FULL),
         )
 
     async def delete_user(self, user_id: UUID) -> User:
@@ -105,3 +180,34 @@ class UserService(BaseService):
         #     await self.db_session.rollback()
         #     logger.error(f"Error while deleting user: {e}")
         #     ExceptionHandler(e)
+
+    async def create_users(self, users_data: List[UserCreate]) -> List[User]:
+        """
+        Создает нескольких пользователей одним INSERT (BULK).
+
+        :param users_data: Список данных пользователей.
+        :return: Список созданных пользователей.
+        """
+        rows = [user_data.model_dump() for user_data in users_data]
+        await asyncio.gather(*(self._hash_password(row) for row in rows))
+        return await self.create_objects(model=User, data=rows)
+
+    async def update_users(self, users_data: List[UserBulkUpdateItem]) -> List[User]:
+        """
+        Обновляет нескольких пользователей одним UPDATE (BULK).
+
+        :param users_data: Список обновлений (каждое с id пользователя).
+        :return: Список обновлённых пользователей.
+        """
+        rows = [user_data.model_dump(exclude_unset=True) for user_data in users_data]
+        await asyncio.gather(*(self._hash_password(row) for row in rows))
+        return await self.update_objects(model=User, data=rows)
+
+    async def delete_users(self, user_ids: List[UUID]) -> int:
+        """
+        Удаляет нескольких пользователей одним DELETE (BULK).
+
+        :param user_ids: Идентификаторы пользователей.
+        :return: Количество удалённых пользователей.
+        """
+        return await self.delete_objects_by_ids(User, user_ids)
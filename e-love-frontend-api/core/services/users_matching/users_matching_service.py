@@ -20,10 +20,12 @@ from core.db.models.intermediate_models.user_categories import user_categories_t
 from core.db.models.users.users import User
 from core.services.user_categories.user_categories import UserCategoriesAssociationService
 from core.services.user_interaction.user_interaction import UserInteractionService
+from core.services.users.loading_profiles import UserLoadingProfile, user_loader_options
 from core.services.users.users import UserService
 from exceptions.exception_handler import ExceptionHandler
 from utils.custom_pagination import Paginator
 from utils.enums.matching_type import MATCHING_PERCENTAGE_RANGES, MatchingType
+from utils.enums.sort_direction import SortDirection
 from utils.functions.get_total_count import get_total_count
 
 logger = logging.getLogger(__name__)
@@ -181,6 +183,7 @@ class UsersMatchingService:
         # TODO: Оптимизировать (возможно) , добавляя ограничение на кол-во возвращаемых постов и категорий. (будет видно в будущем)
         base_query = (
             select(User)
+            .options(*user_loader_options(UserLoadingProfile.FULL))
             .join(potential_users_subq, User.id == potential_users_subq.c.user_id)
             .where(and_(overlap_percentage >= min_percentage, overlap_percentage <= max_percentage))
             .order_by(overlap_percentage.desc())
@@ -201,7 +204,9 @@ class UsersMatchingService:
         """
         ai_microservice_client = AiMicroserviceClient(AI_SERVICE_URL)
         try:
-            current_user = await self.user_service.get_user_by_id(current_user_id)
+            current_user = await self.user_service.get_user_by_id(
+                current_user_id, profile=UserLoadingProfile.CARD
+            )
             if not current_user:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -297,11 +302,18 @@ class UsersMatchingService:
                 matching_type=matching_type,
             )
 
+            # Курсор должен следовать порядку выдачи (процент совпадения по убыванию),
+            # иначе страницы пересекаются и теряют пользователей
             paginated_response = await self.paginator.paginate_query(
                 limit=limit,
                 base_query=main_query,
                 model_name="matching_users",
                 next_token=next_token,
+                order_by=[
+                    (overlap_percentage_result, SortDirection.DESC),
+                    (User.created_at, SortDirection.ASC),
+                    (User.id, SortDirection.ASC),
+                ],
             )
 
             # Используем три строчки внизу для того чтобы вернуть Tuple в виде:
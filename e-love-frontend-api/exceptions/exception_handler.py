@@ -34,6 +34,10 @@ class ExceptionHandler:
         :param exception: Исключение, которое нужно обработать.
         :raises HTTPException: Преобразованное исключение с соответствующим статусом и сообщением.
         """
+        # Уже сформированный HTTP-ответ (404, 400 и т.д.) пробрасывается как есть
+        if isinstance(exception, HTTPException):
+            raise exception
+
         http_exception = self.map_exception(exception=exception)
 
         if http_exception:
@@ -80,7 +84,8 @@ class ExceptionHandler:
                     error_detail = {"errors": exception.errors()}
                 elif isinstance(exception, IntegrityError):
                     error_str = str(exception.orig).lower()
-                    if "unique constraint" in error_str:
+                    # MySQL: "Duplicate entry ... for key ...", SQLite/PostgreSQL: "unique constraint"
+                    if "unique constraint" in error_str or "duplicate entry" in error_str:
                         message = CommonExceptions.UNIQUE_CONSTRAINT_VIOLATION.value
                     elif "foreign key constraint" in error_str:
                         message = CommonExceptions.FOREIGN_KEY_CONSTRAINT_VIOLATION.value
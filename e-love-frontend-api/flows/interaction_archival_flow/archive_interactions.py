@@ -0,0 +1,44 @@
+import logging
+from datetime import datetime, timedelta, timezone
+
+from prefect import flow
+
+from configuration.config import settings
+from flows.db_context.get_db_context import create_db_context
+from flows.tasks.interactions_archiving.archive_rejected_interactions_task import (
+    archive_rejected_interactions_task,
+)
+
+"""
+Interaction archival flow.
+"""
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+@flow(name="Interaction Archival Flow", log_prints=True)
+async def interaction_archival_flow(
+    older_than_days: int = settings.interaction_archive_after_days,
+    batch_size: int = settings.interaction_archive_batch_size,
+) -> int:
+    """
+    Async Prefect flow: переносит старые REJECT-свайпы в user_interaction_archive,
+    чтобы user_interaction оставалась небольшой. Архивные пользователи по-прежнему
+    исключаются из матчинга (UserInteractionService.get_viewed_users_list).
+
+    :param older_than_days: Архивировать свайпы старше стольких дней.
+    :param batch_size: Размер пачки переноса.
+    :return: Количество перенесённых свайпов.
+    """
+    older_than = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+    async with create_db_context() as session:
+        archived = await archive_rejected_interactions_task(session, older_than, batch_size)
+        logger.info(f"Interaction archival completed: {archived} interaction(s) archived.")
+        return archived
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    asyncio.run(interaction_archival_flow())
@@ -0,0 +1,91 @@
+import logging
+from datetime import datetime
+
+from prefect import task
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.db.models.users.user_interaction import UserInteraction
+from core.db.models.users.user_interaction_archive import user_interaction_archive_table
+from core.schemas.user_interaction.user_interaction_schema import InteractionType
+from exceptions.exception_handler import ExceptionHandler
+
+"""
+Prefect task for moving old REJECT interactions into the archive table.
+"""
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+@task
+async def archive_rejected_interactions_task(
+    db_session: AsyncSession, older_than: datetime, batch_size: int
+) -> int:
+    """
+    Переносит REJECT-свайпы, созданные раньше older_than, из user_interaction
+    в user_interaction_archive пачками по batch_size, по коммиту на пачку.
+
+    MATCH-свайпы не архивируются: по ним ищутся взаимные мэтчи и строятся выборки взаимодействий.
+
+    :param db_session: Асинхронная сессия базы данных.
+    :param older_than: Граница по created_at.
+    :param batch_size: Размер пачки.
+    :return: Количество перенесённых свайпов.
+    """
+    archived = 0
+    try:
+        while True:
+            result = await db_session.execute(
+                select(
+                    UserInteraction.id,
+                    UserInteraction.user_id,
+                    UserInteraction.target_user_id,
+                    UserInteraction.created_at,
+                )
+                .where(
+                    UserInteraction.interaction_type == InteractionType.REJECT.value,
+                    UserInteraction.created_at < older_than,
+                )
+                .order_by(UserInteraction.created_at, UserInteraction.id)
+                .limit(batch_size)
+            )
+            rows = result.all()
+            if not rows:
+                break
+
+            await db_session.execute(
+                insert(user_interaction_archive_table)
+                .prefix_with("IGNORE", dialect="mysql")
+                .prefix_with("OR IGNORE", dialect="sqlite")
+                .values(
+                    [
+                        {
+                            "user_id": row.user_id,
+                            "target_user_id": row.target_user_id,
+                            "created_at": row.created_at,
+                        }
+                        for row in rows
+                    ]
+                )
+            )
+            # Повторный свайп (upsert) мог за это время сменить REJECT на MATCH - такие строки остаются
+            await db_session.execute(
+                delete(UserInteraction).where(
+                    UserInteraction.id.in_([row.id for row in rows]),
+                    UserInteraction.interaction_type == InteractionType.REJECT.value,
+                )
+            )
+            await db_session.commit()
+
+            archived += len(rows)
+            logger.info(f"Archived {archived} rejected interaction(s) so far.")
+            if len(rows) < batch_size:
+                break
+
+        return archived
+
+    except Exception as e:
+        await db_session.rollback()
+        logger.error(f"Error archiving rejected interactions after {archived} row(s): {e}")
+        ExceptionHandler(e)
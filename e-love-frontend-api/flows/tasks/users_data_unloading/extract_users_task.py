@@ -5,6 +5,7 @@ from prefect import task
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.db.types.uuid_key import UUIDKey
 from exceptions.exception_handler import ExceptionHandler
 
 """
@@ -42,7 +43,7 @@ async def extract_users_task(db_session: AsyncSession) -> pd.DataFrame:
             WHERE u1.id != u2.id
             GROUP BY u1.id, u2.id
             """
-        )
+        ).columns(current_user_id=UUIDKey(), candidate_user_id=UUIDKey())
         result = await db_session.execute(sql)
         rows = result.fetchall()
 
@@ -6,8 +6,12 @@ from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
 from api.v1.router.router import api_router as main_router
+from auth.security import jwt_service
 from configuration.config import settings
-from configuration.database import Base, engine
+from configuration.database import Base, engine, get_pool_metrics
+from core.services.interaction_buffer.interaction_buffer import interaction_write_buffer
+from core.services.password_hashing.password_hashing import password_hashing_service
+from core.services.reference_data.reference_data import reference_data_cache
 from easter_eggs.greeting import ascii_hello_devs, ascii_painter
 from utils.enums.common_exceptions import CommonExceptions
 
@@ -53,6 +57,18 @@ async def config_info():
     }
 
 
+@app.get("/db-pool-metrics")
+async def db_pool_metrics():
+    """
+    This route returns the DB connection pool metrics of the current worker process
+    (checked out / overflow / wait time). Use it to size the pool against the uvicorn workers count.
+    """
+    return {
+        "engine": settings.db_engine.model_dump(),
+        "pool": get_pool_metrics(),
+    }
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,6 +76,21 @@ logger = logging.getLogger(__name__)
 async def startup_event():
     # Добавляем вызов функции создания таблиц
     await create_tables()
+    # Справочники (категории, гендеры, роли, статусы) держим в памяти процесса
+    await reference_data_cache.load_all()
+    # JWKS грузится в фоне - старт не блокируется сетью
+    jwt_service.jwks_provider.start()
+    if settings.interaction_buffer_enabled:
+        # Дозаписывает свайпы, оставшиеся в spill-файле после падения, и запускает фоновый сброс
+        await interaction_write_buffer.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    # Сначала сбрасываем свайпы из буфера - пока пул соединений ещё жив
+    await interaction_write_buffer.stop()
+    await jwt_service.jwks_provider.stop()
+    password_hashing_service.shutdown()
 
 
 async def create_tables():
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Простой нагрузочный бенчмарк HTTP-эндпоинта: считает RPS и перцентили латентности.
+
+Пример (защищённый эндпоинт, токен проверяется Authenticator.authenticate):
+
+    python -m scripts.benchmarks.http_rps \\
+        --url http://localhost:8080/api/v1/users/<user_id> \\
+        --token "$ACCESS_TOKEN" --concurrency 50 --duration 15
+
+Чтобы получить замер "до" для кэша проверенных токенов, запустите сервис с
+VERIFIED_TOKEN_CACHE_SIZE=0 (кэш выключен), "после" - с настройками по умолчанию.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+
+async def _worker(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    deadline: float,
+    latencies: List[float],
+    errors: List[int],
+) -> None:
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url)
+            if response.status_code >= 400:
+                errors.append(response.status_code)
+        except httpx.HTTPError:
+            errors.append(0)
+        latencies.append(time.perf_counter() - started)
+
+
+async def run_benchmark(
+    url: str,
+    token: Optional[str] = None,
+    method: str = "GET",
+    concurrency: int = 20,
+    duration: float = 10.0,
+) -> Dict[str, float]:
+    """
+    Нагружает url в `concurrency` корутин в течение `duration` секунд.
+
+    :return: Словарь с rps, количеством запросов/ошибок и перцентилями латентности (мс).
+    """
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    latencies: List[float] = []
+    errors: List[int] = []
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(headers=headers, limits=limits, timeout=30.0) as client:
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(
+            *(_worker(client, method, url, deadline, latencies, errors) for _ in range(concurrency))
+        )
+        elapsed = time.perf_counter() - started
+
+    latencies_ms = sorted(latency * 1000 for latency in latencies) or [0.0]
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies_ms),
+        "p95_ms": latencies_ms[int(len(latencies_ms) * 0.95) - 1],
+        "p99_ms": latencies_ms[int(len(latencies_ms) * 0.99) - 1],
+        "max_ms": latencies_ms[-1],
+    }
+
+
+def print_report(title: str, report: Dict[str, float]) -> None:
+    print(f"--- {title} ---")
+    for key, value in report.items():
+        print(f"{key:>10}: {value:.2f}" if isinstance(value, float) else f"{key:>10}: {value}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="HTTP endpoint RPS benchmark")
+    parser.add_argument("--url", required=True)
+    parser.add_argument("--token", default=None, help="Bearer access token")
+    parser.add_argument("--method", default="GET")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=10.0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    result = asyncio.run(
+        run_benchmark(
+            url=args.url,
+            token=args.token,
+            method=args.method,
+            concurrency=args.concurrency,
+            duration=args.duration,
+        )
+    )
+    print_report(f"{args.method} {args.url}", result)
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк сериализации списковых эндпоинтов на страницах по 100 элементов.
+
+Нагружает GET /api/v1/users/, GET /api/v1/user-post/ и GET /api/v1/users-matching/standart.
+Замер "до" - сервис запущен с FAST_JSON_RESPONSES=false (стандартный APIRoute + JSONResponse),
+"после" - с настройками по умолчанию (FastJSONRoute: TypeAdapter.dump_json).
+
+    python -m scripts.benchmarks.list_serialization \\
+        --base-url http://localhost:8080 --token "$ACCESS_TOKEN" \\
+        --current-user-id <user_id> --concurrency 20 --duration 15
+"""
+
+import argparse
+import asyncio
+from typing import List, Optional, Tuple
+
+from scripts.benchmarks.http_rps import print_report, run_benchmark
+
+PAGE_SIZE = 100
+
+
+def build_targets(base_url: str, current_user_id: Optional[str]) -> List[Tuple[str, str]]:
+    base_url = base_url.rstrip("/")
+    targets = [
+        ("users", f"{base_url}/api/v1/users/?limit={PAGE_SIZE}"),
+        ("user-post", f"{base_url}/api/v1/user-post/?limit={PAGE_SIZE}"),
+    ]
+    if current_user_id:
+        targets.append(
+            (
+                "users-matching/standart",
+                f"{base_url}/api/v1/users-matching/standart"
+                f"?current_user_id={current_user_id}&limit={PAGE_SIZE}",
+            )
+        )
+    return targets
+
+
+async def main(args: argparse.Namespace) -> None:
+    for title, url in build_targets(args.base_url, args.current_user_id):
+        report = await run_benchmark(
+            url=url, token=args.token, concurrency=args.concurrency, duration=args.duration
+        )
+        print_report(f"GET {title} (limit={PAGE_SIZE})", report)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="List endpoints serialization benchmark")
+    parser.add_argument("--base-url", default="http://localhost:8080")
+    parser.add_argument("--token", default=None, help="Bearer access token")
+    parser.add_argument(
+        "--current-user-id",
+        default=None,
+        help="Пользователь для /users-matching/standart (без него эндпоинт пропускается)",
+    )
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=10.0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
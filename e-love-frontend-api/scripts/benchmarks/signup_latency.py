@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Нагрузочный тест: латентность "соседнего" эндпоинта во время волны регистраций.
+
+Сначала меряется фон (только probe-эндпоинт), затем тот же замер повторяется, пока
+параллельно идут POST /api/v1/users/ (bcrypt-хеширование пароля). Если хеширование
+блокирует event loop, p95/p99 probe-эндпоинта во втором замере резко вырастут.
+
+Считаются регистрации, дошедшие до хеширования пароля: ответ после валидации и авторизации,
+даже если сама вставка пользователя завершилась ошибкой (нагрузку создаёт именно bcrypt).
+401/403/422 отсекаются до хеширования и не считаются.
+
+    python -m scripts.benchmarks.signup_latency \\
+        --base-url http://localhost:8080 --token "$ADMIN_ACCESS_TOKEN" \\
+        --probe-path /hello --signup-concurrency 8
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+import httpx
+
+from scripts.benchmarks.http_rps import print_report, run_benchmark
+
+# Ответы, которые API отдаёт до хеширования пароля
+_REJECTED_BEFORE_HASHING = {401, 403, 422}
+
+
+async def _signup_worker(client: httpx.AsyncClient, url: str, deadline: float) -> int:
+    hashed = 0
+    while time.perf_counter() < deadline:
+        suffix = uuid.uuid4().hex[:12]
+        payload = {
+            "first_name": "Load",
+            "last_name": "Test",
+            "email": f"load-{suffix}@example.com",
+            "password": f"password-{suffix}",
+        }
+        try:
+            response = await client.post(url, json=payload)
+            if response.status_code not in _REJECTED_BEFORE_HASHING:
+                hashed += 1
+        except httpx.HTTPError:
+            pass
+    return hashed
+
+
+async def main(args: argparse.Namespace) -> None:
+    probe_url = f"{args.base_url.rstrip('/')}{args.probe_path}"
+    signup_url = f"{args.base_url.rstrip('/')}/api/v1/users/"
+
+    baseline = await run_benchmark(
+        url=probe_url, token=args.token, concurrency=args.concurrency, duration=args.duration
+    )
+    print_report("probe without signups", baseline)
+
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+    async with httpx.AsyncClient(headers=headers, timeout=30.0) as client:
+        deadline = time.perf_counter() + args.duration
+        signups = asyncio.gather(
+            *(_signup_worker(client, signup_url, deadline) for _ in range(args.signup_concurrency))
+        )
+        under_load = await run_benchmark(
+            url=probe_url, token=args.token, concurrency=args.concurrency, duration=args.duration
+        )
+        hashed = sum(await signups)
+
+    if not hashed:
+        print("No signup request reached password hashing - check --token and the payload.")
+    print_report(f"probe during signups ({hashed} passwords hashed)", under_load)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Probe latency during signups")
+    parser.add_argument("--base-url", required=True)
+    parser.add_argument("--token", default=None, help="Admin bearer access token")
+    parser.add_argument("--probe-path", default="/hello")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--signup-concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10.0)
+    asyncio.run(main(parser.parse_args()))
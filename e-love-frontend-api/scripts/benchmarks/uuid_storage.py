@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Сравнение хранения UUID-ключей: VARCHAR(36) против BINARY(16) (UUID_BINARY_STORAGE).
+
+Печатает размеры данных/индексов таблиц с UUID-ключами (information_schema, MySQL) и
+замеряет запросы, типичные для матчинга: выборку кандидатов с NOT IN по списку уже
+просмотренных пользователей и выборку взаимодействий по IN-списку.
+
+Порядок замера на засеянной БД (scripts/db_scripts/populate_db.py):
+
+    python -m scripts.benchmarks.uuid_storage            # VARCHAR(36)
+    python -m scripts.db_scripts.convert_uuid_storage --to binary
+    UUID_BINARY_STORAGE=true python -m scripts.benchmarks.uuid_storage
+
+Размеры в information_schema обновляются после ANALYZE TABLE (скрипт выполняет его сам).
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List
+
+from sqlalchemy import bindparam, func, select, text
+
+from configuration.config import settings
+from configuration.database import AsyncSessionLocal, engine
+from core.db.models.users.user_interaction import UserInteraction
+from core.db.models.users.users import User
+
+TABLES = (
+    "user",
+    "user_interaction",
+    "user_post",
+    "user_images",
+    "user_roles",
+    "user_genders",
+    "user_categories",
+    "posts_categories",
+)
+
+
+async def table_sizes() -> List[Dict[str, float]]:
+    async with engine.connect() as conn:
+        for table in TABLES:
+            await conn.execute(text(f"ANALYZE TABLE `{table}`"))
+        result = await conn.execute(
+            text(
+                """
+                SELECT table_name, table_rows, data_length, index_length
+                FROM information_schema.tables
+                WHERE table_schema = DATABASE() AND table_name IN :tables
+                ORDER BY table_name
+                """
+            ).bindparams(bindparam("tables", value=list(TABLES), expanding=True))
+        )
+        return [
+            {
+                "table": row[0],
+                "rows": row[1],
+                "data_kb": row[2] / 1024,
+                "index_kb": row[3] / 1024,
+            }
+            for row in result.fetchall()
+        ]
+
+
+async def time_queries(exclude_size: int, iterations: int) -> Dict[str, float]:
+    async with AsyncSessionLocal() as session:
+        user_ids = (await session.execute(select(User.id).limit(exclude_size + 1))).scalars().all()
+        current_user_id, excluded_ids = user_ids[0], user_ids[1:]
+
+        queries = {
+            "candidates_not_in": select(User.id)
+            .where(User.id != current_user_id, User.id.not_in(excluded_ids))
+            .limit(100),
+            "interactions_in": select(func.count())
+            .select_from(UserInteraction)
+            .where(UserInteraction.target_user_id.in_(excluded_ids)),
+        }
+
+        timings: Dict[str, float] = {}
+        for name, query in queries.items():
+            samples = []
+            for _ in range(iterations):
+                started = time.perf_counter()
+                await session.execute(query)
+                samples.append((time.perf_counter() - started) * 1000)
+            timings[f"{name}_p50_ms"] = statistics.median(samples)
+        return timings
+
+
+async def main(args: argparse.Namespace) -> None:
+    storage = "BINARY(16)" if settings.uuid_binary_storage else "VARCHAR(36)"
+    print(f"--- UUID storage: {storage} ---")
+    for size in await table_sizes():
+        print(
+            f"{size['table']:>18}: rows={size['rows']:<8} "
+            f"data={size['data_kb']:.0f}KB index={size['index_kb']:.0f}KB"
+        )
+    for key, value in (await time_queries(args.exclude_size, args.iterations)).items():
+        print(f"{key:>28}: {value:.2f}")
+    await engine.dispose()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="UUID key storage comparison")
+    parser.add_argument("--exclude-size", type=int, default=500, help="Размер IN/NOT IN списка")
+    parser.add_argument("--iterations", type=int, default=50)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Размер списка просмотренных пользователей у "тяжёлых" пользователей (с наибольшим
+количеством свайпов) до и после уникального ключа (user_id, target_user_id).
+
+Для каждого из --users самых активных пользователей печатает количество строк списка
+просмотренных (именно столько id уходит в NOT IN запроса кандидатов матчинга), сколько из
+них уникальных, и время самого списка и запроса кандидатов с NOT IN по нему.
+
+Порядок замера на засеянной БД с дублями свайпов (например, после повторных прогонов
+populate_db или нагрузочного теста без уникального ключа):
+
+    alembic downgrade c52e8f0b7a14
+    python -m scripts.benchmarks.viewed_list      # с дублями
+    alembic upgrade head                          # дедупликация + уникальный ключ
+    python -m scripts.benchmarks.viewed_list
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Dict, List
+
+from sqlalchemy import func, select
+
+from configuration.database import AsyncSessionLocal, engine
+from core.db.models.users.user_interaction import UserInteraction
+from core.db.models.users.users import User
+
+
+async def timed(session, query, iterations: int) -> Dict[str, Any]:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        result = await session.execute(query)
+        rows = result.fetchall()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {"rows": rows, "p50_ms": statistics.median(samples)}
+
+
+async def measure(users: int, iterations: int) -> List[Dict[str, Any]]:
+    async with AsyncSessionLocal() as session:
+        total = await session.scalar(select(func.count()).select_from(UserInteraction))
+        pairs = (
+            select(UserInteraction.user_id, UserInteraction.target_user_id)
+            .group_by(UserInteraction.user_id, UserInteraction.target_user_id)
+            .subquery()
+        )
+        unique_pairs = await session.scalar(select(func.count()).select_from(pairs))
+        print(f"user_interaction: rows={total} unique pairs={unique_pairs}")
+
+        heavy_users = (
+            (
+                await session.execute(
+                    select(UserInteraction.user_id)
+                    .group_by(UserInteraction.user_id)
+                    .order_by(func.count().desc())
+                    .limit(users)
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+        report = []
+        for user_id in heavy_users:
+            viewed = await timed(
+                session,
+                select(UserInteraction.target_user_id).where(UserInteraction.user_id == user_id),
+                iterations,
+            )
+            viewed_ids = [row[0] for row in viewed["rows"]]
+            candidates = await timed(
+                session,
+                select(User.id).where(User.id != user_id, User.id.not_in(viewed_ids)).limit(100),
+                iterations,
+            )
+            report.append(
+                {
+                    "user_id": user_id,
+                    "viewed_rows": len(viewed_ids),
+                    "viewed_unique": len(set(viewed_ids)),
+                    "viewed_p50_ms": viewed["p50_ms"],
+                    "candidates_not_in_p50_ms": candidates["p50_ms"],
+                }
+            )
+        return report
+
+
+async def main(args: argparse.Namespace) -> None:
+    for row in await measure(args.users, args.iterations):
+        print(
+            f"{row['user_id']}: viewed={row['viewed_rows']} (unique {row['viewed_unique']}) "
+            f"viewed_p50={row['viewed_p50_ms']:.2f}ms "
+            f"candidates_not_in_p50={row['candidates_not_in_p50_ms']:.2f}ms"
+        )
+    await engine.dispose()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Viewed users list size on heavy users")
+    parser.add_argument(
+        "--users", type=int, default=10, help="Сколько самых активных пользователей"
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
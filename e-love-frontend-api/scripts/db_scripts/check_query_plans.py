@@ -0,0 +1,227 @@
+# check_query_plans.py
+
+"""
+Проверка планов "горячих" запросов сервисов: для каждого выполняется EXPLAIN (MySQL),
+и скрипт завершается с кодом 1, если хоть одна таблица читается полным сканированием (type=ALL).
+
+Запросы строятся теми же средствами, что и в сервисах (Paginator.build_query,
+UsersMatchingService.build_*), поэтому проверяется реальная форма SQL, а не её копия.
+Запускать на засеянной БД (scripts/db_scripts/populate_db.py) - на почти пустых таблицах
+оптимизатор может предпочесть полный скан даже при наличии индекса.
+
+    python -m scripts.db_scripts.check_query_plans
+"""
+
+import asyncio
+import sys
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+from configuration.database import AsyncSessionLocal, engine
+from core.db.models.categories.categories import Categories
+from core.db.models.intermediate_models.user_categories import user_categories_table
+from core.db.models.posts.user_post import UserPost
+from core.db.models.users.user_images import UserImages
+from core.db.models.users.user_interaction import UserInteraction
+from core.db.models.users.user_interaction_archive import user_interaction_archive_table
+from core.db.models.users.users import User
+from core.services.categories.categories import CategoriesService
+from core.services.user_categories.user_categories import UserCategoriesAssociationService
+from core.services.user_interaction.user_interaction import UserInteractionService
+from core.services.users.users import UserService
+from core.services.users_matching.users_matching_service import UsersMatchingService
+from utils.custom_pagination import Paginator
+from utils.enums.matching_type import MatchingType
+from utils.enums.sort_direction import SortDirection
+
+PAGE_SIZE = 100
+
+
+class Explain(Executable, ClauseElement):
+    """
+    EXPLAIN поверх произвольного Select: параметры биндятся как в обычном запросе
+    (с учётом UUIDKey), поэтому план совпадает с тем, что выполняют сервисы.
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(Explain)
+def _compile_explain(element: Explain, compiler, **kw) -> str:
+    return "EXPLAIN " + compiler.process(element.statement, **kw)
+
+
+def _page_queries(model: Any, base_query: Select, first_row: Any) -> List[Tuple[str, Select]]:
+    """Первая страница и страница после курсора для Paginator по (created_at, id)."""
+    paginator = Paginator(db_session=None, model=model, limit=PAGE_SIZE)
+    name = model.__tablename__
+    queries = [(f"{name}: first page", paginator.build_query(base_query))]
+    if first_row is not None:
+        token = paginator.encode_token(first_row.created_at.isoformat(), str(first_row.id))
+        queries.append((f"{name}: page after cursor", paginator.build_query(base_query, token)))
+    return queries
+
+
+async def build_queries(session: AsyncSession) -> List[Tuple[str, Select]]:
+    user = (await session.execute(select(User).limit(1))).scalars().first()
+    if user is None:
+        raise RuntimeError("Database is empty - seed it with scripts/db_scripts/populate_db.py")
+    post = (await session.execute(select(UserPost).limit(1))).scalars().first()
+    image = (await session.execute(select(UserImages).limit(1))).scalars().first()
+    interaction = (await session.execute(select(UserInteraction).limit(1))).scalars().first()
+    user_ids = (await session.execute(select(User.id).limit(PAGE_SIZE))).scalars().all()
+    category_ids = (
+        (
+            await session.execute(
+                select(user_categories_table.c.category_id).where(
+                    user_categories_table.c.user_id == user.id
+                )
+            )
+        )
+        .scalars()
+        .all()
+    )
+    viewed_ids = (
+        (
+            await session.execute(
+                select(UserInteraction.target_user_id).where(UserInteraction.user_id == user.id)
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+    queries: List[Tuple[str, Select]] = []
+    queries += _page_queries(User, select(User), user)
+    queries += _page_queries(UserPost, select(UserPost), post)
+    queries += _page_queries(UserImages, select(UserImages), image)
+    queries += _page_queries(UserInteraction, select(UserInteraction), interaction)
+
+    images_paginator = Paginator(db_session=None, model=UserImages, limit=PAGE_SIZE)
+    queries.append(
+        (
+            "user_images: by user",
+            images_paginator.build_query(select(UserImages).where(UserImages.user_id == user.id)),
+        )
+    )
+    interactions_paginator = Paginator(db_session=None, model=UserInteraction, limit=PAGE_SIZE)
+    queries.append(
+        (
+            "user_interaction: by user",
+            interactions_paginator.build_query(
+                select(UserInteraction), filters=UserInteraction.user_id == user.id
+            ),
+        )
+    )
+    queries.append(
+        (
+            "user_interaction: viewed users",
+            select(UserInteraction.target_user_id).where(UserInteraction.user_id == user.id),
+        )
+    )
+    queries.append(
+        (
+            "user_interaction_archive: viewed users",
+            select(user_interaction_archive_table.c.target_user_id).where(
+                user_interaction_archive_table.c.user_id == user.id
+            ),
+        )
+    )
+
+    # selectinload(User.posts / User.categories) для страницы пользователей
+    queries.append(
+        ("user_post: selectin by users", select(UserPost).where(UserPost.user_id.in_(user_ids)))
+    )
+    queries.append(
+        (
+            "user_categories: selectin by users",
+            select(Categories)
+            .join(user_categories_table, user_categories_table.c.category_id == Categories.id)
+            .where(user_categories_table.c.user_id.in_(user_ids)),
+        )
+    )
+
+    if category_ids:
+        user_service = UserService(session)
+        matching_service = UsersMatchingService(
+            db_session=session,
+            user_interaction_service=UserInteractionService(session),
+            user_categories_service=UserCategoriesAssociationService(
+                db_session=session,
+                user_service=user_service,
+                category_service=CategoriesService(session),
+            ),
+            user_service=user_service,
+        )
+        potential_users_subq = await matching_service.build_potential_users_subquery(
+            current_user_id=user.id,
+            curr_user_category_ids=category_ids,
+            viewed_users_ids=viewed_ids,
+        )
+        overlap_percentage = await matching_service.calculate_overlap_percentage(
+            potential_users_subq, len(category_ids)
+        )
+        main_query = await matching_service.build_main_query(
+            potential_users_subq, overlap_percentage, MatchingType.STANDARD
+        )
+        matching_paginator = Paginator(
+            db_session=None,
+            model=User,
+            limit=PAGE_SIZE,
+            sort_keys=[
+                (overlap_percentage, SortDirection.DESC),
+                (User.created_at, SortDirection.ASC),
+                (User.id, SortDirection.ASC),
+            ],
+        )
+        queries.append(("matching: standart page", matching_paginator.build_query(main_query)))
+
+    return queries
+
+
+def find_full_scans(plan: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # <derivedN>/<subqueryN> - материализованные подзапросы, их полный проход ожидаем
+    return [
+        row
+        for row in plan
+        if str(row.get("type")).upper() == "ALL" and not str(row.get("table", "")).startswith("<")
+    ]
+
+
+async def main() -> int:
+    failed = 0
+    async with AsyncSessionLocal() as session:
+        if session.bind.dialect.name != "mysql":
+            print("EXPLAIN check supports MySQL only.")
+            return 1
+
+        for name, query in await build_queries(session):
+            result = await session.execute(Explain(query))
+            plan = [dict(row._mapping) for row in result.fetchall()]
+            full_scans = find_full_scans(plan)
+
+            status = "FULL SCAN" if full_scans else "ok"
+            print(f"[{status:>9}] {name}")
+            for row in plan:
+                print(
+                    f"{'':12}table={row.get('table')} type={row.get('type')} "
+                    f"key={row.get('key')} rows={row.get('rows')} extra={row.get('Extra')}"
+                )
+            failed += bool(full_scans)
+
+    await engine.dispose()
+    print(f"\n{failed} query(ies) with full table scans.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
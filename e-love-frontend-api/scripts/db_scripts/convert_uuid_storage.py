@@ -0,0 +1,181 @@
+# convert_uuid_storage.py
+
+"""
+Конвертация колонок с UUID-ключами между VARCHAR(36) и BINARY(16) (MySQL).
+
+Формат хранения ключей - свойство данных, а не ревизии схемы, поэтому он меняется этим
+скриптом, а не миграцией Alembic: скрипт запускается на БД в любой ревизии цепочки и не
+требует откатывать историю миграций. Ревизии, создающие таблицы с UUID-ключами, сами
+подстраиваются под текущий формат колонки user.id.
+
+Конвертируются все колонки моделей с типом UUIDKey и внешние ключи на них - те, что уже есть
+в БД и ещё не в целевом формате, поэтому повторный запуск ничего не меняет. Внешние ключи
+конвертируемых таблиц на время работы снимаются и затем создаются заново.
+
+    python -m scripts.db_scripts.convert_uuid_storage --to binary --dry-run
+    python -m scripts.db_scripts.convert_uuid_storage --to binary
+
+Приложение на время конвертации нужно остановить, а после - запустить с UUID_BINARY_STORAGE,
+соответствующим новому формату (true для binary, false для string): при несовпадении настройки
+и формата колонок запросы по ключам ничего не находят. DDL в MySQL не транзакционен, поэтому
+перед запуском на проде нужна резервная копия.
+"""
+
+import argparse
+import re
+from typing import Dict, List, Tuple
+
+from sqlalchemy import BINARY, VARBINARY, create_engine, inspect
+from sqlalchemy.engine import Connection
+
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from configuration.config import settings
+from configuration.database import DATABASE_URL, Base
+from core.db.models.audit_logs.audit_logs import AuditLogs
+from core.db.models.categories.categories import Categories
+from core.db.models.intermediate_models.posts_categories import posts_categories_table
+from core.db.models.intermediate_models.user_categories import user_categories_table
+from core.db.models.intermediate_models.user_genders import user_genders_table
+from core.db.models.intermediate_models.user_roles import user_roles_table
+from core.db.models.posts.user_post import UserPost
+from core.db.models.users.mutual_match import MutualMatch
+from core.db.models.users.user_gender import UserGender
+from core.db.models.users.user_images import UserImages
+from core.db.models.users.user_interaction import UserInteraction
+from core.db.models.users.user_interaction_archive import user_interaction_archive_table
+from core.db.models.users.user_role import UserRole
+from core.db.models.users.user_status import UserStatus
+from core.db.models.users.users import User
+from core.db.types.uuid_key import UUIDKey
+
+SYNC_DATABASE_URL = re.sub(r"\+asyncmy", "+pymysql", DATABASE_URL)
+
+# VARCHAR(36) -> BINARY(16) без потери ключей: сначала VARBINARY (байты строки сохраняются),
+# затем UNHEX в 16 байт и фиксированная длина
+TO_BINARY = (
+    "ALTER TABLE `{table}` MODIFY `{column}` VARBINARY(36) {null}",
+    "UPDATE `{table}` SET `{column}` = UNHEX(REPLACE(`{column}`, '-', ''))",
+    "ALTER TABLE `{table}` MODIFY `{column}` BINARY(16) {null}",
+)
+
+TO_STRING = (
+    "ALTER TABLE `{table}` MODIFY `{column}` VARBINARY(36) {null}",
+    "UPDATE `{table}` SET `{column}` = LOWER(INSERT(INSERT(INSERT(INSERT("
+    "HEX(`{column}`), 9, 0, '-'), 14, 0, '-'), 19, 0, '-'), 24, 0, '-'))",
+    "ALTER TABLE `{table}` MODIFY `{column}` VARCHAR(36) {null}",
+)
+
+
+def uuid_columns() -> List[Tuple[str, str]]:
+    """
+    Колонки моделей с UUID-ключами: тип UUIDKey или внешний ключ на такую колонку.
+    """
+    columns = []
+    for table in Base.metadata.sorted_tables:
+        for column in table.columns:
+            referred_types = [foreign_key.column.type for foreign_key in column.foreign_keys]
+            if isinstance(column.type, UUIDKey) or any(
+                isinstance(referred_type, UUIDKey) for referred_type in referred_types
+            ):
+                columns.append((table.name, column.name))
+    return columns
+
+
+def pending_columns(connection: Connection, to_binary: bool) -> List[Tuple[str, str, bool]]:
+    """
+    Колонки, которые есть в БД и ещё не в целевом формате: (таблица, колонка, nullable).
+    Таблицы, которых в текущей ревизии схемы нет, пропускаются.
+    """
+    inspector = inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+    columns_info: Dict[str, Dict[str, dict]] = {}
+
+    pending = []
+    for table, column in uuid_columns():
+        if table not in existing_tables:
+            continue
+        if table not in columns_info:
+            columns_info[table] = {info["name"]: info for info in inspector.get_columns(table)}
+        info = columns_info[table].get(column)
+        if info is None:
+            continue
+        if isinstance(info["type"], (BINARY, VARBINARY)) != to_binary:
+            pending.append((table, column, info["nullable"]))
+    return pending
+
+
+def convert(connection: Connection, to_binary: bool, dry_run: bool = False) -> int:
+    """
+    Конвертирует колонки в целевой формат.
+
+    :param connection: Соединение с БД (MySQL).
+    :param to_binary: True - в BINARY(16), False - в VARCHAR(36).
+    :param dry_run: Только вывести колонки, которые будут сконвертированы.
+    :return: Количество сконвертированных (для dry_run - ожидающих) колонок.
+    """
+    pending = pending_columns(connection, to_binary)
+    for table, column, _ in pending:
+        print(f"{'would convert' if dry_run else 'converting'} {table}.{column}")
+    if dry_run or not pending:
+        return len(pending)
+
+    operations = Operations(MigrationContext.configure(connection))
+    inspector = inspect(connection)
+    tables = {table for table, _, _ in pending}
+
+    # MySQL не даёт менять тип колонок, связанных внешними ключами: снимаются внешние ключи
+    # конвертируемых таблиц и внешние ключи других таблиц, ссылающиеся на них
+    foreign_keys = [
+        (table, foreign_key)
+        for table in inspector.get_table_names()
+        for foreign_key in inspector.get_foreign_keys(table)
+        if table in tables or foreign_key["referred_table"] in tables
+    ]
+    for table, foreign_key in foreign_keys:
+        operations.drop_constraint(foreign_key["name"], table, type_="foreignkey")
+
+    statements = TO_BINARY if to_binary else TO_STRING
+    for table, column, nullable in pending:
+        for statement in statements:
+            connection.exec_driver_sql(
+                statement.format(
+                    table=table, column=column, null="NULL" if nullable else "NOT NULL"
+                )
+            )
+
+    for table, foreign_key in foreign_keys:
+        operations.create_foreign_key(
+            foreign_key["name"],
+            table,
+            foreign_key["referred_table"],
+            foreign_key["constrained_columns"],
+            foreign_key["referred_columns"],
+            **foreign_key.get("options", {}),
+        )
+    return len(pending)
+
+
+def main(args: argparse.Namespace) -> None:
+    to_binary = args.to == "binary"
+    engine = create_engine(SYNC_DATABASE_URL)
+    try:
+        with engine.begin() as connection:
+            if connection.dialect.name != "mysql":
+                raise SystemExit("UUID storage conversion is only supported on MySQL.")
+            converted = convert(connection, to_binary, dry_run=args.dry_run)
+    finally:
+        engine.dispose()
+
+    print(f"{converted} column(s) {'to convert' if args.dry_run else 'converted'}.")
+    if settings.uuid_binary_storage != to_binary:
+        print(
+            f"Set UUID_BINARY_STORAGE={'true' if to_binary else 'false'} before starting the app."
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert UUID key columns storage")
+    parser.add_argument("--to", choices=("binary", "string"), required=True)
+    parser.add_argument("--dry-run", action="store_true")
+    main(parser.parse_args())
@@ -0,0 +1,101 @@
+# utils/cache/ttl_cache.py
+
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Iterator, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Простой in-process кэш с ограничением по времени жизни записей (TTL) и по размеру (LRU).
+
+    Кэш не потокобезопасен и рассчитан на использование внутри одного event loop,
+    где все операции выполняются синхронно между точками await.
+
+    Атрибуты:
+        maxsize (int): Максимальное количество записей. При переполнении вытесняется самая старая по использованию.
+        ttl (float): Время жизни записи по умолчанию в секундах.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 60.0,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Инициализирует экземпляр TTLCache.
+
+        :param maxsize: Максимальное количество записей в кэше.
+        :param ttl: Время жизни записи по умолчанию в секундах.
+        :param timer: Функция получения текущего времени (подменяется в тестах).
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """
+        Возвращает значение по ключу, если запись существует и ещё не истекла.
+
+        :param key: Ключ записи.
+        :param default: Значение, возвращаемое при промахе.
+        :return: Закэшированное значение или default.
+        """
+        item = self._data.get(key)
+        if item is None:
+            return default
+
+        expires_at, value = item
+        if expires_at <= self._timer():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """
+        Сохраняет значение в кэш.
+
+        :param key: Ключ записи.
+        :param value: Значение.
+        :param ttl: Индивидуальное время жизни записи в секундах. По умолчанию используется self.ttl.
+        """
+        expires_at = self._timer() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """
+        Удаляет запись из кэша и возвращает её значение (даже если запись уже истекла).
+
+        :param key: Ключ записи.
+        :param default: Значение, возвращаемое при отсутствии записи.
+        :return: Значение удалённой записи или default.
+        """
+        item = self._data.pop(key, None)
+        if item is None:
+            return default
+        return item[1]
+
+    def clear(self) -> None:
+        """Полностью очищает кэш."""
+        self._data.clear()
+
+    def __contains__(self, key: object) -> bool:
+        item = self._data.get(key)  # type: ignore[arg-type]
+        return item is not None and item[0] > self._timer()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(list(self._data.keys()))
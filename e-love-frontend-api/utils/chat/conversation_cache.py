@@ -0,0 +1,81 @@
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from configuration.config import settings
+from utils.cache.ttl_cache import TTLCache
+
+
+class ConversationCache:
+    """
+    Read-through cache for Chat-Microservice data.
+
+    Stores conversation metadata and the latest messages page per conversation,
+    so the chat list doesn't fan out one upstream call per conversation.
+    Entries are invalidated by ChatMicroserviceClient write methods and by the WebSocket proxy
+    whenever it relays a frame for a conversation.
+    """
+
+    def __init__(
+        self,
+        conversation_ttl: float,
+        messages_ttl: float,
+        maxsize: int,
+    ):
+        """
+        :param conversation_ttl: TTL (seconds) of conversation metadata entries.
+        :param messages_ttl: TTL (seconds) of messages page entries.
+        :param maxsize: Max amount of entries per internal cache.
+        """
+        self._conversations: TTLCache[str, Dict[str, Any]] = TTLCache(
+            maxsize=maxsize, ttl=conversation_ttl
+        )
+        self._messages: TTLCache[str, List[Dict[str, Any]]] = TTLCache(
+            maxsize=maxsize, ttl=messages_ttl
+        )
+        # message_id -> conversation_id, used to invalidate a page by a message id only
+        self._message_index: TTLCache[str, str] = TTLCache(maxsize=maxsize * 10, ttl=messages_ttl)
+
+    def get_conversation(self, conversation_id: UUID | str) -> Optional[Dict[str, Any]]:
+        return self._conversations.get(str(conversation_id))
+
+    def set_conversation(self, conversation_id: UUID | str, conversation: Dict[str, Any]) -> None:
+        self._conversations.set(str(conversation_id), conversation)
+
+    def get_messages(self, conversation_id: UUID | str) -> Optional[List[Dict[str, Any]]]:
+        return self._messages.get(str(conversation_id))
+
+    def set_messages(self, conversation_id: UUID | str, messages: List[Dict[str, Any]]) -> None:
+        conversation_key = str(conversation_id)
+        self._messages.set(conversation_key, messages)
+        for message in messages:
+            message_id = message.get("id") if isinstance(message, dict) else None
+            if message_id is not None:
+                self._message_index.set(str(message_id), conversation_key)
+
+    def invalidate_messages(self, conversation_id: UUID | str) -> None:
+        self._messages.pop(str(conversation_id))
+
+    def invalidate_message(self, message_id: UUID | str) -> None:
+        """
+        Drops the cached messages page that contains the given message (if it is known).
+        """
+        conversation_id = self._message_index.pop(str(message_id))
+        if conversation_id is not None:
+            self.invalidate_messages(conversation_id)
+
+    def invalidate_conversation(self, conversation_id: UUID | str) -> None:
+        self._conversations.pop(str(conversation_id))
+        self.invalidate_messages(conversation_id)
+
+    def clear(self) -> None:
+        self._conversations.clear()
+        self._messages.clear()
+        self._message_index.clear()
+
+
+# Shared between requests: ChatMicroserviceClient is created per request by the dependency.
+conversation_cache = ConversationCache(
+    conversation_ttl=settings.chat_conversation_cache_ttl,
+    messages_ttl=settings.chat_messages_cache_ttl,
+    maxsize=settings.chat_cache_maxsize,
+)
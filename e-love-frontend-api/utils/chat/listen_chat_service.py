@@ -1,17 +1,31 @@
 import json
+from typing import Optional
 
 import aiohttp
 from fastapi import WebSocket
 
+from utils.chat.conversation_cache import conversation_cache
+
 
 async def listen_chat_service(
-    chat_service_ws: aiohttp.ClientWebSocketResponse, client_ws: WebSocket
+    chat_service_ws: aiohttp.ClientWebSocketResponse,
+    client_ws: WebSocket,
+    conversation_id: Optional[str] = None,
 ):
     """
     Reads messages (as JSON) from Chat-Microservice WebSocket
     and forwards them to the client (Frontend) as JSON.
+
+    If conversation_id is passed, the cached messages page of this conversation
+    is invalidated on every relayed frame (new message from the other side, delete, etc.).
     """
     async for msg in chat_service_ws:
+        if conversation_id is not None and msg.type in (
+            aiohttp.WSMsgType.TEXT,
+            aiohttp.WSMsgType.BINARY,
+        ):
+            conversation_cache.invalidate_messages(conversation_id)
+
         if msg.type == aiohttp.WSMsgType.TEXT:
             raw_text = msg.data  # это str
             try:
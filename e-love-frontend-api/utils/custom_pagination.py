@@ -1,30 +1,63 @@
-import base64
-import json
+import asyncio
+import logging
 import uuid
 from datetime import datetime
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, Type, TypeVar
 
-from sqlalchemy import asc
+from sqlalchemy import DateTime, and_, or_, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import Select
 
+from configuration.config import settings
+from configuration.database import session_router, session_scope
+from core.db.types.uuid_key import UUIDKey
+from utils.cache.ttl_cache import TTLCache
+from utils.enums.sort_direction import SortDirection
+from utils.pagination_token import decode_cursor_token, encode_cursor_token
+
 T = TypeVar("T")
 
+# Ключ сортировки: колонка модели или выражение запроса (например, label со скором) и направление
+SortKey = Tuple[Any, SortDirection]
+
+logger = logging.getLogger(__name__)
+
+# Заранее загруженные следующие страницы: (scope, next_token, limit) -> ответ paginate_query.
+# Короткий TTL: страница, пока клиент рендерит текущую, а не кэш выдачи
+page_prefetch_cache: TTLCache[Tuple[Any, ...], Dict[str, Any]] = TTLCache(
+    maxsize=settings.pagination_prefetch_maxsize, ttl=settings.pagination_prefetch_ttl
+)
+_prefetch_in_flight: Dict[Tuple[Any, ...], asyncio.Task] = {}
+
 
 class Paginator(Generic[T]):
     """
-    Обобщенный класс пагинатора, который реализует пагинацию на основе курсора для моделей SQLAlchemy ORM.
+    Обобщенный класс пагинатора, который реализует пагинацию на основе курсора (keyset) для моделей SQLAlchemy ORM.
+
+    Порядок страницы задаётся упорядоченным списком ключей сортировки (колонка, направление).
+    По умолчанию это ('created_at', 'id') по возрастанию. Курсор хранит значения всех ключей
+    последнего элемента страницы, а следующая страница выбирается условием "строго после курсора"
+    по тем же ключам, поэтому при наличии индекса по ключам это диапазонное сканирование индекса.
 
-    Этот пагинатор предназначен для работы с асинхронными сессиями SQLAlchemy и моделями,
-    которые имеют поля 'created_at' и 'id'. Он использует эти поля для генерации и декодирования курсоров пагинации.
+    Последним ключом всегда идёт 'id' модели (добавляется автоматически), чтобы порядок был полным
+    и строки с одинаковыми значениями остальных ключей не терялись и не повторялись между страницами.
 
     Атрибуты:
         db_session (AsyncSession): Асинхронная сессия SQLAlchemy.
         model (Type[T]): Класс модели SQLAlchemy ORM.
         limit (int): Максимальное количество элементов для возврата на странице.
+        sort_keys (List[SortKey]): Ключи сортировки по умолчанию.
+        bidirectional (bool): Отдавать ли курсор предыдущей страницы (prev_token).
     """
 
-    def __init__(self, db_session: AsyncSession, model: Type[T], limit: int = 10):
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        model: Type[T],
+        limit: int = 10,
+        sort_keys: Optional[Sequence[SortKey]] = None,
+        bidirectional: bool = False,
+    ):
         """
         Инициализирует экземпляр Paginator.
 
@@ -32,48 +65,315 @@ class Paginator(Generic[T]):
             db_session (AsyncSession): Асинхронная сессия SQLAlchemy для использования в запросах.
             model (Type[T]): Класс модели SQLAlchemy ORM для пагинации.
             limit (int, optional): Максимальное количество элементов для возврата на странице. По умолчанию 10.
+            sort_keys (Optional[Sequence[SortKey]], optional): Ключи сортировки (колонка, направление).
+                По умолчанию ('created_at', 'id') по возрастанию.
+            bidirectional (bool, optional): Добавлять в ответ has_prev/prev_token (схема ответа
+                списка должна их содержать). По умолчанию False.
         """
         self.db_session = db_session
         self.model = model
         self.limit = limit
+        self.sort_keys = self.normalize_sort_keys(sort_keys)
+        self.bidirectional = bidirectional
+
+    def normalize_sort_keys(self, sort_keys: Optional[Sequence[SortKey]]) -> List[SortKey]:
+        """
+        Приводит ключи сортировки к списку (колонка, SortDirection) с 'id' модели в конце.
+
+        Аргументы:
+            sort_keys (Optional[Sequence[SortKey]]): Ключи сортировки или None для ключей по умолчанию.
+
+        Возвращает:
+            List[SortKey]: Полный список ключей сортировки.
+        """
+        if not sort_keys:
+            return [(self.model.created_at, SortDirection.ASC), (self.model.id, SortDirection.ASC)]
+
+        keys = [(column, SortDirection(direction)) for column, direction in sort_keys]
+        if not any(column is self.model.id for column, _ in keys):
+            keys.append((self.model.id, keys[-1][1]))
+        return keys
+
+    def encode_cursor(self, values: Sequence[Any]) -> str:
+        """
+        Кодирует значения ключей сортировки последнего элемента в курсор.
+
+        Формат - компактный бинарный токен (см. utils.pagination_token), подписанный HMAC,
+        если задан PAGINATION_TOKEN_SECRET.
+
+        Аргументы:
+            values (Sequence[Any]): Значения ключей в порядке ключей сортировки.
+
+        Возвращает:
+            str: Курсор пагинации.
+        """
+        return encode_cursor_token(values)
+
+    def decode_cursor(self, token: str) -> List[Any]:
+        """
+        Декодирует курсор в список значений ключей (без приведения к типам колонок).
+
+        Понимает и старые base64-JSON токены, пока включён PAGINATION_ACCEPT_LEGACY_TOKENS.
+
+        Аргументы:
+            token (str): Курсор пагинации.
+
+        Возвращает:
+            List[Any]: Значения ключей.
+
+        Вызывает:
+            ValueError: Если токен недействителен, подделан или не может быть декодирован.
+        """
+        return decode_cursor_token(token)
 
     def encode_token(self, last_created_at: str, last_id: str) -> str:
         """
-        Кодирует курсор пагинации в строку base64.
+        Кодирует курсор пагинации по ключам по умолчанию ('created_at', 'id').
 
         Аргументы:
             last_created_at (str): Строка даты и времени в формате ISO поля 'created_at' последнего элемента.
             last_id (str): Строковое представление поля 'id' последнего элемента.
 
         Возвращает:
-            str: Строка, закодированная в base64, представляющая курсор пагинации.
+            str: Курсор пагинации.
         """
-        token_dict = {"created_at": last_created_at, "id": last_id}
-        token_str = json.dumps(token_dict)
-        token_bytes = token_str.encode("utf-8")
-        encoded_token = base64.urlsafe_b64encode(token_bytes).decode("utf-8")
-        return encoded_token
+        return self.encode_cursor([datetime.fromisoformat(last_created_at), last_id])
 
     def decode_token(self, token: str) -> Dict[str, str]:
         """
-        Декодирует курсор пагинации из строки base64.
+        Декодирует курсор пагинации по ключам по умолчанию ('created_at', 'id').
 
         Аргументы:
-            token (str): Строка, закодированная в base64, представляющая курсор пагинации.
+            token (str): Курсор пагинации (бинарный или старый base64-JSON).
 
         Возвращает:
-            Dict[str, str]: Словарь, содержащий ключи 'created_at' и 'id' с их значениями.
+            Dict[str, str]: Словарь, содержащий ключи 'created_at' (ISO) и 'id' с их значениями.
 
         Вызывает:
             ValueError: Если токен недействителен или не может быть декодирован.
         """
+        values = self.decode_cursor(token)
+        if len(values) != 2:
+            raise ValueError("Invalid token")
+        created_at, object_id = values
+        if isinstance(created_at, datetime):
+            created_at = created_at.isoformat()
+        return {"created_at": created_at, "id": str(object_id)}
+
+    def _cursor_values(self, token: str, sort_keys: List[SortKey]) -> List[Any]:
+        """
+        Значения курсора, приведённые к типам ключей (datetime для DateTime, каноничный UUID для id).
+        Бинарный токен уже содержит datetime/UUID, разбираются только строки старого формата.
+        """
+        values = self.decode_cursor(token)
+        if len(values) != len(sort_keys):
+            raise ValueError("Invalid token")
+
+        cursor_values = []
         try:
-            token_bytes = base64.urlsafe_b64decode(token.encode("utf-8"))
-            token_str = token_bytes.decode("utf-8")
-            token_dict = json.loads(token_str)
-            return token_dict
-        except Exception:
+            for (column, _), value in zip(sort_keys, values):
+                if isinstance(value, uuid.UUID):
+                    # id в запросах - строки; в VARCHAR(36)/BINARY(16) их приводит тип колонки (UUIDKey)
+                    value = str(value)
+                elif isinstance(value, str) and isinstance(column.type, DateTime):
+                    value = datetime.fromisoformat(value)
+                elif isinstance(value, str) and isinstance(column.type, UUIDKey):
+                    value = str(uuid.UUID(value))
+                cursor_values.append(value)
+        except (TypeError, ValueError):
             raise ValueError("Invalid token")
+        return cursor_values
+
+    @staticmethod
+    def seek_predicate(sort_keys: List[SortKey], values: List[Any]) -> Any:
+        """
+        Условие "строго после курсора" для заданного порядка.
+
+        При одинаковом направлении всех ключей это сравнение row value
+        ((k1, k2, ...) > (v1, v2, ...) или <), которое оптимизатор превращает в диапазон индекса.
+        При смешанных направлениях - эквивалентная цепочка
+        k1 >/< v1 OR (k1 = v1 AND k2 >/< v2) OR ...
+
+        Аргументы:
+            sort_keys (List[SortKey]): Ключи сортировки.
+            values (List[Any]): Значения ключей последнего элемента предыдущей страницы.
+
+        Возвращает:
+            Условие для WHERE.
+        """
+        columns = [column for column, _ in sort_keys]
+        directions = {direction for _, direction in sort_keys}
+
+        if len(directions) == 1:
+            if len(columns) == 1:
+                left, right = columns[0], values[0]
+            else:
+                # Типы значений берутся у колонок кортежа (UUIDKey и т.п.)
+                left, right = tuple_(*columns), tuple(values)
+            return left > right if directions.pop() == SortDirection.ASC else left < right
+
+        conditions = []
+        for index, (column, direction) in enumerate(sort_keys):
+            after = (
+                column > values[index] if direction == SortDirection.ASC else column < values[index]
+            )
+            equal_prefix = [columns[i] == values[i] for i in range(index)]
+            conditions.append(and_(*equal_prefix, after))
+        return or_(*conditions)
+
+    def build_query(
+        self,
+        base_query: Select,
+        next_token: Optional[str] = None,
+        filters: Optional[Any] = None,
+        order_by: Optional[Sequence[SortKey]] = None,
+        prev_token: Optional[str] = None,
+    ) -> Select:
+        """
+        Строит запрос одной страницы (фильтры, условие курсора, сортировка, limit + 1) без выполнения.
+
+        Сортировка base_query заменяется сортировкой по ключам, а значения ключей добавляются
+        в конец списка колонок - из них paginate_query строит курсоры. Страница назад (prev_token)
+        выбирается тем же диапазоном индекса в обратную сторону: ключи с обратными направлениями,
+        строки затем разворачиваются.
+
+        Используется paginate_query и скриптом проверки планов запросов (EXPLAIN).
+
+        Аргументы:
+            base_query (Select): Базовый запрос SQLAlchemy для пагинации.
+            next_token (Optional[str], optional): Курсор пагинации с предыдущей страницы. По умолчанию None.
+            filters (Optional[Any], optional): Дополнительные фильтры для применения к запросу. По умолчанию None.
+            order_by (Optional[Sequence[SortKey]], optional): Ключи сортировки (колонка, направление)
+                вместо ключей пагинатора. По умолчанию None.
+            prev_token (Optional[str], optional): Курсор первого элемента текущей страницы - выбрать
+                страницу перед ним. Нельзя передавать вместе с next_token. По умолчанию None.
+
+        Возвращает:
+            Select: Запрос страницы.
+
+        Вызывает:
+            ValueError: Если курсор недействителен или переданы оба курсора.
+        """
+        sort_keys = self.normalize_sort_keys(order_by) if order_by else self.sort_keys
+        return self._build_page_query(
+            base_query, sort_keys, filters, next_token, prev_token, self.limit
+        )
+
+    def _build_page_query(
+        self,
+        base_query: Select,
+        sort_keys: List[SortKey],
+        filters: Optional[Any],
+        next_token: Optional[str],
+        prev_token: Optional[str],
+        limit: Optional[int],
+    ) -> Select:
+        if next_token and prev_token:
+            raise ValueError("Only one of next_token and prev_token can be passed")
+
+        token = next_token or prev_token
+        if prev_token:
+            sort_keys = [
+                (
+                    column,
+                    SortDirection.DESC if direction == SortDirection.ASC else SortDirection.ASC,
+                )
+                for column, direction in sort_keys
+            ]
+
+        query = base_query
+
+        # Применяем дополнительные фильтры, если они есть
+        if filters is not None:
+            query = query.where(filters)
+
+        # Применяем пагинацию на основе курсора
+        if token:
+            query = query.where(
+                self.seek_predicate(sort_keys, self._cursor_values(token, sort_keys))
+            )
+
+        query = query.order_by(None).order_by(
+            *(
+                column.asc() if direction == SortDirection.ASC else column.desc()
+                for column, direction in sort_keys
+            )
+        )
+        query = query.add_columns(*(column for column, _ in sort_keys))
+
+        if limit is None:
+            return query
+
+        # Запрашиваем на один элемент больше, чтобы определить, есть ли ещё страница
+        return query.limit(limit + 1)
+
+    async def _fetch_page(
+        self,
+        db_session: AsyncSession,
+        base_query: Select,
+        sort_keys: List[SortKey],
+        filters: Optional[Any],
+        next_token: Optional[str],
+        prev_token: Optional[str],
+        model_name: str,
+        limit: Optional[int],
+    ) -> Dict[str, Any]:
+        query = self._build_page_query(
+            base_query, sort_keys, filters, next_token, prev_token, limit
+        )
+        result = await db_session.execute(query)
+        rows = result.all()
+
+        # Лишний элемент только показывает, что в направлении выборки есть ещё страница
+        has_more = limit is not None and len(rows) > limit
+        if has_more:
+            rows = rows[:limit]
+
+        if prev_token:
+            rows.reverse()
+            has_next, has_prev = True, has_more
+        else:
+            has_next, has_prev = has_more, next_token is not None
+
+        # Значения ключей - последние колонки строки (см. build_query)
+        next_token_value = None
+        prev_token_value = None
+        if rows and has_next:
+            next_token_value = self.encode_cursor(list(rows[-1][-len(sort_keys) :]))
+        if rows and has_prev:
+            prev_token_value = self.encode_cursor(list(rows[0][-len(sort_keys) :]))
+
+        response = {
+            model_name: [row[0] for row in rows],
+            "has_next": has_next and next_token_value is not None,
+            "next_token": next_token_value,
+        }
+        if self.bidirectional:
+            response["has_prev"] = prev_token_value is not None
+            response["prev_token"] = prev_token_value
+
+        return response
+
+    def _schedule_prefetch(self, cache_key: Tuple[Any, ...], fetch_args: Tuple[Any, ...]) -> None:
+        """
+        Запускает фоновую загрузку следующей страницы в page_prefetch_cache
+        (своя сессия: сессия запроса к этому моменту уже может быть закрыта).
+        """
+        if cache_key in _prefetch_in_flight or cache_key in page_prefetch_cache:
+            return
+
+        async def prefetch() -> None:
+            try:
+                session_factory = session_router.get_session_factory(read_only=True)
+                async with session_scope(session_factory) as session:
+                    page = await self._fetch_page(session, *fetch_args)
+                page_prefetch_cache.set(cache_key, page)
+            except Exception as e:
+                logger.error(f"Page prefetch failed for {cache_key[0]}: {e}")
+
+        task = asyncio.create_task(prefetch())
+        _prefetch_in_flight[cache_key] = task
+        task.add_done_callback(lambda _: _prefetch_in_flight.pop(cache_key, None))
 
     # TODO: зарефакторить, слишком много информации для чтения глазами. Разбить на отдельные функции по SOLID-принципам.
     async def paginate_query(
@@ -81,9 +381,11 @@ class Paginator(Generic[T]):
         base_query: Select,
         next_token: Optional[str] = None,
         filters: Optional[Any] = None,
-        order_by: Optional[List[Any]] = None,
+        order_by: Optional[Sequence[SortKey]] = None,
         model_name: str = "items",
         limit: Optional[int] = None,
+        prev_token: Optional[str] = None,
+        prefetch_scope: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Выполняет пагинацию указанного запроса SQLAlchemy с использованием пагинации на основе курсора.
@@ -92,75 +394,116 @@ class Paginator(Generic[T]):
             base_query (Select): Базовый запрос SQLAlchemy для пагинации.
             next_token (Optional[str], optional): Курсор пагинации с предыдущей страницы. По умолчанию None.
             filters (Optional[Any], optional): Дополнительные фильтры для применения к запросу. По умолчанию None.
-            order_by (Optional[List[Any]], optional): Пользовательская сортировка для запроса. По умолчанию None.
+            order_by (Optional[Sequence[SortKey]], optional): Ключи сортировки (колонка, направление)
+                вместо ключей пагинатора, например [(score_label, SortDirection.DESC)]. По умолчанию None.
             model_name (str, optional): Имя ключа для списка элементов в ответе. По умолчанию "items".
             limit (Optional[int], optional): Максимальное количество элементов для возврата на странице. Если указано, переопределяет limit экземпляра. По умолчанию None.
+            prev_token (Optional[str], optional): Курсор для страницы назад (prev_token из ответа). По умолчанию None.
+            prefetch_scope (Optional[str], optional): Имя списка (с фильтрами, от которых зависит выдача,
+                например f"user_images:{user_id}"). Если задано и включён PAGINATION_PREFETCH_ENABLED,
+                следующая страница заранее загружается в кэш по ключу (scope, next_token, limit),
+                и запрос с этим next_token отдаётся из памяти. По умолчанию None.
 
         Возвращает:
             Dict[str, Any]: Словарь, содержащий:
                 - model_name (List[T]): Список элементов для текущей страницы.
                 - "has_next" (bool): Флаг, указывающий, есть ли следующая страница.
                 - "next_token" (Optional[str]): Курсор пагинации для следующей страницы или None, если страниц больше нет.
+                - "has_prev", "prev_token": То же для предыдущей страницы (только у bidirectional-пагинатора).
 
         Вызывает:
-            ValueError: Если предоставленный next_token недействителен.
+            ValueError: Если курсор недействителен или переданы оба курсора.
         """
         if limit is not None:
             self.limit = limit
 
-        query = base_query
+        sort_keys = self.normalize_sort_keys(order_by) if order_by else self.sort_keys
+        prefetch = prefetch_scope is not None and settings.pagination_prefetch_enabled
+
+        response = None
+        if prefetch and next_token:
+            response = page_prefetch_cache.get((prefetch_scope, next_token, self.limit))
+
+        if response is None:
+            response = await self._fetch_page(
+                self.db_session,
+                base_query,
+                sort_keys,
+                filters,
+                next_token,
+                prev_token,
+                model_name,
+                self.limit,
+            )
 
-        # Применяем дополнительные фильтры, если они есть
-        if filters is not None:
-            query = query.where(filters)
+        if prefetch and response["next_token"]:
+            self._schedule_prefetch(
+                (prefetch_scope, response["next_token"], self.limit),
+                (
+                    base_query,
+                    sort_keys,
+                    filters,
+                    response["next_token"],
+                    None,
+                    model_name,
+                    self.limit,
+                ),
+            )
 
-        # Применяем пагинацию на основе курсора, если предоставлен next_token
-        if next_token:
-            token_data = self.decode_token(next_token)
-            last_created_at = datetime.fromisoformat(token_data["created_at"])
-            last_id = uuid.UUID(token_data["id"])
+        return response
 
-            # Фильтруем запрос для получения элементов после позиции курсора
-            query = query.where(
-                (self.model.created_at > last_created_at)
-                | ((self.model.created_at == last_created_at) & (self.model.id > last_id))
-            )
+    def paginate_items(
+        self,
+        items: List[T],
+        next_token: Optional[str] = None,
+        model_name: str = "items",
+        limit: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Пагинация уже загруженного в память списка с тем же форматом курсора, что и paginate_query.
 
-        # Применяем сортировку к запросу
-        if order_by is not None:
-            query = query.order_by(*order_by)
-        else:
-            # Сортировка по умолчанию: по возрастанию 'created_at' и 'id'
-            query = query.order_by(asc(self.model.created_at), asc(self.model.id))
+        Используется для закэшированных справочников: ответ и токены совпадают с пагинацией по БД,
+        поэтому клиенту всё равно, откуда пришла страница.
 
-        # Запрашиваем на один элемент больше, чтобы определить, есть ли следующая страница
-        query = query.limit(self.limit + 1)
+        Аргументы:
+            items (List[T]): Элементы, отсортированные по возрастанию ('created_at', 'id').
+            next_token (Optional[str], optional): Курсор пагинации с предыдущей страницы. По умолчанию None.
+            model_name (str, optional): Имя ключа для списка элементов в ответе. По умолчанию "items".
+            limit (Optional[int], optional): Максимальное количество элементов на странице. По умолчанию None.
 
-        result = await self.db_session.execute(query)
-        items = result.scalars().all()
+        Возвращает:
+            Dict[str, Any]: Словарь того же вида, что и у paginate_query.
 
-        # Определяем, есть ли следующая страница
-        has_next = len(items) > self.limit
-        if has_next:
-            # Убираем лишний элемент, используемый для проверки наличия следующей страницы
-            items = items[: self.limit]
+        Вызывает:
+            ValueError: Если предоставленный next_token недействителен.
+        """
+        if limit is not None:
+            self.limit = limit
+
+        start_index = 0
+        if next_token:
+            cursor = tuple(self._cursor_values(next_token, self.normalize_sort_keys(None)))
+            # Первый элемент, который идёт строго после курсора
+            start_index = len(items)
+            for index, item in enumerate(items):
+                if (item.created_at, str(item.id)) > cursor:
+                    start_index = index
+                    break
+
+        page_items = items[start_index : start_index + self.limit]
+        has_next = start_index + self.limit < len(items)
 
-        # Генерируем next_token, если есть следующая страница
         next_token_value = None
         if has_next:
-            last_item = items[-1]
-            last_created_at_str = last_item.created_at.isoformat()
-            last_item_id = str(last_item.id)
-            next_token_value = self.encode_token(last_created_at_str, last_item_id)
+            last_item = page_items[-1]
+            next_token_value = self.encode_cursor([last_item.created_at, str(last_item.id)])
 
-        response = {
-            model_name: items,
+        return {
+            model_name: page_items,
             "has_next": has_next,
             "next_token": next_token_value,
         }
 
-        return response
-
     # TODO: refactor - chatGPT generated code!
     # def in_memory_paginate(items: list[dict], next_token: Optional[str], limit: int) -> dict:
     #     """
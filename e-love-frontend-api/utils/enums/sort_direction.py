@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class SortDirection(str, Enum):
+    ASC = "asc"
+    DESC = "desc"
@@ -0,0 +1,99 @@
+# utils/functions/link_table.py
+
+from typing import Iterable, Optional, Union
+from uuid import UUID
+
+from sqlalchemy import Table, delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.services.base_service import unique_ids
+
+
+async def insert_links(
+    db_session: AsyncSession,
+    table: Table,
+    owner_column: str,
+    owner_id: Union[UUID, str],
+    target_column: str,
+    target_ids: Iterable[Union[UUID, str]],
+) -> int:
+    """
+    Добавляет связи в промежуточную таблицу одним multi-row INSERT IGNORE.
+    Уже существующие связи пропускаются базой данных, коллекция на ORM-объекте не загружается.
+
+    Параметры:
+        - db_session: Асинхронная сессия базы данных.
+        - table: Промежуточная таблица (например, user_categories_table).
+        - owner_column: Колонка владельца связи (например, "user_id").
+        - owner_id: Идентификатор владельца.
+        - target_column: Колонка связанной сущности (например, "category_id").
+        - target_ids: Идентификаторы связанных сущностей.
+
+    Возвращает:
+        - int: Количество реально добавленных связей.
+    """
+    ids = unique_ids(target_ids)
+    if not ids:
+        return 0
+
+    statement = (
+        insert(table)
+        .prefix_with("IGNORE", dialect="mysql")
+        .prefix_with("OR IGNORE", dialect="sqlite")
+        .values([{owner_column: str(owner_id), target_column: target_id} for target_id in ids])
+    )
+    result = await db_session.execute(statement)
+    return result.rowcount
+
+
+async def delete_links(
+    db_session: AsyncSession,
+    table: Table,
+    owner_column: str,
+    owner_id: Union[UUID, str],
+    target_column: str,
+    target_ids: Optional[Iterable[Union[UUID, str]]] = None,
+    keep_ids: Optional[Iterable[Union[UUID, str]]] = None,
+) -> int:
+    """
+    Удаляет связи владельца одним DELETE ... WHERE IN.
+
+    Параметры:
+        - target_ids: Удалить только эти связи.
+        - keep_ids: Удалить все связи, кроме этих (NOT IN). Пустой список - удалить все связи владельца.
+        Остальные параметры - как у insert_links.
+
+    Возвращает:
+        - int: Количество удалённых связей.
+    """
+    statement = delete(table).where(table.c[owner_column] == str(owner_id))
+
+    if target_ids is not None:
+        ids = unique_ids(target_ids)
+        if not ids:
+            return 0
+        statement = statement.where(table.c[target_column].in_(ids))
+    elif keep_ids is not None:
+        ids = unique_ids(keep_ids)
+        if ids:
+            statement = statement.where(table.c[target_column].not_in(ids))
+
+    result = await db_session.execute(statement)
+    return result.rowcount
+
+
+async def replace_links(
+    db_session: AsyncSession,
+    table: Table,
+    owner_column: str,
+    owner_id: Union[UUID, str],
+    target_column: str,
+    target_ids: Iterable[Union[UUID, str]],
+) -> None:
+    """
+    Приводит набор связей владельца к `target_ids` ровно двумя запросами, независимо от размера:
+    DELETE всех связей вне нового набора и INSERT IGNORE всего нового набора.
+    """
+    ids = unique_ids(target_ids)
+    await delete_links(db_session, table, owner_column, owner_id, target_column, keep_ids=ids)
+    await insert_links(db_session, table, owner_column, owner_id, target_column, ids)
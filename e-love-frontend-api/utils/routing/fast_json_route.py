@@ -0,0 +1,70 @@
+# utils/routing/fast_json_route.py
+
+import functools
+import inspect
+from typing import Any, Callable, Coroutine
+
+from fastapi import Response
+from fastapi.exceptions import ResponseValidationError
+from fastapi.routing import APIRoute
+from pydantic import TypeAdapter, ValidationError
+
+from configuration.config import settings
+
+
+class FastJSONRoute(APIRoute):
+    """
+    Класс маршрута с быстрым путём сериализации ответа.
+
+    Стандартный APIRoute валидирует результат эндпоинта через ModelField, превращает его в
+    dict (mode="json") и сериализует стандартным json.dumps в JSONResponse. Здесь:
+    - TypeAdapter для response_model строится один раз при регистрации маршрута;
+    - результат (ORM-объекты или row mappings) валидируется с from_attributes=True;
+    - ответ сразу собирается в байты через pydantic-core (TypeAdapter.dump_json)
+      и отдаётся готовым Response - повторная обработка в FastAPI не выполняется.
+
+    Подключается на уровне роутера: APIRouter(prefix=..., route_class=FastJSONRoute).
+    Маршруты без response_model, синхронные эндпоинты и маршруты с response_model_include /
+    response_model_exclude обрабатываются стандартным APIRoute. Отключается глобально
+    через FAST_JSON_RESPONSES=false (например, для замера "до").
+    """
+
+    def get_route_handler(self) -> Callable[[Any], Coroutine[Any, Any, Response]]:
+        if self._fast_path_supported():
+            self.dependant.call = self._wrap_endpoint(self.dependant.call)
+        return super().get_route_handler()
+
+    def _fast_path_supported(self) -> bool:
+        return (
+            settings.fast_json_responses
+            and self.response_model is not None
+            and self.response_model_include is None
+            and self.response_model_exclude is None
+            and inspect.iscoroutinefunction(self.dependant.call)
+        )
+
+    def _wrap_endpoint(self, endpoint: Callable[..., Any]) -> Callable[..., Any]:
+        adapter = TypeAdapter(self.response_model)
+        status_code = self.status_code or 200
+        dump_options = {
+            "by_alias": self.response_model_by_alias,
+            "exclude_unset": self.response_model_exclude_unset,
+            "exclude_defaults": self.response_model_exclude_defaults,
+            "exclude_none": self.response_model_exclude_none,
+        }
+
+        @functools.wraps(endpoint)
+        async def fast_json_endpoint(*args: Any, **kwargs: Any) -> Any:
+            result = await endpoint(*args, **kwargs)
+            if isinstance(result, Response):
+                return result
+
+            try:
+                validated = adapter.validate_python(result, from_attributes=True)
+            except ValidationError as e:
+                raise ResponseValidationError(errors=e.errors(include_url=False), body=result)
+
+            content = adapter.dump_json(validated, **dump_options)
+            return Response(content=content, status_code=status_code, media_type="application/json")
+
+        return fast_json_endpoint